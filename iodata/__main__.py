@@ -65,6 +65,17 @@ dump_many
 )
 
 
+def parse_frames(text: str) -> slice:
+    """Parse a slice of frames given on the command line."""
+    words = text.split(":")
+    if len(words) not in (2, 3):
+        raise argparse.ArgumentTypeError(f"Expecting START:STOP[:STEP], got '{text}'.")
+    try:
+        return slice(*(int(word) if word.strip() else None for word in words))
+    except ValueError as exc:
+        raise argparse.ArgumentTypeError(f"Cannot interpret the frames '{text}'.") from exc
+
+
 def parse_args():
     """Use argparse to to parse command-line arguments."""
     parser = argparse.ArgumentParser(
@@ -99,6 +110,14 @@ def parse_args():
         action="store_true",
         help="Convert many frames, e.g. for trajectories.",
     )
+    parser.add_argument(
+        "-f",
+        "--frames",
+        type=parse_frames,
+        help="Convert a slice of the frames, given as START:STOP or START:STOP:STEP. "
+        "Each field may be omitted, e.g. ::10 selects every tenth frame. "
+        "This implies --many.",
+    )
     parser.add_argument("input", help="The input file.")
     parser.add_argument("output", help="The output file.")
     return parser.parse_args()
@@ -111,6 +130,7 @@ def convert(
     infmt: Optional[str] = None,
     outfmt: Optional[str] = None,
     allow_changes: bool = False,
+    frames: Optional[slice] = None,
 ):
     """Convert file from one format to another.
 
@@ -129,10 +149,20 @@ def convert(
     allow_changes
         Allow prepare_dump functions to modify the data
         to make it compatible with the output format.
+    frames
+        When given, only this slice of the frames is converted.
+        Frames outside the slice are skipped without parsing them, if the input format
+        supports this. This implies ``many=True``.
 
     """
-    if many:
-        dump_many(load_many(infn, fmt=infmt), outfn, allow_changes=allow_changes, fmt=outfmt)
+    if many or frames is not None:
+        kwargs = {}
+        if frames is not None:
+            kwargs["start"] = 0 if frames.start is None else frames.start
+            kwargs["stop"] = frames.stop
+            kwargs["step"] = 1 if frames.step is None else frames.step
+        datas = load_many(infn, fmt=infmt, **kwargs)
+        dump_many(datas, outfn, allow_changes=allow_changes, fmt=outfmt)
     else:
         dump_one(load_one(infn, fmt=infmt), outfn, allow_changes=allow_changes, fmt=outfmt)
 
@@ -143,7 +173,15 @@ def main():
     np.seterr(divide="raise", over="raise", invalid="raise")
 
     args = parse_args()
-    convert(args.input, args.output, args.many, args.infmt, args.outfmt, args.allow_changes)
+    convert(
+        args.input,
+        args.output,
+        args.many,
+        args.infmt,
+        args.outfmt,
+        args.allow_changes,
+        args.frames,
+    )
 
 
 if __name__ == "__main__":
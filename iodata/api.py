@@ -23,6 +23,7 @@ import warnings
 from collections.abc import Iterable, Iterator
 from fnmatch import fnmatch
 from importlib import import_module
+from itertools import count, islice
 from pkgutil import iter_modules
 from types import ModuleType
 from typing import Callable, Optional
@@ -190,7 +191,15 @@ def load_one(filename: str, *, fmt: Optional[str] = None, **kwargs) -> IOData:
 
 
 @_reissue_warnings
-def load_many(filename: str, *, fmt: Optional[str] = None, **kwargs) -> Iterator[IOData]:
+def load_many(
+    filename: str,
+    *,
+    fmt: Optional[str] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+    step: int = 1,
+    **kwargs,
+) -> Iterator[IOData]:
     """Load multiple IOData instances from a file.
 
     This function uses the extension or prefix of the filename to determine the
@@ -204,6 +213,11 @@ def load_many(filename: str, *, fmt: Optional[str] = None, **kwargs) -> Iterator
     fmt
         The name of the file format module to use. When not given, it is guessed
         from the filename.
+    start, stop, step
+        Select a slice of the frames, with the same meaning as in
+        ``itertools.islice``. When the file format supports it, frames outside the
+        slice are skipped without parsing them. When records are also selected
+        with format-specific arguments, the slice applies to the selected records.
     **kwargs
         Keyword arguments are passed on to the format-specific load_many function.
 
@@ -213,10 +227,28 @@ def load_many(filename: str, *, fmt: Optional[str] = None, **kwargs) -> Iterator
         An instance of IOData with data for one frame loaded for the file.
 
     """
+    if start < 0 or (stop is not None and stop < 0) or step < 1:
+        raise ValueError("Frame slices must have non-negative bounds and a positive step.")
     format_module = _select_format_module(filename, "load_many", fmt)
     with LineIterator(filename) as lit:
         try:
-            for data in format_module.load_many(lit, **kwargs):
+            frames = format_module.load_many(lit, **kwargs)
+            if (start, stop, step) != (0, None, 1):
+                skip_frame = getattr(format_module, "skip_frame", None)
+                # Frames cannot be skipped in between frames loaded in parallel,
+                # because the worker processes do not use the line iterator.
+                # When records are selected, one frame may consume several records,
+                # so the slice is then taken from the selected frames.
+                if (
+                    skip_frame is None
+                    or kwargs.get("nworker", 0) > 0
+                    or kwargs.get("where") is not None
+                    or kwargs.get("records") is not None
+                ):
+                    frames = islice(frames, start, stop, step)
+                else:
+                    frames = _skip_frames(lit, frames, skip_frame, start, stop, step)
+            for data in frames:
                 yield IOData(**data)
         except StopIteration:
             return
@@ -226,6 +258,49 @@ def load_many(filename: str, *, fmt: Optional[str] = None, **kwargs) -> Iterator
             raise LoadError("Uncaught exception while loading file.", lit) from exc
 
 
+def _skip_frames(
+    lit: LineIterator,
+    frames: Iterator[dict],
+    skip_frame: Callable,
+    start: int,
+    stop: Optional[int],
+    step: int,
+) -> Iterator[dict]:
+    """Select a slice of frames, skipping the other frames without loading them.
+
+    Parameters
+    ----------
+    lit
+        The line iterator, shared with the frames iterator.
+    frames
+        The iterator returned by the load_many function of a file format.
+        It must not read lines beyond the frame it yields, such that the following
+        frames can be skipped before resuming it.
+    skip_frame
+        The skip_frame function of the file format.
+    start, stop, step
+        The slice of frames to load.
+
+    Yields
+    ------
+    data
+        A dictionary with the data of each selected frame.
+
+    """
+    iframe = 0
+    try:
+        for index in count(start, step):
+            if stop is not None and index >= stop:
+                return
+            while iframe < index:
+                skip_frame(lit)
+                iframe += 1
+            yield next(frames)
+            iframe += 1
+    except StopIteration:
+        return
+
+
 def _check_required(filename: str, data: IOData, dump_func: Callable):
     """Check that required attributes are not None before dumping to a file.
 
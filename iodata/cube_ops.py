@@ -0,0 +1,394 @@
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Out-of-core operations on Gaussian Cube files.
+
+The functions in this module process cube files slab by slab, without loading the
+complete grid into memory. A slab consists of a few consecutive planes of grid points,
+i.e. grid points with the same first index. The memory usage is therefore proportional
+to the slab size and independent of the number of planes in the file.
+
+For example, the difference between two electron densities can be written to a new
+cube file and integrated as follows:
+
+.. code-block:: python
+
+    from iodata.cube_ops import integrate, linear_combination
+
+    linear_combination(["rho1.cube", "rho2.cube"], [1.0, -1.0], "diff.cube")
+    print(integrate("diff.cube"))
+
+"""
+
+import os
+from collections.abc import Iterable, Iterator
+from contextlib import ExitStack
+from typing import Callable, Optional
+
+import attrs
+import numpy as np
+from numpy.typing import NDArray
+
+from .attrutils import validate_shape
+from .formats.cube import (
+    _iter_grid_planes,
+    _read_cube_header,
+    _write_cube_data,
+    _write_cube_header,
+)
+from .utils import LineIterator, LoadError
+
+__all__ = (
+    "CubeHeader",
+    "load_cube_header",
+    "iter_cube_slabs",
+    "reduce",
+    "integrate",
+    "minmax",
+    "dump_cube_slabs",
+    "linear_combination",
+)
+
+
+@attrs.define
+class CubeHeader:
+    """The molecule and the grid specification from the header of a cube file."""
+
+    title: str = attrs.field()
+    """The title on the first line of the cube file."""
+
+    atnums: NDArray[int] = attrs.field(validator=validate_shape(None))
+    """Atomic numbers."""
+
+    atcorenums: NDArray[float] = attrs.field(validator=validate_shape(("atnums", 0)))
+    """Effective core charges."""
+
+    atcoords: NDArray[float] = attrs.field(validator=validate_shape(("atnums", 0), 3))
+    """Cartesian coordinates of the atoms (in atomic units)."""
+
+    origin: NDArray[float] = attrs.field(validator=validate_shape(3))
+    """A 3D vector with the origin of the axes frame."""
+
+    axes: NDArray[float] = attrs.field(validator=validate_shape(3, 3))
+    """Spacing between neighboring grid points along each axis, one axis per row."""
+
+    shape: tuple[int, int, int] = attrs.field(converter=tuple, validator=validate_shape(3))
+    """The number of grid points along each axis."""
+
+    @property
+    def natom(self) -> int:
+        """Return the number of atoms."""
+        return len(self.atnums)
+
+    @property
+    def volume_element(self) -> float:
+        """Return the volume associated with one grid point."""
+        return abs(np.linalg.det(self.axes))
+
+    def is_compatible(self, other: "CubeHeader", atol: float = 1e-6) -> bool:
+        """Check whether another cube file has the same grid.
+
+        Parameters
+        ----------
+        other
+            The header of the other cube file.
+        atol
+            The absolute tolerance on the origin and the axes.
+
+        Returns
+        -------
+        ``True`` when both headers describe the same grid points.
+
+        """
+        return (
+            self.shape == other.shape
+            and np.allclose(self.origin, other.origin, rtol=0, atol=atol)
+            and np.allclose(self.axes, other.axes, rtol=0, atol=atol)
+        )
+
+
+def _load_header(lit: LineIterator) -> CubeHeader:
+    """Load the header of a cube file from a line iterator."""
+    title, atcoords, atnums, _cellvecs, cube, atcorenums = _read_cube_header(lit)
+    if "mo_indices" in cube:
+        raise LoadError("Multi-orbital cube files are not supported.", lit)
+    return CubeHeader(
+        title=title,
+        atnums=atnums,
+        atcorenums=atcorenums,
+        atcoords=atcoords,
+        origin=cube["origin"],
+        axes=cube["axes"],
+        shape=cube["shape"].tolist(),
+    )
+
+
+def load_cube_header(filename: str) -> CubeHeader:
+    """Load only the header of a cube file.
+
+    Parameters
+    ----------
+    filename
+        The cube file to read.
+
+    Returns
+    -------
+    The header of the cube file.
+
+    """
+    with LineIterator(filename) as lit:
+        try:
+            return _load_header(lit)
+        except StopIteration as exc:
+            raise LoadError("File ended before all data was read.", lit) from exc
+
+
+def _iter_slabs(lit: LineIterator, header: CubeHeader, nslab: int) -> Iterator[NDArray[float]]:
+    """Iterate over slabs of the grid data, after the header has been read."""
+    if nslab < 1:
+        raise ValueError("The number of planes in a slab must be strictly positive.")
+    slab = np.zeros((nslab, *header.shape[1:]))
+    islab = 0
+    for _iplane, plane in _iter_grid_planes(lit, header.shape, range(header.shape[0])):
+        slab[islab] = plane
+        islab += 1
+        if islab == nslab:
+            yield slab
+            islab = 0
+    if islab > 0:
+        yield slab[:islab]
+
+
+def iter_cube_slabs(filename: str, nslab: int = 1) -> Iterator[NDArray[float]]:
+    """Iterate over the grid data of a cube file, one slab at a time.
+
+    Parameters
+    ----------
+    filename
+        The cube file to read.
+    nslab
+        The number of planes in one slab. The last slab may contain fewer planes.
+
+    Yields
+    ------
+    slab
+        An array with shape ``(nslab, L, M)``, containing the data of consecutive
+        planes. The same array is reused for the next slab, so make a copy when the
+        data must be kept after the next iteration.
+
+    """
+    with LineIterator(filename) as lit:
+        try:
+            header = _load_header(lit)
+        except StopIteration as exc:
+            raise LoadError("File ended before all data was read.", lit) from exc
+        yield from _iter_slabs(lit, header, nslab)
+
+
+def _iter_zipped_slabs(
+    filenames: list[str], nslab: int
+) -> tuple[CubeHeader, Iterator[tuple[NDArray[float], ...]]]:
+    """Open several cube files on the same grid and zip their slabs.
+
+    Returns
+    -------
+    header
+        The header of the first file.
+    slabs
+        An iterator over tuples with one slab from each file.
+
+    """
+    if len(filenames) == 0:
+        raise ValueError("At least one cube file is needed.")
+    headers = [load_cube_header(filename) for filename in filenames]
+    for filename, header in zip(filenames[1:], headers[1:]):
+        if not headers[0].is_compatible(header):
+            raise LoadError(f"Grid is not consistent with {filenames[0]}.", filename)
+
+    def iter_slabs():
+        with ExitStack() as stack:
+            iters = []
+            for filename, header in zip(filenames, headers):
+                lit = stack.enter_context(LineIterator(filename))
+                _load_header(lit)
+                iters.append(_iter_slabs(lit, header, nslab))
+            yield from zip(*iters)
+
+    return headers[0], iter_slabs()
+
+
+def reduce(
+    filenames: Iterable[str],
+    op: Callable,
+    initial=None,
+    nslab: int = 1,
+):
+    """Reduce the data of one or more cube files on the same grid, slab by slab.
+
+    Parameters
+    ----------
+    filenames
+        The cube files to read. All files must have the same grid.
+    op
+        A function called for each slab as ``op(accumulated, *slabs)``, where
+        ``accumulated`` is the result of the previous call (or ``initial`` for the
+        first slab) and ``slabs`` contains one slab from each file. It must return
+        the new accumulated value.
+    initial
+        The initial accumulated value.
+    nslab
+        The number of planes in one slab.
+
+    Returns
+    -------
+    The accumulated value after the last slab.
+
+    """
+    _header, iter_slabs = _iter_zipped_slabs(list(filenames), nslab)
+    accumulated = initial
+    for slabs in iter_slabs:
+        accumulated = op(accumulated, *slabs)
+    return accumulated
+
+
+def integrate(filename: str, weights: Optional[Callable] = None, nslab: int = 1) -> float:
+    """Integrate the data in a cube file, without loading the complete grid.
+
+    Parameters
+    ----------
+    filename
+        The cube file to integrate.
+    weights
+        An optional function, called as ``weights(slab)``, to transform the data
+        before integration, e.g. ``np.abs`` or ``np.square``.
+    nslab
+        The number of planes in one slab.
+
+    Returns
+    -------
+    The integral, i.e. the sum of all (transformed) values times the volume element.
+
+    """
+    header = load_cube_header(filename)
+
+    def op(total, slab):
+        if weights is not None:
+            slab = weights(slab)
+        return total + slab.sum()
+
+    return reduce([filename], op, 0.0, nslab) * header.volume_element
+
+
+def minmax(filename: str, nslab: int = 1) -> tuple[float, float]:
+    """Compute the minimum and maximum value in a cube file.
+
+    Parameters
+    ----------
+    filename
+        The cube file to read.
+    nslab
+        The number of planes in one slab.
+
+    Returns
+    -------
+    The minimum and maximum value.
+
+    """
+
+    def op(bounds, slab):
+        lower, upper = bounds
+        return min(lower, slab.min()), max(upper, slab.max())
+
+    return reduce([filename], op, (np.inf, -np.inf), nslab)
+
+
+def dump_cube_slabs(filename: str, header: CubeHeader, slabs: Iterable[NDArray[float]]):
+    """Write a cube file from a header and an iterator over slabs.
+
+    Parameters
+    ----------
+    filename
+        The cube file to write.
+    header
+        The header of the cube file.
+    slabs
+        An iterable over arrays with shape ``(n, L, M)``, where the sum of all ``n``
+        must be equal to ``K``, with ``(K, L, M)`` the shape of the grid.
+
+    """
+    nplane = 0
+    with open(filename, "w") as f:
+        _write_cube_header(
+            f, header.title, header.atcoords, header.atnums, header, header.atcorenums
+        )
+        for slab in slabs:
+            if slab.ndim != 3 or slab.shape[1:] != header.shape[1:]:
+                raise ValueError(f"Slab with shape {slab.shape} does not match the grid.")
+            nplane += slab.shape[0]
+            if nplane > header.shape[0]:
+                raise ValueError("The slabs contain more planes than the grid.")
+            _write_cube_data(f, slab, header.shape[2])
+    if nplane != header.shape[0]:
+        raise ValueError("The slabs contain fewer planes than the grid.")
+
+
+def linear_combination(
+    filenames: Iterable[str],
+    coeffs: Iterable[float],
+    out_filename: str,
+    title: Optional[str] = None,
+    nslab: int = 1,
+):
+    """Write a linear combination of cube files on the same grid to a new cube file.
+
+    Parameters
+    ----------
+    filenames
+        The cube files to combine. All files must have the same grid.
+    coeffs
+        The coefficients of the linear combination, one for each file.
+    out_filename
+        The cube file to write. It must be different from all input files.
+        The molecule in the header is taken from the first input file.
+    title
+        The title of the new cube file.
+        When not given, the title of the first file is used.
+    nslab
+        The number of planes in one slab.
+
+    """
+    filenames = list(filenames)
+    coeffs = list(coeffs)
+    if len(filenames) != len(coeffs):
+        raise ValueError("The number of files and coefficients must be equal.")
+    # The output file is truncated before the input files are read.
+    out_path = os.path.realpath(out_filename)
+    if any(os.path.realpath(filename) == out_path for filename in filenames):
+        raise ValueError("The output file must be different from all input files.")
+    header, iter_slabs = _iter_zipped_slabs(filenames, nslab)
+    if title is not None:
+        header.title = title
+
+    def iter_combined():
+        for slabs in iter_slabs:
+            combined = coeffs[0] * slabs[0]
+            for coeff, slab in zip(coeffs[1:], slabs[1:]):
+                combined += coeff * slab
+            yield combined
+
+    dump_cube_slabs(out_filename, header, iter_combined())
@@ -25,12 +25,15 @@ Note that even though the ``CHGCAR`` and ``LOCPOT`` files look very similar, the
 different conversions to atomic units.
 """
 
+from typing import Optional, Union
+
 import numpy as np
 from numpy.typing import NDArray
 
 from ..docstrings import document_load_one
 from ..periodic import sym2num
-from ..utils import Cube, LineIterator, angstrom, volume
+from ..utils import Cube, LineIterator, LoadError, angstrom, volume
+from .cube import GRID_SELECTION_KWDOCS, _read_grid_data, _select_grid_points
 
 __all__ = ()
 
@@ -95,18 +98,60 @@ def _load_vasp_header(
     return title, cellvecs, atnums, atcoords
 
 
-def _load_vasp_grid(lit: LineIterator) -> dict:
+def _skip_to_next_vasp_grid(lit: LineIterator, shape: NDArray[int]) -> bool:
+    """Skip augmentation occupancies and other data until the next grid of the same shape.
+
+    Parameters
+    ----------
+    lit
+        The line iterator, positioned after the end of a grid.
+    shape
+        The shape of the grid that was just read.
+
+    Returns
+    -------
+    ``True`` when the next grid was found, in which case the line iterator is
+    positioned at the start of its data, ``False`` otherwise.
+
+    """
+    shape_words = [str(size) for size in shape]
+    for line in lit:
+        words = line.split()
+        if words[:2] == ["augmentation", "occupancies"]:
+            # Skip the augmentation occupancies of one atom without converting them.
+            nskip = int(words[-1])
+            while nskip > 0:
+                nskip -= len(next(lit).split())
+        elif words == shape_words:
+            return True
+    return False
+
+
+def _load_vasp_grid(
+    lit: LineIterator,
+    region: Optional[tuple[slice, slice, slice]] = None,
+    stride: Optional[Union[int, tuple[int, int, int]]] = None,
+    load_magnetization: bool = False,
+) -> dict:
     """Load grid data file from the VASP 5 file format.
 
     Parameters
     ----------
     lit
         The line iterator to read the data from.
+    region
+        A tuple with three slices, selecting a part of the grid.
+    stride
+        The step between loaded grid points along each axis.
+    load_magnetization
+        When set, the second grid in the file (if present) is loaded as well.
+        For spin-polarized calculations, it contains the magnetization density.
 
     Returns
     -------
     oDictionary containing ``title``, ``atcoords``, ``atnums``, ``cellvecs`` & ``cube``
-    keys and their corresponding values.
+    keys and their corresponding values. When the second grid is loaded, it is stored
+    as a ``Cube`` instance in ``extra["magnetization"]``.
 
     """
     # Load header
@@ -118,31 +163,57 @@ def _load_vasp_grid(lit: LineIterator) -> dict:
         if len(shape) == 3:
             break
 
-    # read data
-    cube_data = np.zeros(shape, float)
-    words = []
-    for i2 in range(shape[2]):
-        for i1 in range(shape[1]):
-            for i0 in range(shape[0]):
-                if not words:
-                    words = next(lit).split()
-                cube_data[i0, i1, i2] = float(words.pop(0))
-
-    cube = Cube(origin=np.zeros(3), axes=cellvecs / shape.reshape(-1, 1), data=cube_data)
-
-    return {
+    # The data are stored with the first index changing fastest,
+    # i.e. the transpose of the cube file layout.
+    try:
+        indices, starts, steps = _select_grid_points(shape, region, stride)
+    except ValueError as exc:
+        raise LoadError(str(exc), lit) from exc
+    axes = cellvecs / shape.reshape(-1, 1)
+    origin = np.dot(starts, axes)
+    axes = axes * steps.reshape(-1, 1)
+    cube_data = _read_grid_data(lit, shape[::-1], indices[::-1], load_magnetization).T
+    result = {
         "title": title,
         "atcoords": atcoords,
         "atnums": atnums,
         "cellvecs": cellvecs,
-        "cube": cube,
+        "cube": Cube(origin=origin, axes=axes, data=cube_data),
     }
 
+    if load_magnetization and _skip_to_next_vasp_grid(lit, shape):
+        mag_data = _read_grid_data(lit, shape[::-1], indices[::-1]).T
+        result["extra"] = {
+            "magnetization": Cube(origin=origin.copy(), axes=axes.copy(), data=mag_data)
+        }
+
+    return result
+
+
+CHGCAR_KWDOCS = {
+    **GRID_SELECTION_KWDOCS,
+    "load_magnetization": "When set to True, the magnetization density of spin-polarized "
+    "calculations is loaded as a Cube instance in extra['magnetization']. "
+    "Augmentation occupancies are skipped without parsing them.",
+}
 
-@document_load_one("VASP 5 CHGCAR", ["atcoords", "atnums", "cellvecs", "cube", "title"])
-def load_one(lit: LineIterator) -> dict:
+
+@document_load_one(
+    "VASP 5 CHGCAR",
+    ["atcoords", "atnums", "cellvecs", "cube", "title"],
+    ["extra"],
+    CHGCAR_KWDOCS,
+)
+def load_one(
+    lit: LineIterator,
+    region: Optional[tuple[slice, slice, slice]] = None,
+    stride: Optional[Union[int, tuple[int, int, int]]] = None,
+    load_magnetization: bool = False,
+) -> dict:
     """Do not edit this docstring. It will be overwritten."""
-    result = _load_vasp_grid(lit)
+    result = _load_vasp_grid(lit, region, stride, load_magnetization)
     # renormalize electron density
     result["cube"].data[:] /= volume(result["cellvecs"])
+    if "extra" in result:
+        result["extra"]["magnetization"].data[:] /= volume(result["cellvecs"])
     return result
@@ -24,16 +24,22 @@ Cube files are generated by various QC codes these days, including
 
 Note that the second column in the geometry specification of the cube file is interpreted
 as the effective core charges.
+
+Cube files with several molecular orbitals, as written by Gaussian, are also supported.
+Such files have a negative number of atoms, followed by a line with the orbital indices
+after the geometry. For each grid point, the values of all orbitals are stored
+consecutively.
 """
 
-from typing import TextIO
+from collections.abc import Iterable, Iterator
+from typing import Optional, TextIO, Union
 
 import numpy as np
 from numpy.typing import NDArray
 
 from ..docstrings import document_dump_one, document_load_one
 from ..iodata import IOData
-from ..utils import Cube, LineIterator
+from ..utils import Cube, LineIterator, LoadError
 
 __all__ = ()
 
@@ -41,6 +47,10 @@ __all__ = ()
 PATTERNS = ["*.cube", "*.cub"]
 
 
+# Number of grid values formatted and written at once by the cube writer.
+CUBE_WRITE_CHUNK = 65536
+
+
 def _read_cube_header(
     lit: LineIterator,
 ) -> tuple[str, NDArray[float], NDArray[int], NDArray[float], dict[str, NDArray], NDArray[float]]:
@@ -54,6 +64,7 @@ def _read_cube_header(
     Returns
     -------
     Tuple with ``title``, ``atcoords``, ``atnums``, ``cellvecs``, ``ugrid`` & ``atcorenums``.
+    For multi-orbital cube files, ``ugrid`` also contains the ``mo_indices``.
 
     """
     # Read the title
@@ -92,6 +103,9 @@ def _read_cube_header(
             # all coordinates in a cube file are in atomic units
         )
 
+    # A negative number of atoms indicates a cube file with several orbitals.
+    has_mos = natom < 0
+    natom = abs(natom)
     atnums = np.zeros(natom, int)
     atcorenums = np.zeros(natom, float)
     atcoords = np.zeros((natom, 3), float)
@@ -102,39 +116,265 @@ def _read_cube_header(
         if atcorenums[i] == 0.0:
             atcorenums[i] = atnums[i]
 
+    if has_mos:
+        # The number of orbitals, followed by their indices, possibly on several lines.
+        words = next(lit).split()
+        nmo = int(words[0])
+        while len(words) < nmo + 1:
+            words.extend(next(lit).split())
+        cube["mo_indices"] = np.array(words[1 : nmo + 1], int)
+
     return title, atcoords, atnums, cellvecs, cube, atcorenums
 
 
-def _read_cube_data(lit: LineIterator, cube: dict[str, NDArray[float]]):
-    """Load cube data from a CUBE file object.
+def _select_grid_points(
+    shape: NDArray[int],
+    region: Optional[tuple[slice, slice, slice]] = None,
+    stride: Optional[Union[int, tuple[int, int, int]]] = None,
+) -> tuple[list[NDArray[int]], NDArray[int], NDArray[int]]:
+    """Translate a region and a stride into indices of grid points to be loaded.
+
+    Parameters
+    ----------
+    shape
+        The number of grid points along each axis.
+    region
+        A tuple with three slices, one for each axis. When not given, the whole grid is
+        selected.
+    stride
+        An integer or a tuple of three integers with the step along each axis. This is
+        applied on top of the steps in ``region``.
+
+    Returns
+    -------
+    indices
+        A list with three arrays of selected grid indices, one for each axis.
+    starts
+        The first selected grid index along each axis.
+    steps
+        The step between selected grid points along each axis.
+
+    Raises
+    ------
+    ValueError
+        When the arguments are not valid or when the selection is empty.
+
+    """
+    if region is None:
+        region = (slice(None),) * 3
+    if len(region) != 3:
+        raise ValueError("The region must be a tuple of three slices.")
+    if stride is None:
+        stride = 1
+    strides = np.broadcast_to(np.asarray(stride, dtype=int), (3,))
+    if (strides < 1).any():
+        raise ValueError("The stride must be strictly positive.")
+    indices = []
+    steps = []
+    for size, axis_slice, axis_stride in zip(shape, region, strides):
+        start, stop, step = axis_slice.indices(size)
+        axis_indices = np.arange(start, stop, step)[::axis_stride]
+        if len(axis_indices) == 0:
+            raise ValueError("The selected region of the grid is empty.")
+        indices.append(axis_indices)
+        steps.append(step * axis_stride)
+    starts = np.array([axis_indices[0] for axis_indices in indices])
+    return indices, starts, np.array(steps)
+
+
+def _iter_grid_planes(
+    lit: LineIterator, shape: NDArray[int], iplanes: Iterable[int], skip_remainder: bool = False
+) -> Iterator[tuple[int, NDArray[float]]]:
+    """Iterate over planes of a 3D grid, with the last index changing fastest.
+
+    The data are read one plane (with a fixed first index) at a time. Planes that are
+    not requested are only counted, not converted to floating point numbers.
+    Unless ``skip_remainder`` is set, reading stops after the last requested plane.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from.
+    shape
+        The number of grid points along each axis in the file.
+    iplanes
+        The first indices of the requested planes.
+    skip_remainder
+        When set, the planes after the last requested one are skipped, such that the
+        line iterator is positioned at the end of the grid data.
+
+    Yields
+    ------
+    iplane
+        The first index of the plane.
+    plane
+        The data on the plane, with shape ``(shape[1], shape[2])``.
+
+    """
+    iplanes = set(iplanes)
+    nplane = shape[0] if skip_remainder else max(iplanes) + 1
+    nvalue_plane = shape[1] * shape[2]
+    # Words on the last line read that belong to the next plane.
+    words = []
+    try:
+        for iplane in range(nplane):
+            if iplane in iplanes:
+                while len(words) < nvalue_plane:
+                    words.extend(next(lit).split())
+                plane = np.array(words[:nvalue_plane], float).reshape(shape[1], shape[2])
+                words = words[nvalue_plane:]
+                yield iplane, plane
+            else:
+                # Only count the words of unwanted planes.
+                if len(words) >= nvalue_plane:
+                    # The words read so far also contain (part of) the next plane.
+                    words = words[nvalue_plane:]
+                    continue
+                nskip = nvalue_plane - len(words)
+                words = []
+                while nskip > 0:
+                    line_words = next(lit).split()
+                    if len(line_words) > nskip:
+                        words = line_words[nskip:]
+                    nskip -= len(line_words)
+    except StopIteration as exc:
+        # A StopIteration cannot propagate out of a generator.
+        raise LoadError("File ended before all data was read.", lit) from exc
+
+
+def _read_grid_data(
+    lit: LineIterator,
+    shape: NDArray[int],
+    indices: Optional[list[NDArray[int]]] = None,
+    skip_remainder: bool = False,
+) -> NDArray[float]:
+    """Read (part of) the values on a 3D grid, with the last index changing fastest.
 
     Parameters
     ----------
     lit
         The line iterator to read the data from.
+    shape
+        The number of grid points along each axis in the file.
+    indices
+        A list with three arrays of grid indices to be loaded, one for each axis.
+        When not given, the whole grid is loaded.
+    skip_remainder
+        When set, the line iterator is positioned at the end of the grid data,
+        also when the last planes are not loaded.
 
     Returns
     -------
-    The cube data array.
+    The array with the requested grid data.
 
     """
-    cube["data"] = np.zeros(tuple(cube["shape"]), float)
-    tmp = cube["data"].ravel()
-    counter = 0
-    words = []
-    while counter < tmp.size:
-        if not words:
-            words = next(lit).split()
-        tmp[counter] = float(words.pop(0))
-        counter += 1
+    if indices is None:
+        indices = [np.arange(size) for size in shape]
+    result = np.zeros(tuple(len(axis_indices) for axis_indices in indices), float)
+    plane_positions = {}
+    for position, iplane in enumerate(indices[0]):
+        plane_positions.setdefault(iplane, []).append(position)
+    if all(np.array_equal(ind, np.arange(size)) for size, ind in zip(shape[1:], indices[1:])):
+        # Avoid a copy when complete planes are loaded.
+        select_plane = ...
+    else:
+        select_plane = np.ix_(indices[1], indices[2])
+    for iplane, plane in _iter_grid_planes(lit, shape, plane_positions, skip_remainder):
+        result[plane_positions[iplane]] = plane[select_plane]
+    return result
+
+
+def _read_cube_data(
+    lit: LineIterator,
+    cube: dict[str, NDArray[float]],
+    region: Optional[tuple[slice, slice, slice]] = None,
+    stride: Optional[Union[int, tuple[int, int, int]]] = None,
+    mo_indices: Optional[list[int]] = None,
+):
+    """Load cube data from a CUBE file object.
 
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from.
+    cube
+        The grid specification obtained from ``_read_cube_header``. The ``data`` item is
+        added. The ``origin``, ``axes`` and ``shape`` items are updated when only a part
+        of the grid is loaded. The ``mo_indices`` item, if present, is updated when only
+        some orbitals are loaded.
+    region
+        A tuple with three slices, selecting a part of the grid.
+    stride
+        The step between loaded grid points along each axis.
+    mo_indices
+        The indices of the orbitals to load from a multi-orbital cube file.
 
-@document_load_one("Gaussian Cube", ["atcoords", "atcorenums", "atnums", "cellvecs", "cube"])
-def load_one(lit: LineIterator) -> dict:
+    """
+    try:
+        indices, starts, steps = _select_grid_points(cube["shape"], region, stride)
+    except ValueError as exc:
+        raise LoadError(str(exc), lit) from exc
+    if "mo_indices" in cube:
+        # The orbitals are treated as a fourth axis, which changes fastest in the file.
+        file_mo_indices = list(cube["mo_indices"])
+        if mo_indices is None:
+            mo_positions = np.arange(len(file_mo_indices))
+        else:
+            missing = set(mo_indices) - set(file_mo_indices)
+            if missing:
+                raise LoadError(f"Orbitals not present in cube file: {sorted(missing)}", lit)
+            mo_positions = np.array([file_mo_indices.index(imo) for imo in mo_indices])
+        nmo = len(file_mo_indices)
+        file_shape = cube["shape"] * [1, 1, nmo]
+        indices[2] = (indices[2].reshape(-1, 1) * nmo + mo_positions).ravel()
+        data = _read_grid_data(lit, file_shape, indices)
+        data = data.reshape(*data.shape[:2], -1, len(mo_positions))
+        cube["data"] = np.moveaxis(data, 3, 0)
+        cube["mo_indices"] = cube["mo_indices"][mo_positions]
+    elif mo_indices is not None:
+        raise LoadError("Orbitals can only be selected in a multi-orbital cube file.", lit)
+    else:
+        cube["data"] = _read_grid_data(lit, cube["shape"], indices)
+    cube["origin"] = cube["origin"] + np.dot(starts, cube["axes"])
+    cube["axes"] = cube["axes"] * steps.reshape(-1, 1)
+    cube["shape"] = np.array(cube["data"].shape[-3:])
+
+
+GRID_SELECTION_KWDOCS = {
+    "region": "A tuple with three slices, selecting a part of the grid to be loaded. "
+    "When not given, the whole grid is loaded. "
+    "The origin and axes of the cube are adjusted to the selected grid points.",
+    "stride": "An integer or a tuple of three integers. "
+    "Only every stride-th grid point along each axis is loaded, "
+    "on top of the selection made with region.",
+}
+
+
+CUBE_KWDOCS = {
+    **GRID_SELECTION_KWDOCS,
+    "mo_indices": "A list of (one-based) orbital indices to be loaded from a multi-orbital "
+    "cube file. When not given, all orbitals are loaded. "
+    "The values of the other orbitals are skipped without storing them.",
+}
+
+
+@document_load_one(
+    "Gaussian Cube",
+    ["atcoords", "atcorenums", "atnums", "cellvecs", "cube"],
+    [],
+    CUBE_KWDOCS,
+)
+def load_one(
+    lit: LineIterator,
+    region: Optional[tuple[slice, slice, slice]] = None,
+    stride: Optional[Union[int, tuple[int, int, int]]] = None,
+    mo_indices: Optional[list[int]] = None,
+) -> dict:
     """Do not edit this docstring. It will be overwritten."""
     title, atcoords, atnums, cellvecs, cube, atcorenums = _read_cube_header(lit)
-    _read_cube_data(lit, cube)
-    del cube["shape"]
+    _read_cube_data(lit, cube, region, stride, mo_indices)
+    # The cell vectors of a cube file are derived from the (selected) grid.
+    cellvecs = cube["axes"] * cube.pop("shape").reshape(-1, 1)
     return {
         "title": title,
         "atcoords": atcoords,
@@ -152,12 +392,15 @@ def _write_cube_header(
     atnums: NDArray[int],
     cube: dict[str, NDArray],
     atcorenums: NDArray[float],
+    mo_indices: Optional[NDArray[int]] = None,
 ):
     print(title, file=f)
     print("OUTER LOOP: X, MIDDLE LOOP: Y, INNER LOOP: Z", file=f)
     natom = len(atnums)
     x, y, z = cube.origin
-    print(f"{natom:5d} {x: 11.6f} {y: 11.6f} {z: 11.6f}", file=f)
+    # A negative number of atoms indicates a multi-orbital cube file.
+    natom_field = natom if mo_indices is None else -natom
+    print(f"{natom_field:5d} {x: 11.6f} {y: 11.6f} {z: 11.6f}", file=f)
     for i in range(3):
         x, y, z = cube.axes[i]
         print(f"{cube.shape[i]:5d} {x: 11.6f} {y: 11.6f} {z: 11.6f}", file=f)
@@ -165,26 +408,51 @@ def _write_cube_header(
         q = atcorenums[i]
         x, y, z = atcoords[i]
         print(f"{atnums[i]:5d} {q: 11.6f} {x: 11.6f} {y: 11.6f} {z: 11.6f}", file=f)
+    if mo_indices is not None:
+        # Number of orbitals and their indices, ten integers per line.
+        words = [f"{value:5d}" for value in [len(mo_indices), *mo_indices]]
+        for iword in range(0, len(words), 10):
+            print("".join(words[iword : iword + 10]), file=f)
 
 
 def _write_cube_data(f: TextIO, cube_data: NDArray[float], block_size: int):
-    counter = 0
-    for value in cube_data.flat:
-        f.write(f" {value: 12.5E}")
-        # go to next line after adding 6 values on a line
-        if counter % 6 == 5:
-            f.write("\n")
-        # go to next line after reaching the block_size & reset counter
-        if block_size % 6 != 0 and counter % block_size == block_size - 1:
-            f.write("\n")
-            counter = 0
-            continue
-        counter += 1
+    """Write the cube data in the Gaussian Cube layout.
+
+    Values are written six per line. When ``block_size`` is not a multiple of six, a
+    line break is also inserted after every ``block_size`` values.
+
+    Parameters
+    ----------
+    f
+        The file object to write to.
+    cube_data
+        The array with the data on the grid.
+    block_size
+        The number of values in one block, i.e. the length of the inner (Z) loop.
+
+    """
+    # Build one format string for a complete block, such that all values of a
+    # block (and of several blocks at once) are formatted in a single call.
+    nfull, nrest = divmod(block_size, 6)
+    block_fmt = (" % 12.5E" * 6 + "\n") * nfull
+    if nrest > 0:
+        block_fmt += " % 12.5E" * nrest + "\n"
+    blocks = cube_data.reshape(-1, block_size)
+    # Several blocks are formatted together to limit the number of write calls.
+    nblock_chunk = max(1, CUBE_WRITE_CHUNK // block_size)
+    for iblock in range(0, len(blocks), nblock_chunk):
+        chunk = blocks[iblock : iblock + nblock_chunk]
+        f.write((block_fmt * len(chunk)) % tuple(chunk.ravel().tolist()))
 
 
 @document_dump_one("Gaussian Cube", ["atcoords", "atnums", "cube"], ["title", "atcorenums"])
 def dump_one(f: TextIO, data: IOData):
     """Do not edit this docstring. It will be overwritten."""
     title = data.title or "Created with IOData"
-    _write_cube_header(f, title, data.atcoords, data.atnums, data.cube, data.atcorenums)
-    _write_cube_data(f, data.cube.data, data.cube.shape[2])
+    cube = data.cube
+    _write_cube_header(f, title, data.atcoords, data.atnums, cube, data.atcorenums, cube.mo_indices)
+    if cube.mo_indices is None:
+        _write_cube_data(f, cube.data, cube.shape[2])
+    else:
+        # The values of all orbitals at one grid point are written consecutively.
+        _write_cube_data(f, np.moveaxis(cube.data, 0, 3), cube.shape[2] * len(cube.mo_indices))
@@ -27,15 +27,18 @@ handle an XYZ with different molecules, e.g. a molecular database.
 
 """
 
+import re
 import shlex
 from collections.abc import Iterator
+from functools import lru_cache
 
 import numpy as np
 
 from ..docstrings import document_load_many, document_load_one
-from ..periodic import num2sym, sym2num
 from ..utils import LineIterator, LoadError, amu, angstrom, strtobool
-from .xyz import load_one as load_one_xyz
+from .xyz import COLUMN_LOADERS as COLUMN_LOADERS_XYZ
+from .xyz import DEFAULT_ATOM_COLUMNS, _load_frame
+from .xyz import skip_frame as skip_frame_xyz
 
 __all__ = ()
 
@@ -43,8 +46,48 @@ __all__ = ()
 PATTERNS = ["*.extxyz"]
 
 
+CACHE_SIZE = 256
+"""The maximum number of distinct strings for which the parsed result is cached.
+
+In a trajectory or a dataset, most frames have the same Properties and title values.
+These are parsed only once, while the number of cached results remains bounded.
+"""
+
+
+# A word in the title, consisting of unquoted characters and quoted parts.
+TITLE_WORD = re.compile(r"""(?:[^ \t\r\n"'\\]|"[^"\\]*"|'[^']*')+""")
+TITLE_QUOTED = re.compile(r""""([^"\\]*)"|'([^']*)'""")
+
+
+def _split_title(title: str) -> list[str]:
+    """Split the title into words, with the same result as ``shlex.split``.
+
+    Titles without backslashes or unbalanced quotes are split with regular expressions,
+    which is much faster than ``shlex.split``. Other titles are passed to ``shlex.split``.
+    """
+    if "\\" not in title and TITLE_WORD.sub("", title).strip(" \t\r\n") == "":
+        return [
+            TITLE_QUOTED.sub(lambda match: match.group(1) or match.group(2) or "", word)
+            for word in TITLE_WORD.findall(title)
+        ]
+    return shlex.split(title)
+
+
 def _convert_title_value(value: str):
-    """Search for the correct dtype and convert the string."""
+    """Search for the correct dtype and convert the string.
+
+    The result is cached for every distinct string.
+    Arrays are copied, such that different frames never share them.
+    """
+    converted_value = _convert_title_value_cached(value)
+    if isinstance(converted_value, np.ndarray):
+        converted_value = converted_value.copy()
+    return converted_value
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _convert_title_value_cached(value: str):
+    """Search for the correct dtype and convert the string, see _convert_title_value."""
     list_of_splits = value.split()
     # If it is just one item, first try int, then float and finally return a bool or str
     if len(list_of_splits) == 1:
@@ -76,6 +119,47 @@ def _convert_title_value(value: str):
     return converted_value
 
 
+# Maps the dtype to the atom_columns dtype, load_word and dump_word
+DTYPE_MAP = {
+    "S": (np.dtype("U25"), str, "{:10s}".format),
+    "R": (float, float, "{:15.10f}".format),
+    "I": (int, int, "{:10d}".format),
+    "L": (bool, strtobool, lambda boolean: "T" if boolean else "F"),
+}
+
+
+# Some predefined iodata attributes which can be mapped
+# pos is assumed to be in angstrom, masses in amu (ase convention)
+# No unit convertion takes place for the other attributes
+ATOM_COLUMN_MAP = {
+    "pos": DEFAULT_ATOM_COLUMNS[1],
+    "masses": (
+        "atmasses",
+        None,
+        (),
+        float,
+        (lambda word: float(word) * amu),
+        (lambda value: f"{value / amu:15.10f}"),
+    ),
+    "force": (
+        "atgradient",
+        None,
+        (3,),
+        float,
+        (lambda word: -float(word)),
+        (lambda value: f"{-value:15.10f}"),
+    ),
+}
+
+
+# Vectorized versions of the load_word functions above
+COLUMN_LOADERS = {
+    **COLUMN_LOADERS_XYZ,
+    ATOM_COLUMN_MAP["masses"][4]: (lambda words: words.astype(float) * amu),
+    ATOM_COLUMN_MAP["force"][4]: (lambda words: -words.astype(float)),
+}
+
+
 def _parse_properties(properties: str, lit: LineIterator) -> list[tuple]:
     """Parse the properties listed in the title into atom_columns.
 
@@ -92,76 +176,39 @@ def _parse_properties(properties: str, lit: LineIterator) -> list[tuple]:
         A list of tuples specifying the columns in the extended XYZ file.
         For more details, see ``ATOM_COLUMNS_DOC`` in ``iodata.formats.xyz``.
     """
-    atom_columns = []
-    # Maps the dtype to the atom_columns dtype, load_word and dump_word
-    dtype_map = {
-        "S": (np.dtype("U25"), str, "{:10s}".format),
-        "R": (float, float, "{:15.10f}".format),
-        "I": (int, int, "{:10d}".format),
-        "L": (bool, strtobool, lambda boolean: "T" if boolean else "F"),
-    }
-    # Some predefined iodata attributes which can be mapped
-    # pos is assumed to be in angstrom, masses in amu (ase convention)
-    # No unit convertion takes place for the other attributes
-    atom_column_map = {
-        "pos": (
-            "atcoords",
-            None,
-            (3,),
-            float,
-            (lambda word: float(word) * angstrom),
-            (lambda value: f"{value / angstrom:15.10f}"),
-        ),
-        "masses": (
-            "atmasses",
-            None,
-            (),
-            float,
-            (lambda word: float(word) * amu),
-            (lambda value: f"{value / amu:15.10f}"),
-        ),
-        "force": (
-            "atgradient",
-            None,
-            (3,),
-            float,
-            (lambda word: -float(word)),
-            (lambda value: f"{-value:15.10f}"),
-        ),
-    }
-    atnum_column = (
-        "atnums",
-        None,
-        (),
-        int,
-        (lambda word: int(word) if word.isdigit() else sym2num[word.title()]),
-        (lambda atnum: f"{num2sym[atnum]:2s}"),
-    )
-    splitted_properties = properties.split(":")
-    if len(splitted_properties) % 3 != 0:
+    if len(properties.split(":")) % 3 != 0:
         raise LoadError(
             f"Cannot parse property from the title line: '{properties}'. "
             f"The expected format is name:dtype:shape.",
             lit,
         )
+    return list(_parse_properties_cached(properties))
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def _parse_properties_cached(properties: str) -> tuple[tuple]:
+    """Parse the properties listed in the title into atom_columns, see _parse_properties."""
+    atom_columns = []
+    atom_column_map = dict(ATOM_COLUMN_MAP)
+    splitted_properties = properties.split(":")
     # Each property has 3 values: its name, dtype and shape
     names = splitted_properties[::3]
     dtypes = splitted_properties[1::3]
     shapes = splitted_properties[2::3]
     if "Z" in names:
         # Try to map 'Z' to the 'atnums' attribute
-        atom_column_map["Z"] = atnum_column
+        atom_column_map["Z"] = DEFAULT_ATOM_COLUMNS[0]
     elif "species" in names:
         # If 'Z' is not present, use 'species'
-        atom_column_map["species"] = atnum_column
+        atom_column_map["species"] = DEFAULT_ATOM_COLUMNS[0]
     for name, dtype, shape in zip(names, dtypes, shapes):
         if name in atom_column_map:
             atom_columns.append(atom_column_map[name])
         else:
             # Use the 'extra' attribute to store values which are not predefined in iodata
             shape_suffix = () if shape == "1" else (int(shape),)
-            atom_columns.append(("extra", name, shape_suffix, *dtype_map[dtype]))
-    return atom_columns
+            atom_columns.append(("extra", name, shape_suffix, *DTYPE_MAP[dtype]))
+    return tuple(atom_columns)
 
 
 def _parse_title(title: str, lit: LineIterator) -> tuple[list[tuple], dict[str]]:
@@ -183,7 +230,7 @@ def _parse_title(title: str, lit: LineIterator) -> tuple[list[tuple], dict[str]]
         Attributes to be included in the ``IOData`` instance,
         taken from the title line.
     """
-    key_value_pairs = shlex.split(title)
+    key_value_pairs = _split_title(title)
     # A dict of predefined iodata atrributes with their names and dtype convertion functions
 
     def load_cellvecs(word):
@@ -223,7 +270,7 @@ def load_one(lit: LineIterator) -> dict:
     atom_columns, title_data = _parse_title(title_line, lit)
     lit.back(title_line)
     lit.back(atom_line)
-    xyz_data = load_one_xyz(lit, atom_columns)
+    xyz_data = _load_frame(lit, atom_columns, COLUMN_LOADERS)
     # If the extra attribute is present, prevent it from overwriting itself
     if "extra" in title_data and "extra" in xyz_data:
         xyz_data["extra"].update(title_data["extra"])
@@ -250,3 +297,9 @@ def load_many(lit: LineIterator) -> Iterator[dict]:
             yield load_one(lit)
     except StopIteration:
         return
+
+
+def skip_frame(lit: LineIterator):
+    """Skip one frame without parsing it, raising StopIteration after the last frame."""
+    # The title line is not parsed, so frames are skipped as in plain XYZ files.
+    skip_frame_xyz(lit)
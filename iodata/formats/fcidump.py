@@ -25,17 +25,37 @@ Notes
    while IOData internally uses physicists' notation.
 3. Keep in mind that the FCIDUMP format changed in MOLPRO 2012, so files generated with
    older versions are not supported.
+4. Orbital symmetries (``ORBSYM``) are irreps of D2h or one of its subgroups, numbered
+   from 1 to 8 as in Molpro. The product of two irreps then corresponds to the bitwise
+   exclusive or of their zero-based numbers.
 
 """
 
-from typing import TextIO
+import re
+from collections.abc import Iterator
+from itertools import islice
+from typing import TextIO, Union
 from warnings import warn
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ..docstrings import document_dump_one, document_load_one
+from ..fourindex import (
+    PackedFourIndex,
+    SparseFourIndex,
+    _split_compound_index,
+    pair_index,
+    unpair_index,
+)
 from ..iodata import IOData
-from ..utils import LineIterator, LoadError, LoadWarning, set_four_index_element
+from ..utils import (
+    LineIterator,
+    LoadError,
+    LoadWarning,
+    PrepareDumpError,
+    set_four_index_element,
+)
 
 __all__ = ()
 
@@ -43,71 +63,103 @@ __all__ = ()
 PATTERNS = ["*FCIDUMP*", "*.fcidump"]
 
 
+# The number of lines parsed at once when loading integrals.
+FCIDUMP_LOAD_CHUNK = 65536
+
+
+# The number of (unique) two-electron integrals considered at once when dumping.
+FCIDUMP_DUMP_CHUNK = 65536
+
+
+# The format of one line with an integral, equivalent to the format used by Molpro.
+RECORD_FORMAT = "%23.16e %4d %4d %4d %4d\n"
+
+
 LOAD_ONE_NOTES = """
 IOData stores four-index objects in physicists' notation internally and
 assumes they are stored in an FCIDUMP file in chemists' notation.
+The orbital symmetries (``ORBSYM``) and the symmetry of the state (``ISYM``) are
+loaded into ``extra["orbsym"]`` and ``extra["isym"]``, respectively.
 """
 
 
+LOAD_ONE_KWDOCS = {
+    "packed": "When True, the two-electron integrals are loaded as a "
+    ":py:class:`iodata.fourindex.PackedFourIndex` instance, which only stores the unique "
+    "elements. Otherwise, a dense array is loaded.",
+    "sparse": "When True, the two-electron integrals are loaded as a "
+    ":py:class:`iodata.fourindex.SparseFourIndex` instance, which only stores the "
+    "unique elements present in the file, in coordinate format. "
+    "This cannot be combined with packed.",
+    "cutoff": "Two-electron integrals whose absolute value does not exceed the cutoff "
+    "are discarded.",
+}
+
+
 @document_load_one(
     "Molpro 2012 FCIDUMP",
     ["core_energy", "one_ints", "nelec", "spinpol", "two_ints"],
+    ["extra"],
+    LOAD_ONE_KWDOCS,
     notes=LOAD_ONE_NOTES,
 )
-def load_one(lit: LineIterator) -> dict:
+def load_one(
+    lit: LineIterator, packed: bool = False, sparse: bool = False, cutoff: float = 0.0
+) -> dict:
     """Do not edit this docstring. It will be overwritten."""
+    if packed and sparse:
+        raise ValueError("The options packed and sparse cannot be combined.")
     # check header
     line = next(lit)
     if not line.startswith(" &FCI NORB="):
         raise LoadError(f"Incorrect file header: {line.strip()}", lit)
 
-    # read info from header
-    words = line[5:].split(",")
-    header_info = {}
-    for word in words:
-        if word.count("=") == 1:
-            key, value = word.split("=")
-            header_info[key.strip()] = value.strip()
-    nbasis = int(header_info["NORB"])
-    nelec = int(header_info["NELEC"])
-    spinpol = int(header_info["MS2"])
-
-    # skip rest of header
+    # read info from header, which may span several lines
+    header_lines = [line[5:]]
     for line in lit:
         words = line.split()
-        if words[0] == "&END" or words[0] == "/END" or words[0] == "/":
+        if len(words) > 0 and words[0] in ("&END", "/END", "/"):
             break
+        header_lines.append(line)
+    header_info = _parse_namelist(" ".join(header_lines))
+    nbasis = int(header_info["NORB"][0])
+    nelec = int(header_info["NELEC"][0])
+    spinpol = int(header_info["MS2"][0])
+    extra = {}
+    if "ORBSYM" in header_info:
+        orbsym = np.array(header_info["ORBSYM"], dtype=int)
+        if orbsym.shape != (nbasis,):
+            raise LoadError(f"Expecting {nbasis} orbital symmetries, got {len(orbsym)}.", lit)
+        extra["orbsym"] = orbsym
+    if "ISYM" in header_info:
+        extra["isym"] = int(header_info["ISYM"][0])
 
     # read the integrals
-    one_mo = np.zeros((nbasis, nbasis))
-    two_mo = np.zeros((nbasis, nbasis, nbasis, nbasis))
-    core_energy = 0.0
-
-    for line in lit:
-        words = line.split()
-        if len(words) != 5:
-            raise LoadError(
-                f"Expecting 5 fields on each data line in FCIDUMP, got {len(words)}.", lit
-            )
-        value = float(words[0])
-        if words[3] != "0":
-            ii = int(words[1]) - 1
-            ij = int(words[2]) - 1
-            ik = int(words[3]) - 1
-            il = int(words[4]) - 1
-            if two_mo[ii, ik, ij, il] != 0.0:
-                warn(
-                    LoadWarning("Duplicate entries in the FCIDUMP file are ignored", lit),
-                    stacklevel=2,
-                )
-            set_four_index_element(two_mo, ii, ik, ij, il, value)
-        elif words[1] != "0":
-            ii = int(words[1]) - 1
-            ij = int(words[2]) - 1
-            one_mo[ii, ij] = value
-            one_mo[ij, ii] = value
-        else:
-            core_energy = value
+    core_energy, one_mo, compound, values, nduplicate = _load_integrals(lit, nbasis)
+    mask = abs(values) > cutoff
+    compound = compound[mask]
+    values = values[mask]
+    if nduplicate > 0:
+        warn(
+            LoadWarning(
+                f"Duplicate entries in the FCIDUMP file: {nduplicate} nonzero integrals "
+                "are overwritten by a later equivalent entry.",
+                lit.filename,
+            ),
+            stacklevel=2,
+        )
+    # Symmetric scatter of the unique two-electron integrals.
+    if packed:
+        two_mo = PackedFourIndex.zeros(nbasis)
+        two_mo.data[compound] = values
+    elif sparse:
+        two_mo = SparseFourIndex(nbasis, compound, values)
+    else:
+        two_mo = np.zeros((nbasis, nbasis, nbasis, nbasis))
+        pair01, pair23 = unpair_index(compound)
+        i0, i1 = unpair_index(pair01)
+        i2, i3 = unpair_index(pair23)
+        set_four_index_element(two_mo, i0, i2, i1, i3, values)
 
     return {
         "nelec": nelec,
@@ -115,24 +167,232 @@ def load_one(lit: LineIterator) -> dict:
         "one_ints": {"core_mo": one_mo},
         "two_ints": {"two_mo": two_mo},
         "core_energy": core_energy,
+        "extra": extra,
     }
 
 
+def _parse_namelist(text: str) -> dict[str, list[str]]:
+    """Parse the assignments in a Fortran namelist.
+
+    Parameters
+    ----------
+    text
+        The contents of the namelist, without the group name and the end marker,
+        e.g. ``NORB=4,NELEC=2,ORBSYM=1,1,5,5,``.
+
+    Returns
+    -------
+    A dictionary with (upper case) keys and lists of values as strings.
+
+    """
+    fields = re.split(r"([A-Za-z_]\w*)\s*=", text)
+    return {
+        key.upper(): [word.strip() for word in value.split(",") if word.strip() != ""]
+        for key, value in zip(fields[1::2], fields[2::2])
+    }
+
+
+def _load_integrals(
+    lit: LineIterator, nbasis: int
+) -> tuple[float, NDArray[float], NDArray[int], NDArray[float], int]:
+    """Load all integrals after the header of an FCIDUMP file.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from, positioned after the header.
+    nbasis
+        The number of orbitals.
+
+    Returns
+    -------
+    core_energy
+        The core energy.
+    one_mo
+        The one-electron integrals.
+    compound
+        The unique compound indices of the two-electron integrals in the file,
+        see :py:mod:`iodata.fourindex`.
+    values
+        The values of the two-electron integrals.
+    nduplicate
+        The number of two-electron integrals that overwrite a nonzero value of an
+        earlier (symmetry-equivalent) record. The last record always takes precedence.
+
+    """
+    core_energy = 0.0
+    one_chunks = []
+    two_chunks = []
+    while True:
+        lineno = lit.lineno
+        lines = list(islice(lit, FCIDUMP_LOAD_CHUNK))
+        if len(lines) == 0:
+            break
+        indices, values = _parse_records(lit, lineno, lines, nbasis)
+        # Records with a nonzero third index contain two-electron integrals, all other
+        # records with a nonzero first index contain one-electron integrals.
+        is_two = indices[:, 2] != 0
+        is_one = ~is_two & (indices[:, 0] != 0)
+        is_core = ~(is_two | is_one)
+        if is_core.any():
+            core_energy = float(values[is_core][-1])
+        # Zero indices of integrals are interpreted as the last orbital.
+        indices = (indices - 1) % nbasis
+        i0, i1, i2, i3 = indices[is_two].T
+        two_chunks.append((pair_index(pair_index(i0, i1), pair_index(i2, i3)), values[is_two]))
+        i0, i1 = indices[is_one, :2].T
+        one_chunks.append((pair_index(i0, i1), values[is_one]))
+
+    compound, values, _ = _find_last_records(*_concatenate_chunks(one_chunks))
+    one_mo = np.zeros((nbasis, nbasis))
+    i0, i1 = unpair_index(compound)
+    one_mo[i0, i1] = values
+    one_mo[i1, i0] = values
+
+    return (core_energy, one_mo, *_find_last_records(*_concatenate_chunks(two_chunks)))
+
+
+def _parse_records(
+    lit: LineIterator, lineno: int, lines: list[str], nbasis: int
+) -> tuple[NDArray[int], NDArray[float]]:
+    """Convert lines with integrals to arrays.
+
+    Parameters
+    ----------
+    lit
+        The line iterator from which the lines were just read.
+    lineno
+        The line number before the first of the given lines.
+    lines
+        Lines with one value and four (one-based) indices each.
+    nbasis
+        The number of orbitals.
+
+    Returns
+    -------
+    indices
+        Integer array with shape ``(len(lines), 4)``.
+    values
+        The values on each line.
+
+    """
+    words = " ".join(lines).split()
+    if len(words) != 5 * len(lines):
+        for iline, line in enumerate(lines):
+            nword = len(line.split())
+            if nword != 5:
+                raise LoadError(
+                    f"Expecting 5 fields on each data line in FCIDUMP, got {nword}.",
+                    lit,
+                    lineno + iline + 1,
+                )
+    fields = np.array(words, dtype=float).reshape(-1, 5)
+    indices = fields[:, 1:].astype(int)
+    if (indices < 0).any() or (indices > nbasis).any():
+        raise LoadError("Orbital index out of range in FCIDUMP file.", lit)
+    return indices, fields[:, 0]
+
+
+def _concatenate_chunks(chunks: list[tuple[NDArray, NDArray]]) -> tuple[NDArray, NDArray]:
+    """Concatenate the compound indices and the values of all chunks."""
+    if len(chunks) == 0:
+        return np.zeros(0, dtype=int), np.zeros(0)
+    return tuple(np.concatenate(arrays) for arrays in zip(*chunks))
+
+
+def _find_last_records(
+    compound: NDArray[int], values: NDArray[float]
+) -> tuple[NDArray[int], NDArray[float], int]:
+    """Keep only the last record for each compound index.
+
+    Parameters
+    ----------
+    compound
+        The compound indices of all records, in the order of the file.
+    values
+        The corresponding values.
+
+    Returns
+    -------
+    compound
+        The unique compound indices.
+    values
+        The value of the last record with each compound index.
+    nduplicate
+        The number of records directly preceded by a nonzero record with the same
+        compound index.
+
+    """
+    order = np.argsort(compound, kind="stable")
+    compound = compound[order]
+    values = values[order]
+    first = np.ones(len(compound), dtype=bool)
+    first[1:] = compound[1:] != compound[:-1]
+    last = np.ones(len(compound), dtype=bool)
+    last[:-1] = first[1:]
+    # A record is a duplicate when it overwrites a nonzero value of the previous record.
+    nduplicate = np.count_nonzero(~first[1:] & (values[:-1] != 0.0))
+    return compound[last], values[last], nduplicate
+
+
+def prepare_dump(data: IOData, allow_changes: bool, filename: str) -> IOData:
+    """Check the compatibility of the IOData object with the FCIDUMP format.
+
+    Parameters
+    ----------
+    data
+        The IOData instance to be checked.
+    allow_changes
+        Whether conversion of the IOData object to a compatible form is allowed or not.
+        (not relevant for FCIDUMP, present for API consistency)
+    filename
+        The file to be written to, only used for error messages.
+
+    Returns
+    -------
+    data
+        The given ``IOData`` object.
+
+    Raises
+    ------
+    PrepareDumpError
+        If the orbital symmetries in ``extra`` are not compatible with the FCIDUMP format.
+    """
+    if "orbsym" in data.extra:
+        orbsym = np.asarray(data.extra["orbsym"])
+        nactive = data.one_ints["core_mo"].shape[0]
+        if orbsym.shape != (nactive,):
+            raise PrepareDumpError(f"Expecting {nactive} orbital symmetries.", filename)
+        if not ((orbsym >= 1) & (orbsym <= 8)).all():
+            raise PrepareDumpError("Orbital symmetries must be integers from 1 to 8.", filename)
+    return data
+
+
 DUMP_ONE_NOTES = """
 The dictionary ``one_ints`` must contain a field ``core_mo``.
 Similarly, ``two_ints`` must contain ``two_mo``.
 IOData stores four-index objects in physicists' notation internally and
 dumps them to an FCIDUMP file in chemists' notation.
+The orbital symmetries and the symmetry of the state are taken from
+``extra["orbsym"]`` and ``extra["isym"]``, if present.
+Integrals that vanish by symmetry are not written.
 """
 
 
+DUMP_ONE_KWDOCS = {
+    "threshold": "Integrals whose absolute value does not exceed this threshold are not "
+    "written. The default only omits integrals that are exactly zero.",
+}
+
+
 @document_dump_one(
     "Molpro 2012 FCIDUMP",
     ["one_ints", "two_ints"],
-    ["core_energy", "nelec", "spinpol"],
+    ["core_energy", "extra", "nelec", "spinpol"],
+    DUMP_ONE_KWDOCS,
     notes=DUMP_ONE_NOTES,
 )
-def dump_one(f: TextIO, data: IOData):
+def dump_one(f: TextIO, data: IOData, threshold: float = 0.0):
     """Do not edit this docstring. It will be overwritten."""
     one_mo = data.one_ints["core_mo"]
 
@@ -140,28 +400,111 @@ def dump_one(f: TextIO, data: IOData):
     nactive = one_mo.shape[0]
     nelec = data.nelec or 0
     spinpol = data.spinpol or 0
+    orbsym = np.asarray(data.extra.get("orbsym", np.ones(nactive, dtype=int)))
+    isym = data.extra.get("isym", 1)
     print(f" &FCI NORB={nactive:d},NELEC={nelec:d},MS2={spinpol:d},", file=f)
-    print(f"  ORBSYM= {','.join('1' for v in range(nactive))},", file=f)
-    print("  ISYM=1", file=f)
+    print(f"  ORBSYM= {','.join(str(irrep) for irrep in orbsym)},", file=f)
+    print(f"  ISYM={isym:d}", file=f)
     print(" &END", file=f)
 
     # Write integrals and core energy
-    two_mo = data.two_ints["two_mo"]
-    for i0 in range(nactive):
-        for i1 in range(i0 + 1):
-            for i2 in range(nactive):
-                for i3 in range(i2 + 1):
-                    if (i0 * (i0 + 1)) / 2 + i1 >= (i2 * (i2 + 1)) / 2 + i3:
-                        value = two_mo[i0, i2, i1, i3]
-                        if value != 0.0:
-                            print(
-                                f"{value:23.16e} {i0 + 1:4d} {i1 + 1:4d} {i2 + 1:4d} {i3 + 1:4d}",
-                                file=f,
-                            )
-    for i0 in range(nactive):
-        for i1 in range(i0 + 1):
-            value = one_mo[i0, i1]
-            if value != 0.0:
-                print(f"{value:23.16e} {i0 + 1:4d} {i1 + 1:4d} {0:4d} {0:4d}", file=f)
+    for i0, i1, i2, i3, values in _iter_two_mo(data.two_ints["two_mo"], threshold, orbsym):
+        _write_records(f, values, i0 + 1, i1 + 1, i2 + 1, i3 + 1)
+    i0, i1 = np.tril_indices(nactive)
+    values = one_mo[i0, i1]
+    mask = (abs(values) > threshold) & (orbsym[i0] == orbsym[i1])
+    zero = np.zeros(mask.sum(), dtype=int)
+    _write_records(f, values[mask], i0[mask] + 1, i1[mask] + 1, zero, zero)
     if data.core_energy is not None:
         print(f"{data.core_energy:23.16e} {0:4d} {0:4d} {0:4d} {0:4d}", file=f)
+
+
+def _iter_two_mo(
+    two_mo: Union[NDArray[float], PackedFourIndex, SparseFourIndex],
+    threshold: float,
+    orbsym: NDArray[int],
+) -> Iterator[tuple[NDArray[int], NDArray[int], NDArray[int], NDArray[int], NDArray[float]]]:
+    """Iterate over chunks of unique two-electron integrals in the order of the FCIDUMP file.
+
+    Parameters
+    ----------
+    two_mo
+        A dense array or a packed or sparse four-index object in physicists' notation.
+    threshold
+        Only integrals whose absolute value exceeds the threshold are included.
+    orbsym
+        The (one-based) irreps of the orbitals. Symmetry-forbidden integrals are skipped.
+
+    Yields
+    ------
+    i0, i1, i2, i3
+        The (zero-based) indices of the integrals in chemists' notation.
+    values
+        The values of the integrals.
+
+    """
+    irreps = orbsym - 1
+    if isinstance(two_mo, SparseFourIndex):
+        for i0, i1, i2, i3, values in two_mo.iter_elements(threshold, FCIDUMP_DUMP_CHUNK):
+            mask = (irreps[i0] ^ irreps[i1] ^ irreps[i2] ^ irreps[i3]) == 0
+            yield i0[mask], i1[mask], i2[mask], i3[mask], values[mask]
+        return
+    for compound in _iter_allowed_compound_index(irreps, FCIDUMP_DUMP_CHUNK):
+        i0, i1, i2, i3 = _split_compound_index(compound)
+        if isinstance(two_mo, PackedFourIndex):
+            values = two_mo.data[compound]
+        else:
+            values = two_mo[i0, i2, i1, i3]
+        mask = abs(values) > threshold
+        yield i0[mask], i1[mask], i2[mask], i3[mask], values[mask]
+
+
+def _iter_allowed_compound_index(irreps: NDArray[int], chunk_size: int) -> Iterator[NDArray[int]]:
+    """Iterate over the compound indices of symmetry-allowed two-electron integrals.
+
+    Parameters
+    ----------
+    irreps
+        The zero-based irreps of the orbitals.
+    chunk_size
+        The approximate number of compound indices in one chunk.
+
+    Yields
+    ------
+    compound
+        Increasing compound indices, see :py:mod:`iodata.fourindex`.
+        Symmetry-forbidden blocks are skipped without generating their indices.
+
+    """
+    # The integral (ij|kl) is allowed when the pairs ij and kl have the same symmetry.
+    npair = len(irreps) * (len(irreps) + 1) // 2
+    big, small = unpair_index(np.arange(npair))
+    pairsym = irreps[big] ^ irreps[small]
+    # Pairs sorted by symmetry, with the offset of each symmetry in the sorted list.
+    sorted_pairs = np.argsort(pairsym, kind="stable")
+    offsets = np.zeros(pairsym.max(initial=0) + 2, dtype=int)
+    offsets[1:] = np.cumsum(np.bincount(pairsym))
+    # Each pair can be combined with all pairs of the same symmetry up to itself.
+    npartner = np.zeros(npair, dtype=int)
+    npartner[sorted_pairs] = np.arange(npair) - offsets[pairsym[sorted_pairs]] + 1
+    ends = np.cumsum(npartner)
+    begin = 0
+    while begin < npair:
+        end = max(
+            np.searchsorted(ends, ends[begin] - npartner[begin] + chunk_size, "right"), begin + 1
+        )
+        pairs = np.arange(begin, end)
+        counts = npartner[pairs]
+        rows = np.repeat(pairs, counts)
+        positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+        cols = sorted_pairs[np.repeat(offsets[pairsym[pairs]], counts) + positions]
+        yield rows * (rows + 1) // 2 + cols
+        begin = end
+
+
+def _write_records(f: TextIO, values: NDArray[float], *indices: NDArray[int]):
+    """Write lines with one value and four indices each, using a single format operation."""
+    if len(values) == 0:
+        return
+    fields = np.column_stack([values, *indices]).ravel().tolist()
+    f.write((RECORD_FORMAT * len(values)) % tuple(fields))
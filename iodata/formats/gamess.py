@@ -22,7 +22,7 @@ import numpy as np
 from numpy.typing import NDArray
 
 from ..docstrings import document_load_one
-from ..utils import LineIterator, LoadError, angstrom
+from ..utils import LineIterator, LoadError, angstrom, read_fortran_fields
 
 __all__ = ()
 
@@ -91,18 +91,11 @@ def _read_hessian(lit: LineIterator, result: dict[str]) -> NDArray[float]:
         )
     next(lit)
     natom = len(result["symbols"])
-    hessian = np.zeros((3 * natom, 3 * natom), float)
-    tmp = hessian.ravel()
-    counter = 0
-    while True:
-        line = next(lit)
-        if line == " $END\n":
-            break
-        line = line[5:-1]
-        for j in range(len(line) // 15):
-            tmp[counter] = float(line[j * 15 : (j + 1) * 15])
-            counter += 1
-    return hessian
+    # FORMAT (I2,I3,5E15.8)
+    hessian = read_fortran_fields(lit, (3 * natom) ** 2, 15, 5, skip=5)
+    if next(lit).strip() != "$END":
+        raise LoadError("Expecting end of $HESS section.", lit)
+    return hessian.reshape(3 * natom, 3 * natom)
 
 
 def _read_masses(lit: LineIterator, result: dict[str]) -> NDArray[float]:
@@ -27,10 +27,13 @@ you need to use the following Gaussian command line:
 
 """
 
+from typing import Union
+
 import numpy as np
 from numpy.typing import NDArray
 
 from ..docstrings import document_load_one
+from ..fourindex import PackedFourIndex
 from ..utils import LineIterator, set_four_index_element
 
 __all__ = ()
@@ -45,8 +48,17 @@ They will be reordered into physicists' notation when loading them with IOData.
 """
 
 
-@document_load_one("Gaussian Log", [], ["one_ints", "two_ints"], notes=LOAD_ONE_NOTES)
-def load_one(lit: LineIterator) -> dict:
+PACKED_KWDOCS = {
+    "packed": "When True, four-index objects are loaded as "
+    ":py:class:`iodata.fourindex.PackedFourIndex` instances, which only store the unique "
+    "elements. Otherwise, dense arrays are loaded.",
+}
+
+
+@document_load_one(
+    "Gaussian Log", [], ["one_ints", "two_ints"], PACKED_KWDOCS, notes=LOAD_ONE_NOTES
+)
+def load_one(lit: LineIterator, packed: bool = False) -> dict:
     """Do not edit this docstring. It will be overwritten."""
     # First get the line with the number of orbital basis functions
     for line in lit:
@@ -70,7 +82,7 @@ def load_one(lit: LineIterator) -> dict:
         elif line.startswith(" ***** Potential Energy *****"):
             one_ints["na_ao"] = _load_twoindex_g09(lit, nbasis)
         elif line.startswith(" *** Dumping Two-Electron integrals ***"):
-            two_ints["er_ao"] = _load_fourindex_g09(lit, nbasis)
+            two_ints["er_ao"] = _load_fourindex_g09(lit, nbasis, packed)
 
     result = {}
     if one_ints:
@@ -95,24 +107,33 @@ def _load_twoindex_g09(lit: LineIterator, nbasis: int) -> NDArray[float]:
     Operator array with shape ``(nbasis, nbasis)``.
 
     """
-    result = np.zeros((nbasis, nbasis))
+    # Collect the words of the lower triangle, which is printed in blocks of
+    # (at most) five columns, and convert them all at once.
+    words = []
     block_counter = 0
     while block_counter < nbasis:
         # skip the header line
         next(lit)
         # determine the number of rows in this part
         nrow = nbasis - block_counter
-        for i in range(nrow):
-            words = next(lit).split()[1:]
-            for j, word in enumerate(words):
-                value = float(word.replace("D", "E"))
-                result[i + block_counter, j + block_counter] = value
-                result[j + block_counter, i + block_counter] = value
+        for _i in range(nrow):
+            words.extend(next(lit).split()[1:])
         block_counter += 5
+    values = np.array(" ".join(words).replace("D", "E").split(), float)
+    # Row and column indices of the lower triangle, in the order of printing.
+    rows, cols = np.tril_indices(nbasis)
+    order = np.lexsort((cols, rows, cols // 5))
+    rows = rows[order]
+    cols = cols[order]
+    result = np.zeros((nbasis, nbasis))
+    result[rows, cols] = values
+    result[cols, rows] = values
     return result
 
 
-def _load_fourindex_g09(lit: LineIterator, nbasis: int) -> NDArray[float]:
+def _load_fourindex_g09(
+    lit: LineIterator, nbasis: int, packed: bool = False
+) -> Union[NDArray[float], PackedFourIndex]:
     """Load a four-index operator from a GAUSSIAN LOG file.
 
     Parameters
@@ -121,28 +142,60 @@ def _load_fourindex_g09(lit: LineIterator, nbasis: int) -> NDArray[float]:
         The line iterator to read the data from.
     nbasis
         The number of atomic orbital basis functions.
+    packed
+        When True, a packed four-index object is returned instead of a dense array.
 
     Returns
     -------
     Operator array with shape ``(nbasis, nbasis, nbasis, nbasis)``.
 
     """
-    result = np.zeros((nbasis, nbasis, nbasis, nbasis))
     # Skip first six lines
     for _i in range(6):
         next(lit)
-    # Start reading elements until a line is encountered that does not start
-    # with ' I='
+    # Collect all lines until a line is encountered that does not start with ' I='
+    records = []
     for line in lit:
         if not line.startswith(" I="):
             break
-        # print line[3:7], line[9:13], line[15:19], line[21:25], line[28:].replace('D', 'E')
-        i0 = int(line[3:7]) - 1
-        i1 = int(line[9:13]) - 1
-        i2 = int(line[15:19]) - 1
-        i3 = int(line[21:25]) - 1
-        value = float(line[29:].replace("D", "E"))
-        # Gaussian uses the chemists' notation for the 4-center indexes. IOdata
-        # uses the physicists' notation.
-        set_four_index_element(result, i0, i2, i1, i3, value)
+        records.append(line.rstrip())
+    i0, i1, i2, i3, values = _parse_fourindex_records(records)
+    if packed:
+        return PackedFourIndex.from_elements(nbasis, i0, i1, i2, i3, values, "chemists")
+    # Gaussian uses the chemists' notation for the 4-center indexes. IOdata
+    # uses the physicists' notation.
+    result = np.zeros((nbasis, nbasis, nbasis, nbasis))
+    set_four_index_element(result, i0, i2, i1, i3, values)
     return result
+
+
+def _parse_fourindex_records(
+    records: list[str],
+) -> tuple[NDArray[int], NDArray[int], NDArray[int], NDArray[int], NDArray[float]]:
+    """Convert the fixed-width fields of two-electron integral records to arrays.
+
+    Parameters
+    ----------
+    records
+        Lines of the form `` I=  6 J=  2 K=  5 L=  1 Int=  0.708496640384D-02``.
+
+    Returns
+    -------
+    The zero-based indices ``I``, ``J``, ``K`` and ``L`` and the integrals.
+
+    """
+    if len(records) == 0:
+        empty = np.zeros(0, int)
+        return empty, empty, empty, empty, np.zeros(0)
+    width = max(len(record) for record in records)
+    # A two-dimensional array of characters, one row per record.
+    # Fortran double precision exponents are converted to E, which only occurs in the values.
+    text = "".join(record.ljust(width) for record in records).replace("D", "E")
+    chars = np.frombuffer(text.encode("ascii"), dtype="S1").reshape(len(records), width)
+
+    def get_field(begin, end):
+        return np.ascontiguousarray(chars[:, begin:end]).view(f"S{end - begin}").ravel()
+
+    indices = [get_field(begin, begin + 4).astype(int) - 1 for begin in (3, 9, 15, 21)]
+    values = get_field(29, width).astype(float)
+    return (*indices, values)
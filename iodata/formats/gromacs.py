@@ -28,9 +28,10 @@ http://manual.gromacs.org/current/reference-manual/file-formats.html#gro
 from collections.abc import Iterator
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ..docstrings import document_load_many, document_load_one
-from ..utils import LineIterator, nanometer, picosecond
+from ..utils import LineIterator, LoadError, nanometer, picosecond
 
 __all__ = ()
 
@@ -42,39 +43,92 @@ PATTERNS = ["*.gro"]
 def load_one(lit: LineIterator) -> dict:
     """Do not edit this docstring. It will be overwritten."""
     data = _helper_read_frame(lit)
-    title = data[0]
-    time = data[1]
-    resnums = np.array(data[2])
-    resnames = np.array(data[3])
-    attypes = np.array(data[4])
-    atcoords = data[5]
-    velocities = data[6]
-    cellvecs = data[7]
-    atffparams = {"attypes": attypes, "resnames": resnames, "resnums": resnums}
-    extra = {"time": time, "velocities": velocities}
+    return _helper_build_result(*data)
+
+
+def _helper_build_result(title, time, resnums, resnames, attypes, pos, vel, cell) -> dict:
+    """Collect the fields of one frame in a result dictionary."""
+    atffparams = {
+        "attypes": np.array(attypes),
+        "resnames": np.array(resnames),
+        "resnums": np.array(resnums),
+    }
+    extra = {"time": time, "velocities": vel}
     return {
-        "atcoords": atcoords,
+        "atcoords": pos,
         "atffparams": atffparams,
-        "cellvecs": cellvecs,
+        "cellvecs": cell,
         "extra": extra,
         "title": title,
     }
 
 
-@document_load_many("GRO", ["atcoords", "atffparams", "cellvecs", "extra", "title"])
-def load_many(lit: LineIterator) -> Iterator[dict]:
+LOAD_MANY_KWDOCS = {
+    "shared_topology": "When True, the residue and atom names and numbers are only parsed "
+    "in the first frame. For the following frames, only the positions, velocities and box "
+    "vectors are parsed, after checking that the residue and atom columns are identical "
+    "to those of the first frame. All frames then share the same atffparams arrays. "
+    "When False, every frame is loaded independently.",
+}
+
+
+@document_load_many(
+    "GRO",
+    ["atcoords", "atffparams", "cellvecs", "extra", "title"],
+    kwdocs=LOAD_MANY_KWDOCS,
+)
+def load_many(lit: LineIterator, shared_topology: bool = False) -> Iterator[dict]:
     """Do not edit this docstring. It will be overwritten."""
     # gro files can be used as trajectory by simply concatenating files,
     # making it trivial to load many frames.
     try:
+        if not shared_topology:
+            while True:
+                yield load_one(lit)
+        title, time, natoms = _helper_read_header(lit)
+        lines = _helper_read_atom_lines(lit, natoms)
+        first = _helper_build_result(
+            title, time, *_helper_parse_atoms(lines), _helper_read_cell(lit)
+        )
+        yield first
+        topology = _helper_get_topology(lines)
         while True:
-            yield load_one(lit)
+            title, time, natoms = _helper_read_header(lit)
+            lines = _helper_read_atom_lines(lit, natoms)
+            if _helper_get_topology(lines) != topology:
+                raise LoadError("The atoms differ from those in the first frame.", lit)
+            pos, vel = _helper_parse_coordinates(lines)
+            yield {
+                **first,
+                "atcoords": pos,
+                "atffparams": dict(first["atffparams"]),
+                "cellvecs": _helper_read_cell(lit),
+                "extra": {"time": time, "velocities": vel},
+                "title": title,
+            }
     except StopIteration:
         return
 
 
+def skip_frame(lit: LineIterator):
+    """Skip one frame without parsing it, raising StopIteration after the last frame."""
+    # Skip the title, the atom lines and the box vectors.
+    next(lit)
+    _helper_read_atom_lines(lit, int(next(lit)))
+    next(lit)
+
+
 def _helper_read_frame(lit: LineIterator) -> tuple:
     """Read one frame."""
+    title, time, natoms = _helper_read_header(lit)
+    lines = _helper_read_atom_lines(lit, natoms)
+    resnums, resnames, attypes, pos, vel = _helper_parse_atoms(lines)
+    cell = _helper_read_cell(lit)
+    return title, time, resnums, resnames, attypes, pos, vel, cell
+
+
+def _helper_read_header(lit: LineIterator) -> tuple[str, float, int]:
+    """Read the title, the time and the number of atoms."""
     # Read the first line, get the title and try to get the time.
     # Time field is optional.
     line = next(lit)
@@ -84,27 +138,62 @@ def _helper_read_frame(lit: LineIterator) -> tuple:
         time = float(line.split("t=")[1]) * picosecond
     # Read the second line for number of atoms.
     natoms = int(next(lit))
-    # Read the atom lines
-    resnums = []
-    resnames = []
-    attypes = []
-    pos = np.zeros((natoms, 3), np.float32)
-    vel = np.zeros((natoms, 3), np.float32)
-    for i in range(natoms):
-        line = next(lit)
-        resnums.append(int(line[:5]))
-        resnames.append(line[5:10].split()[-1])
-        attypes.append(line[10:15].split()[-1])
-        words = line[22:].split()
-        pos[i, 0] = float(words[0])
-        pos[i, 1] = float(words[1])
-        pos[i, 2] = float(words[2])
-        vel[i, 0] = float(words[3])
-        vel[i, 1] = float(words[4])
-        vel[i, 2] = float(words[5])
+    return title, time, natoms
+
+
+def _helper_read_atom_lines(lit: LineIterator, natoms: int) -> list[str]:
+    """Read the atom lines, raising StopIteration when the file ends too early."""
+    lines = lit.next_lines(natoms)
+    if len(lines) < natoms:
+        raise StopIteration
+    return lines
+
+
+def _helper_parse_atoms(lines: list[str]) -> tuple:
+    """Parse all fields of the atom lines."""
+    resnums = _helper_unwrap(np.array([line[:5] for line in lines]).astype(int))
+    resnames = [line[5:10].split()[-1] for line in lines]
+    attypes = [line[10:15].split()[-1] for line in lines]
+    pos, vel = _helper_parse_coordinates(lines)
+    return resnums, resnames, attypes, pos, vel
+
+
+def _helper_unwrap(numbers: NDArray[int], modulus: int = 100000) -> NDArray[int]:
+    """Undo the wrapping of residue or atom numbers that do not fit in five columns.
+
+    GROMACS writes these numbers modulo 100000. A decrease by more than half
+    the modulus, e.g. from 99999 to 0, is interpreted as such a wrap-around.
+    Smaller decreases, e.g. when the numbering restarts for a new chain,
+    are left untouched.
+    """
+    wraps = np.diff(numbers) < -(modulus // 2)
+    if not wraps.any():
+        return numbers
+    return numbers + modulus * np.concatenate([[0], np.cumsum(wraps)])
+
+
+def _helper_get_topology(lines: list[str]) -> str:
+    """Return the residue and atom names and numbers of all atom lines as one string."""
+    return "".join(line[:15] for line in lines)
+
+
+def _helper_parse_coordinates(lines: list[str]) -> tuple:
+    """Parse only the positions and the velocities of the atom lines."""
+    natoms = len(lines)
+    words = " ".join(line[22:] for line in lines).split()
+    if len(words) != 6 * natoms:
+        # Some lines contain additional columns, which are ignored.
+        words = [word for line in lines for word in line[22:].split()[:6]]
+    values = np.array(words, float).reshape(natoms, 6).astype(np.float32)
+    pos = values[:, :3].copy()
+    vel = values[:, 3:].copy()
     pos *= nanometer  # atom coordinates are in nanometers
     vel *= nanometer / picosecond
-    # Read the cell line
+    return pos, vel
+
+
+def _helper_read_cell(lit: LineIterator) -> NDArray[float]:
+    """Read the box vectors."""
     cell = np.zeros((3, 3), np.float32)
     words = next(lit).split()
     if len(words) >= 3:
@@ -119,4 +208,4 @@ def _helper_read_frame(lit: LineIterator) -> tuple:
         cell[0, 2] = float(words[7])
         cell[1, 2] = float(words[8])
     cell *= nanometer
-    return title, time, resnums, resnames, attypes, pos, vel, cell
+    return cell
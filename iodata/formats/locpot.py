@@ -25,9 +25,12 @@ Note that even though the ``CHGCAR`` and ``LOCPOT`` files look very similar, the
 different conversions to atomic units.
 """
 
+from typing import Optional, Union
+
 from ..docstrings import document_load_one
 from ..utils import LineIterator, electronvolt
 from .chgcar import _load_vasp_grid
+from .cube import GRID_SELECTION_KWDOCS
 
 __all__ = ()
 
@@ -35,10 +38,19 @@ __all__ = ()
 PATTERNS = ["LOCPOT*"]
 
 
-@document_load_one("VASP 5 LOCPOT", ["atcoords", "atnums", "cellvecs", "cube", "title"])
-def load_one(lit: LineIterator) -> dict:
+@document_load_one(
+    "VASP 5 LOCPOT",
+    ["atcoords", "atnums", "cellvecs", "cube", "title"],
+    [],
+    GRID_SELECTION_KWDOCS,
+)
+def load_one(
+    lit: LineIterator,
+    region: Optional[tuple[slice, slice, slice]] = None,
+    stride: Optional[Union[int, tuple[int, int, int]]] = None,
+) -> dict:
     """Do not edit this docstring. It will be overwritten."""
-    result = _load_vasp_grid(lit)
+    result = _load_vasp_grid(lit, region, stride)
     # convert locpot to atomic units
     result["cube"].data[:] *= electronvolt
     return result
@@ -22,8 +22,9 @@ There are different formats of mol2 files. Here the compatibility with AMBER sof
 was the main objective to write out files with atomic charges used by antechamber.
 """
 
+import re
 from collections.abc import Iterator
-from typing import TextIO
+from typing import Callable, Optional, TextIO
 from warnings import warn
 
 import numpy as np
@@ -36,8 +37,17 @@ from ..docstrings import (
     document_load_one,
 )
 from ..iodata import IOData
+from ..parallel import PARALLEL_KWDOCS, load_many_parallel
 from ..periodic import bond2num, num2bond, num2sym, sym2num
-from ..utils import LineIterator, LoadError, LoadWarning, angstrom
+from ..utils import (
+    RECORD_KWDOCS,
+    LineIterator,
+    LoadError,
+    LoadWarning,
+    angstrom,
+    format_table,
+    iter_selected_records,
+)
 
 __all__ = ()
 
@@ -141,9 +151,72 @@ def _load_helper_bonds(lit: LineIterator, nbonds: int) -> NDArray[int]:
     return bonds
 
 
-@document_load_many("MOL2", ["atcoords", "atnums", "atcharges", "atffparams"], ["title"])
-def load_many(lit: LineIterator) -> Iterator[dict]:
+def _is_molecule_line(line: str) -> bool:
+    """Return True when the line starts a new molecule."""
+    # The substring test quickly rejects most lines.
+    return "@<TRIPOS>MOLECULE" in line and line.split(maxsplit=1)[0] == "@<TRIPOS>MOLECULE"
+
+
+def _read_header(lit: LineIterator) -> Optional[tuple[dict, list[str]]]:
+    """Read the lines up to and including the counts line of the next molecule."""
+    for line in lit:
+        if _is_molecule_line(line):
+            break
+    else:
+        return None
+    lines = [line, next(lit), next(lit)]
+    words = lines[2].split()
+    header = {"title": lines[1].strip(), "natom": int(words[0]), "nbond": int(words[1])}
+    return header, lines
+
+
+def _skip_record(lit: LineIterator, header: dict):
+    """Skip all lines up to the next molecule, without parsing them."""
+    for line in lit:
+        if _is_molecule_line(line):
+            lit.back(line)
+            break
+
+
+def skip_frame(lit: LineIterator):
+    """Skip one molecule without parsing it, raising StopIteration after the last one."""
+    header_lines = _read_header(lit)
+    if header_lines is None:
+        raise StopIteration
+    _skip_record(lit, header_lines[0])
+
+
+# The position before each record, used to find record boundaries without parsing.
+RECORD_BEGIN = re.compile(rb"\n(?=[ \t]*@<TRIPOS>MOLECULE\s)")
+
+
+LOAD_MANY_KWDOCS = {**PARALLEL_KWDOCS, **RECORD_KWDOCS}
+
+
+@document_load_many(
+    "MOL2", ["atcoords", "atnums", "atcharges", "atffparams"], ["title"], LOAD_MANY_KWDOCS
+)
+def load_many(
+    lit: LineIterator,
+    nworker: int = 0,
+    chunksize: int = 100,
+    where: Optional[Callable[[dict], bool]] = None,
+    records: Optional[range] = None,
+) -> Iterator[dict]:
     """Do not edit this docstring. It will be overwritten."""
+    if where is not None or records is not None:
+        if nworker > 0:
+            raise ValueError("Records cannot be selected when loading in parallel.")
+        try:
+            yield from iter_selected_records(
+                lit, _read_header, load_one, _skip_record, where, records
+            )
+        except LoadError:
+            return
+        return
+    if nworker > 0:
+        yield from load_many_parallel(lit, __name__, RECORD_BEGIN, nworker, chunksize)
+        return
     # MOL2 files with more molecules are a simple concatenation of individual MOL2 files,'
     # making it trivial to load many frames.
     try:
@@ -157,31 +230,44 @@ def load_many(lit: LineIterator) -> Iterator[dict]:
 def dump_one(f: TextIO, data: IOData):
     """Do not edit this docstring. It will be overwritten."""
     # The first six lines are reserved for comments
-    print("# Mol2 file created with Iodata", file=f)
-    print("\n\n\n\n\n", file=f)
-    print("@<TRIPOS>MOLECULE", file=f)
-    print(data.title or "Created with IOData", file=f)
-    if data.bonds is not None:
-        bonds = len(data.bonds)
-        print(f"{data.natom:5d} {bonds:6d} {0:6d} {0:6d}", file=f)
-    else:
-        print(f"{data.natom:5d} {0:6d} {0:6d} {0:6d}", file=f)
-    print("@<TRIPOS>ATOM", file=f)
-    atcharges = data.atcharges.get("mol2charges")
-    attypes = data.atffparams.get("attypes")
-    for i in range(data.natom):
-        n = num2sym[data.atnums[i]]
-        x, y, z = data.atcoords[i] / angstrom
-        out1 = f"{i+1:7d} {n:2s} {x:15.4f} {y:9.4f} {z:9.4f} "
-        atcharge = 0.0 if atcharges is None else atcharges[i]
-        attype = n if attypes is None else attypes[i]
-        out2 = f"{attype:6s} {1:4d} XXX {atcharge:14.4f}"
-        print(out1 + out2, file=f)
+    nbond = 0 if data.bonds is None else len(data.bonds)
+    parts = [
+        "# Mol2 file created with Iodata\n\n\n\n\n\n\n",
+        "@<TRIPOS>MOLECULE\n",
+        f"{data.title or 'Created with IOData'}\n",
+        f"{data.natom:5d} {nbond:6d} {0:6d} {0:6d}\n",
+        "@<TRIPOS>ATOM\n",
+    ]
+    symbols = [num2sym[atnum] for atnum in data.atnums]
+    atcoords = data.atcoords / angstrom
+    parts.append(
+        format_table(
+            "%7d %-2s %15.4f %9.4f %9.4f %-6s    1 XXX %14.4f",
+            [
+                np.arange(1, data.natom + 1),
+                symbols,
+                atcoords[:, 0],
+                atcoords[:, 1],
+                atcoords[:, 2],
+                data.atffparams.get("attypes", symbols),
+                data.atcharges.get("mol2charges", np.zeros(data.natom)),
+            ],
+        )
+    )
     if data.bonds is not None:
-        print("@<TRIPOS>BOND", file=f)
-        for i, bond in enumerate(data.bonds):
-            bondtype = num2bond.get(bond[2], "un")
-            print(f"{i+1:6d} {bond[0]+1:4d} {bond[1]+1:4d} {bondtype:2s}", file=f)
+        parts.append("@<TRIPOS>BOND\n")
+        parts.append(
+            format_table(
+                "%6d %4d %4d %-2s",
+                [
+                    np.arange(1, nbond + 1),
+                    data.bonds[:, 0] + 1,
+                    data.bonds[:, 1] + 1,
+                    [num2bond.get(bondtype, "un") for bondtype in data.bonds[:, 2].tolist()],
+                ],
+            )
+        )
+    f.write("".join(parts))
 
 
 @document_dump_many("MOL2", ["atcoords", "atnums", "atcharges"], ["title"])
@@ -26,7 +26,7 @@ errors are corrected when loading them with IOData.
 """
 
 import copy
-from typing import TextIO, Union
+from typing import Optional, TextIO, Union
 from warnings import warn
 
 import attrs
@@ -41,7 +41,15 @@ from ..orbitals import MolecularOrbitals
 from ..overlap import compute_overlap, gob_cart_normalization
 from ..periodic import num2sym, sym2num
 from ..prepare import prepare_segmented, prepare_unrestricted_aminusb
-from ..utils import DumpError, LineIterator, LoadError, LoadWarning, PrepareDumpError, angstrom
+from ..utils import (
+    DumpError,
+    LineIterator,
+    LoadError,
+    LoadWarning,
+    PrepareDumpError,
+    angstrom,
+    format_lines,
+)
 
 __all__ = ()
 
@@ -285,13 +293,17 @@ def _load_helper_obasis(lit: LineIterator) -> MolecularBasis:
 def _load_helper_coeffs(lit: LineIterator) -> tuple:
     """Load the orbital coefficients."""
     occsa = []
-    coeffsa = []
     energiesa = []
     irrepsa = []
     occsb = []
-    coeffsb = []
     energiesb = []
     irrepsb = []
+    # Coefficients are stored in preallocated Fortran-ordered arrays, one column
+    # per orbital, which are enlarged when needed.
+    coeffs = {"alpha": np.zeros((0, 0), order="F"), "beta": None}
+    norbs = {"alpha": 0, "beta": 0}
+    # The number of coefficients of the first orbital, used for all other orbitals.
+    nbasis = None
 
     while True:
         try:
@@ -319,43 +331,85 @@ def _load_helper_coeffs(lit: LineIterator) -> tuple:
             key, value = line.split("=")
             info[key.strip().lower()] = value
         occ = float(info["occup"])
-        col = []
         energy = float(info["ene"])
         irrep = info.get("sym", "??").strip()
         # store column of coefficients, i.e. one orbital, energy and occ
-        if info["spin"].strip().lower() == "alpha":
+        spin = "alpha" if info["spin"].strip().lower() == "alpha" else "beta"
+        if spin == "alpha":
             occsa.append(occ)
-            coeffsa.append(col)
             energiesa.append(energy)
             irrepsa.append(irrep)
         else:
             occsb.append(occ)
-            coeffsb.append(col)
             energiesb.append(energy)
             irrepsb.append(irrep)
-        for line in lit:
-            words = line.split()
-            if len(words) != 2 or not words[0].isdigit():
-                # The line does not look like an index with an orbital coefficient.
-                # Time to stop and put the line back
-                lit.back(line)
-                break
-            col.append(float(words[1]))
-
-    coeffsa = np.array(coeffsa).T
+        col = _load_helper_coeff_column(lit, nbasis)
+        if nbasis is None:
+            nbasis = len(col)
+        elif len(col) != nbasis:
+            raise LoadError(f"Expecting {nbasis} orbital coefficients, got {len(col)}.", lit)
+        norb = norbs[spin]
+        if norb == 0:
+            coeffs[spin] = np.zeros((nbasis, max(nbasis, 1)), order="F")
+        elif norb == coeffs[spin].shape[1]:
+            larger = np.zeros((nbasis, 2 * norb), order="F")
+            larger[:, :norb] = coeffs[spin]
+            coeffs[spin] = larger
+        coeffs[spin][:, norb] = col
+        norbs[spin] = norb + 1
+
+    coeffsa = coeffs["alpha"][:, : norbs["alpha"]]
     energiesa = np.array(energiesa)
     occsa = np.array(occsa)
-    if not coeffsb:
+    if norbs["beta"] == 0:
         coeffsb = None
         energiesb = None
         occsb = None
     else:
-        coeffsb = np.array(coeffsb).T
+        coeffsb = coeffs["beta"][:, : norbs["beta"]]
         energiesb = np.array(energiesb)
         occsb = np.array(occsb)
     return (occsa, coeffsa, energiesa, irrepsa), (occsb, coeffsb, energiesb, irrepsb)
 
 
+def _load_helper_coeff_column(lit: LineIterator, nbasis: Optional[int]) -> NDArray[float]:
+    """Load the coefficients of one orbital.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from, positioned at the first line with
+        an index and a coefficient.
+    nbasis
+        The expected number of coefficients, if known.
+        When given, the coefficients are parsed as one block of lines.
+
+    Returns
+    -------
+    The orbital coefficients.
+
+    """
+    if nbasis is not None:
+        lines = lit.next_lines(nbasis)
+        words = " ".join(lines).split()
+        if len(lines) == nbasis and len(words) == 2 * nbasis and "".join(words[::2]).isdigit():
+            return np.array(words[1::2], dtype=float)
+        # The block does not consist of nbasis lines with an index and a coefficient.
+        # Put the lines back and parse them one by one.
+        for line in reversed(lines):
+            lit.back(line)
+    col = []
+    for line in lit:
+        words = line.split()
+        if len(words) != 2 or not words[0].isdigit():
+            # The line does not look like an index with an orbital coefficient.
+            # Time to stop and put the line back
+            lit.back(line)
+            break
+        col.append(float(words[1]))
+    return np.array(col)
+
+
 def _is_normalized_properly(
     obasis: MolecularBasis,
     atcoords: NDArray[float],
@@ -921,14 +975,14 @@ def dump_one(f: TextIO, data: IOData):
 
 
 def _dump_helper_orb(f, spin, occs, coeffs, energies, irreps):
+    # The original molden floating-point formatting is too low
+    # precision. Molden also reads high-precision, so we use this
+    # instead of '{:4d} {:10.6f}'.
+    prefixes = [f"{ibasis + 1:4d} " for ibasis in range(coeffs.shape[0])]
     for ifn in range(coeffs.shape[1]):
-        f.write(f" Ene= {energies[ifn]:.17e}\n")
-        f.write(f" Sym= {irreps[ifn]}\n")
-        f.write(f" Spin= {spin}\n")
-        f.write(f" Occup= {occs[ifn]:.17e}\n")
-        for ibasis in range(coeffs.shape[0]):
-            # The original molden floating-point formatting is too low
-            # precision. Molden also reads high-precision, so we use this
-            # instead.
-            # f.write('{:4d} {:10.6f}\n'.format(ibasis + 1, orb_coeffs[ibasis, ifn]))
-            f.write(f"{ibasis + 1:4d} {coeffs[ibasis, ifn]:.17e}\n")
+        f.write(
+            f" Ene= {energies[ifn]:.17e}\n"
+            f" Sym= {irreps[ifn]}\n"
+            f" Spin= {spin}\n"
+            f" Occup= {occs[ifn]:.17e}\n" + format_lines("%.17e", coeffs[:, ifn], 1, prefixes)
+        )
@@ -35,7 +35,15 @@ from ..docstrings import document_dump_one, document_load_one
 from ..iodata import IOData
 from ..orbitals import MolecularOrbitals
 from ..prepare import prepare_segmented, prepare_unrestricted_aminusb
-from ..utils import DumpError, LineIterator, LoadError, LoadWarning, PrepareDumpError, angstrom
+from ..utils import (
+    DumpError,
+    LineIterator,
+    LoadError,
+    LoadWarning,
+    PrepareDumpError,
+    angstrom,
+    format_lines,
+)
 from .molden import CONVENTIONS, _fix_molden_from_buggy_codes
 
 __all__ = ()
@@ -114,46 +122,49 @@ def _load_helper_obasis(lit: LineIterator) -> MolecularBasis:
 def _load_helper_coeffs(
     lit: LineIterator, nbasis: int
 ) -> tuple[NDArray[float], NDArray[float], list]:
-    coeffs = []
+    # The coefficients are stored in a preallocated Fortran-ordered array, one
+    # column per orbital, which is enlarged when needed.
+    coeffs = np.zeros((nbasis, nbasis), order="F")
+    norb = 0
     energies = []
     irreps = []
 
-    in_orb = 0
     for line in lit:
         if line.strip() == "$END":
             break
-        if in_orb == 0:
-            # read a1g line
-            words = line.split()
-            ncol = len(words)
-            if ncol == 0:
-                raise LoadError("Expect irrep, got empty line", line)
-            irreps.extend(words)
-            cols = [np.zeros((nbasis, 1), float) for _ in range(ncol)]
-            in_orb = 1
-        elif in_orb == 1:
-            # read energies
-            words = line.split()
-            if len(words) != ncol:
-                raise LoadError(f"Wrong number of energies: expected {ncol}, got {len(words)}", lit)
-            energies.extend(float(word) for word in words)
-            in_orb = 2
-            ibasis = 0
-        elif in_orb == 2:
-            # read expansion coefficients
-            words = line.split()
-            if len(words) != ncol:
-                raise LoadError(
-                    f"Wrong number of coefficients: expected {ncol}, got {len(words)}", lit
-                )
-            for icol in range(ncol):
-                cols[icol][ibasis] = float(words[icol])
-            ibasis += 1
-            if ibasis == nbasis:
-                in_orb = 0
-                coeffs.extend(cols)
-
-    return np.hstack(coeffs), np.array(energies), irreps
+        # read a1g line
+        words = line.split()
+        ncol = len(words)
+        if ncol == 0:
+            raise LoadError("Expect irrep, got empty line", line)
+        irreps.extend(words)
+        # read energies
+        words = next(lit).split()
+        if len(words) != ncol:
+            raise LoadError(f"Wrong number of energies: expected {ncol}, got {len(words)}", lit)
+        energies.extend(float(word) for word in words)
+        # read expansion coefficients, all lines of this block at once.
+        lines = lit.next_lines(nbasis)
+        if len(lines) < nbasis:
+            raise LoadError("File ended before all data was read.", lit)
+        words = " ".join(lines).split()
+        if len(words) != ncol * nbasis:
+            for iline, coeff_line in enumerate(lines):
+                nword = len(coeff_line.split())
+                if nword != ncol:
+                    raise LoadError(
+                        f"Wrong number of coefficients: expected {ncol}, got {nword}",
+                        lit,
+                        lit.lineno - nbasis + iline + 1,
+                    )
+        if norb + ncol > coeffs.shape[1]:
+            larger = np.zeros((nbasis, 2 * (norb + ncol)), order="F")
+            larger[:, :norb] = coeffs[:, :norb]
+            coeffs = larger
+        coeffs[:, norb : norb + ncol] = np.array(words, dtype=float).reshape(nbasis, ncol)
+        norb += ncol
+
+    return coeffs[:, :norb], np.array(energies), irreps
 
 
 def _load_helper_occ(lit: LineIterator) -> NDArray[float]:
@@ -412,13 +423,14 @@ def _dump_helper_coeffs(f, data, spin=None):
         raise DumpError("A spin must be specified", f)
 
     for j in range(0, norb, 5):
-        en = " ".join([f"   {e: ,.12f}" for e in ener[j : j + 5]])
         irre = " ".join([f"{irr}" for irr in irreps[j : j + 5]])
-        f.write(irre + "\n")
-        f.write(en + "\n")
-        for orb in coeff[:, j : j + 5]:
-            coeffs = " ".join([f"  {c: ,.12f}" for c in orb])
-            f.write(coeffs + "\n")
+        block = coeff[:, j : j + 5]
+        f.write(
+            irre
+            + "\n"
+            + _format_values(ener[j : j + 5], 5, "   ")
+            + _format_values(block.ravel(), block.shape[1], "  ")
+        )
 
     f.write(" $END\n")
     f.write("\n")
@@ -441,3 +453,18 @@ def _dump_helper_occ(f, data, spin=None):
         occs = " ".join([f"  {o: ,.7f}" for o in occ[j : j + 5]])
         f.write(occs + "\n")
     f.write(" $END\n")
+
+
+def _format_values(values: NDArray[float], nper_line: int, indent: str) -> str:
+    """Format energies or coefficients, ``nper_line`` per line, as ``f"{indent}{value: ,.12f}"``.
+
+    All values are formatted at once, unless one of them is large enough to
+    need a thousands separator, which is not supported by %-style formatting.
+    """
+    values = np.asarray(values)
+    if not np.any(abs(values) >= 999.5):
+        return format_lines(f"{indent}% .12f", values, nper_line, sep=" ")
+    return "".join(
+        " ".join(f"{indent}{value: ,.12f}" for value in values[i : i + nper_line]) + "\n"
+        for i in range(0, len(values), nper_line)
+    )
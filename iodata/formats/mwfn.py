@@ -18,20 +18,34 @@
 # --
 """Multiwfn MWFN file format."""
 
+import mmap
+import re
+from typing import Optional
+
+import attrs
 import numpy as np
 from numpy.typing import NDArray
 
+from ..attrutils import validate_shape
 from ..basis import MolecularBasis, Shell
 from ..convert import HORTON2_CONVENTIONS
 from ..docstrings import document_load_one
 from ..orbitals import MolecularOrbitals
-from ..utils import LineIterator, LoadError, angstrom
+from ..utils import (
+    LineIterator,
+    LoadError,
+    angstrom,
+    parse_fortran_fields,
+    read_fortran_fields,
+)
 
 __all__ = ()
 
 
 PATTERNS = ["*.mwfn"]
 
+BLANK_LINE = re.compile(rb"\n[ \t\r]*\n")
+
 
 # From the MWFN chemrxiv paper
 # https://chemrxiv.org/articles/Mwfn_A_Strict_Concise_and_Extensible_Format
@@ -194,16 +208,56 @@ def _load_helper_section(
     return np.array(section, dtype)
 
 
-def _load_helper_mo(lit: LineIterator, n_basis: int, n_mo: int) -> dict:
-    """Read molecular orbitals section typically labelled '# Orbital information'."""
+def _parse_mo_header(lines: list[str]) -> tuple[int, int, float, float, str]:
+    """Parse the Index, Type, Energy, Occ and Sym lines of one orbital record."""
+    return (
+        int(lines[0].split()[1]),
+        int(lines[1].split()[1]),
+        float(lines[2].split()[1]),
+        float(lines[3].split()[1]),
+        lines[4].split()[1],
+    )
+
+
+def _select_orbitals(mo_kind: str, nindbasis: int, orbitals: Optional[slice]) -> NDArray[int]:
+    """Translate a window of orbitals into indices of orbital records.
+
+    For unrestricted wavefunctions, the window is applied to the alpha and the beta
+    orbitals separately. (The alpha orbitals precede the beta orbitals in MWFN files.)
+    """
+    num_mo = 2 * nindbasis if mo_kind == "unrestricted" else nindbasis
+    if orbitals is None:
+        return np.arange(num_mo)
+    selection = np.arange(nindbasis)[orbitals]
+    if mo_kind == "unrestricted":
+        selection = np.concatenate([selection, nindbasis + selection])
+    return selection
+
+
+def _load_helper_mo(
+    lit: LineIterator, n_basis: int, n_mo: int, selection: Optional[NDArray[int]] = None
+) -> dict:
+    """Read molecular orbitals section typically labelled '# Orbital information'.
+
+    The orbital energies, occupation numbers, etc. are read for all orbitals,
+    while the coefficients are only parsed for the orbital records in ``selection``.
+    The lines with coefficients of the other orbitals are skipped.
+    """
+    if selection is None:
+        selection = np.arange(n_mo)
+    columns = np.full(n_mo, -1)
+    columns[selection] = np.arange(len(selection))
     data = {
         "mo_numbers": np.empty(n_mo, int),
         "mo_type": np.empty(n_mo, int),
         "mo_energies": np.empty(n_mo, float),
         "mo_occs": np.empty(n_mo, float),
         "mo_sym": np.empty(n_mo, str),
-        "mo_coeffs": np.empty([n_basis, n_mo], float),
+        "mo_coeffs": np.empty([n_basis, len(selection)], float),
+        "mo_selection": selection,
     }
+    # FORMAT (5E16.8)
+    nline = -(-n_basis // 5)
 
     for index in range(n_mo):
         line = next(lit)
@@ -211,20 +265,26 @@ def _load_helper_mo(lit: LineIterator, n_basis: int, n_mo: int) -> dict:
             line = next(lit)
         if not line.startswith("Index"):
             raise LoadError(f"Expecting line starting with 'Index', got '{line}'", lit)
-        data["mo_numbers"][index] = line.split()[1]
-        data["mo_type"][index] = next(lit).split()[1]
-        data["mo_energies"][index] = next(lit).split()[1]
-        data["mo_occs"][index] = next(lit).split()[1]
-        data["mo_sym"][index] = next(lit).split()[1]
+        (
+            data["mo_numbers"][index],
+            data["mo_type"][index],
+            data["mo_energies"][index],
+            data["mo_occs"][index],
+            data["mo_sym"][index],
+        ) = _parse_mo_header([line, *lit.next_lines(4)])
         # skip "$Coeff line
         next(lit)
-        data["mo_coeffs"][:, index] = _load_helper_section(lit, n_basis, "", 0, float)
+        if columns[index] >= 0:
+            data["mo_coeffs"][:, columns[index]] = read_fortran_fields(lit, n_basis, 16, 5)
+        else:
+            # Lines with fewer coefficients are taken care of by looking for the next Index.
+            lit.next_lines(nline)
 
     return data
 
 
-def _load_mwfn_low(lit: LineIterator) -> dict:
-    """Load data from a MWFN file into arrays.
+def _load_mwfn_header(lit: LineIterator) -> dict:
+    """Load everything from a MWFN file up to the orbital records.
 
     Parameters
     ----------
@@ -259,10 +319,26 @@ def _load_mwfn_low(lit: LineIterator) -> dict:
     # load primitive exponents & coefficients
     if not next(lit).startswith("$Primitive exponents"):
         raise LoadError("Expected '$Primitive exponents' section.", lit)
-    data["exponents"] = _load_helper_section(lit, data["Nprimshell"], "", 0, float)
+    # FORMAT (5E16.8)
+    data["exponents"] = read_fortran_fields(lit, data["Nprimshell"], 16, 5)
     if not next(lit).startswith("$Contraction coefficients"):
         raise LoadError("Expected '$Contraction coefficients' section.", lit)
-    data["coeffs"] = _load_helper_section(lit, data["Nprimshell"], "", 0, float)
+    data["coeffs"] = read_fortran_fields(lit, data["Nprimshell"], 16, 5)
+    return data
+
+
+def _load_mwfn_low(lit: LineIterator, orbitals: Optional[slice] = None) -> dict:
+    """Load data from a MWFN file into arrays.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from.
+    orbitals
+        A window of orbitals whose coefficients are loaded. When not given,
+        all coefficients are loaded.
+    """
+    data = _load_mwfn_header(lit)
 
     # get number of basis & molecular orbitals (MO)
     # Note: MWFN includes virtual orbitals, so num_mo equals number independent basis functions
@@ -271,23 +347,159 @@ def _load_mwfn_low(lit: LineIterator) -> dict:
     if data["mo_kind"] == "unrestricted":
         num_mo *= 2
     # load MO information
-    data.update(_load_helper_mo(lit, num_basis, num_mo))
+    selection = _select_orbitals(data["mo_kind"], num_basis, orbitals)
+    data.update(_load_helper_mo(lit, num_basis, num_mo, selection))
 
     return data
 
 
+@attrs.define
+class OrbitalIndex:
+    """The orbital records of a MWFN file, with coefficients that are loaded on demand.
+
+    Use :py:func:`index_orbitals` to create an instance.
+    """
+
+    filename: str = attrs.field()
+    """The MWFN file."""
+
+    nbasis: int = attrs.field()
+    """The number of coefficients of one orbital."""
+
+    numbers: NDArray[int] = attrs.field(validator=validate_shape(None))
+    """The orbital numbers in the Index fields."""
+
+    types: NDArray[int] = attrs.field(validator=validate_shape(("numbers", 0)))
+    """The orbital types: 0 for restricted, 1 for alpha and 2 for beta orbitals."""
+
+    energies: NDArray[float] = attrs.field(validator=validate_shape(("numbers", 0)))
+    """The orbital energies."""
+
+    occs: NDArray[float] = attrs.field(validator=validate_shape(("numbers", 0)))
+    """The occupation numbers."""
+
+    syms: NDArray[str] = attrs.field(validator=validate_shape(("numbers", 0)))
+    """The symmetry labels."""
+
+    offsets: NDArray[int] = attrs.field(validator=validate_shape(("numbers", 0), 2))
+    """The byte offsets of the beginning and the end of the coefficients of each orbital."""
+
+    @property
+    def norb(self) -> int:
+        """Return the number of orbital records."""
+        return len(self.numbers)
+
+    def load_coeffs(self, indices) -> NDArray[float]:
+        """Load the coefficients of selected orbitals.
+
+        Parameters
+        ----------
+        indices
+            A slice, an integer or an array of integers, selecting orbital records.
+
+        Returns
+        -------
+        An array with shape ``(nbasis, n)``, with one column per selected orbital.
+
+        """
+        indices = np.atleast_1d(np.arange(self.norb)[indices])
+        coeffs = np.empty((self.nbasis, len(indices)))
+        with open(self.filename, "rb") as f:
+            for icol, index in enumerate(indices):
+                begin, end = self.offsets[index]
+                f.seek(begin)
+                lines = f.read(end - begin).decode("ascii").splitlines()
+                try:
+                    column = parse_fortran_fields(lines, 16)
+                except ValueError as exc:
+                    raise LoadError(
+                        f"Could not read coefficients of orbital {index}.", self.filename
+                    ) from exc
+                if len(column) != self.nbasis:
+                    raise LoadError(
+                        f"Expecting {self.nbasis} coefficients for orbital {index}, "
+                        f"got {len(column)}.",
+                        self.filename,
+                    )
+                coeffs[:, icol] = column
+        return coeffs
+
+
+def index_orbitals(filename: str) -> OrbitalIndex:
+    """Locate the orbital records in a MWFN file, without parsing the coefficients.
+
+    Parameters
+    ----------
+    filename
+        The MWFN file.
+
+    Returns
+    -------
+    An index with the energies, occupation numbers, etc. of all orbitals.
+    The coefficients can be loaded afterwards with
+    :py:meth:`OrbitalIndex.load_coeffs`.
+
+    """
+    with LineIterator(filename) as lit:
+        header = _load_mwfn_header(lit)
+    records = []
+    with open(filename, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as buf:
+        begin = buf.find(b"\nIndex=")
+        while begin >= 0:
+            coeff = buf.find(b"$Coeff", begin)
+            if coeff < 0:
+                raise LoadError("Expected '$Coeff' after 'Index='.", filename)
+            lines = buf[begin + 1 : coeff].decode("ascii").splitlines()
+            begin = buf.find(b"\n", coeff) + 1
+            # The coefficients end with a blank line or at the next record.
+            blank = BLANK_LINE.search(buf, begin)
+            end = buf.find(b"\nIndex=", begin)
+            stop = min(
+                len(buf) if blank is None else blank.start() + 1,
+                len(buf) if end < 0 else end + 1,
+            )
+            records.append((*_parse_mo_header(lines), begin, stop))
+            begin = end
+    nindbasis = header["Nindbasis"]
+    num_mo = 2 * nindbasis if header["mo_kind"] == "unrestricted" else nindbasis
+    if len(records) != num_mo:
+        raise LoadError(f"Expecting {num_mo} orbital records, found {len(records)}.", filename)
+    numbers, types, energies, occs, syms, begins, ends = zip(*records)
+    return OrbitalIndex(
+        filename,
+        nindbasis,
+        np.array(numbers),
+        np.array(types),
+        np.array(energies),
+        np.array(occs),
+        np.array(syms),
+        np.array([begins, ends]).T,
+    )
+
+
+LOAD_ONE_KWDOCS = {
+    "orbitals": "A slice selecting a window of orbitals to be loaded, e.g. ``slice(0, 10)``. "
+    "For unrestricted wavefunctions, it is applied to the alpha and the beta orbitals "
+    "separately. The coefficients of the other orbitals are not parsed. "
+    "When not given, all orbitals are loaded.",
+}
+
+
 @document_load_one(
-    "MWFN", ["atcoords", "atnums", "atcorenums", "energy", "mo", "obasis", "extra", "title"]
+    "MWFN",
+    ["atcoords", "atnums", "atcorenums", "energy", "mo", "obasis", "extra", "title"],
+    kwdocs=LOAD_ONE_KWDOCS,
 )
-def load_one(lit: LineIterator) -> dict:
+def load_one(lit: LineIterator, orbitals: Optional[slice] = None) -> dict:
     """Do not edit this docstring. It will be overwritten."""
-    inp = _load_mwfn_low(lit)
+    inp = _load_mwfn_low(lit, orbitals)
+    selection = inp["mo_selection"]
 
     # store certain information loaded from MWFN in extra dictionary
     extra = {
         "wfntype": inp["Wfntype"],
         "nindbasis": inp["Nindbasis"],
-        "mo_sym": inp["mo_sym"],
+        "mo_sym": inp["mo_sym"][selection],
         "full_virial_ratio": inp["VT_ratio"],
     }
 
@@ -328,26 +540,44 @@ def load_one(lit: LineIterator) -> dict:
         norbb = (inp["mo_type"] == 2).sum()
         if (inp["mo_type"] == 0).sum() != 0:
             raise LoadError("Restricted orbtials found in unrestricted wavefunction.", lit)
+    # The electron counts are checked with the occupation numbers of all orbitals.
+    mo_all = MolecularOrbitals(inp["mo_kind"], norba, norbb, inp["mo_occs"])
+    if orbitals is not None:
+        # The window was applied under the assumption that all alpha orbitals
+        # precede the beta orbitals.
+        nindbasis = inp["Nindbasis"]
+        if inp["mo_kind"] == "unrestricted":
+            if (inp["mo_type"][:nindbasis] != 1).any() or (inp["mo_type"][nindbasis:] != 2).any():
+                raise LoadError("Alpha orbitals must precede beta orbitals.", lit)
+            norba = norbb = len(selection) // 2
+        else:
+            norba = norbb = len(selection)
     # Build MolecularOrbitals instance
     mo = MolecularOrbitals(
-        inp["mo_kind"], norba, norbb, inp["mo_occs"], inp["mo_coeffs"], inp["mo_energies"], None
+        inp["mo_kind"],
+        norba,
+        norbb,
+        inp["mo_occs"][selection],
+        inp["mo_coeffs"],
+        inp["mo_energies"][selection],
+        None,
     )
     # check number of electrons
-    if mo.nelec != inp["Naelec"] + inp["Nbelec"]:
+    if mo_all.nelec != inp["Naelec"] + inp["Nbelec"]:
         raise LoadError(
-            f"Number of electrons in MolecularOrbitals ({mo.nelec}) is not equal to "
+            f"Number of electrons in MolecularOrbitals ({mo_all.nelec}) is not equal to "
             f"the sum of 'Naelec' and 'Nbelec' ({inp['Naelec']} + {inp['Nbelec']}).",
             lit.filename,
         )
-    if mo.occsa.sum() != inp["Naelec"]:
+    if mo_all.occsa.sum() != inp["Naelec"]:
         raise LoadError(
-            f"Number of alpha electrons in MolecularOrbitals ({mo.occsa.sum()}) "
+            f"Number of alpha electrons in MolecularOrbitals ({mo_all.occsa.sum()}) "
             f"is not equal to the 'Naelec' ({inp['Naelec']}).",
             lit.filename,
         )
-    if mo.occsb.sum() != inp["Nbelec"]:
+    if mo_all.occsb.sum() != inp["Nbelec"]:
         raise LoadError(
-            f"Number of beta electrons in MolecularOrbitals ({mo.occsb.sum()})"
+            f"Number of beta electrons in MolecularOrbitals ({mo_all.occsb.sum()})"
             f"is not equal to the 'Nbelec' ({inp['Nbelec']}).",
             lit.filename,
         )
@@ -28,6 +28,7 @@ from typing import TextIO
 from warnings import warn
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ..docstrings import (
     document_dump_many,
@@ -37,7 +38,7 @@ from ..docstrings import (
 )
 from ..iodata import IOData
 from ..periodic import bond2num, num2sym, sym2num
-from ..utils import LineIterator, LoadError, LoadWarning, angstrom
+from ..utils import LineIterator, LoadError, LoadWarning, angstrom, format_table
 
 __all__ = ()
 
@@ -45,7 +46,105 @@ __all__ = ()
 PATTERNS = ["*.pdb"]
 
 
-def _parse_pdb_atom_line(line, lit):
+# Hybrid-36 encoding of integer fields, see
+# http://cci.lbl.gov/hybrid_36/
+# Numbers that do not fit in a fixed-width decimal field are written in base 36,
+# first with upper case letters (starting at A000 for a width of 4),
+# then with lower case letters (starting at a000 for a width of 4).
+HYBRID36_DIGITS = b"0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# Lookup table from characters to base-36 digits, -1 for invalid characters.
+HYBRID36_VALUES = np.full(256, -1)
+HYBRID36_VALUES[np.frombuffer(HYBRID36_DIGITS, np.uint8)] = np.arange(36)
+HYBRID36_VALUES[np.frombuffer(HYBRID36_DIGITS.lower()[10:], np.uint8)] = np.arange(10, 36)
+
+
+def encode_hybrid36(width: int, values: NDArray[int]) -> NDArray[str]:
+    """Encode integers as hybrid-36 fields with a fixed width.
+
+    Parameters
+    ----------
+    width
+        The width of the fields, e.g. 5 for atom serial numbers and
+        4 for residue sequence numbers in PDB files.
+    values
+        The integers to be encoded.
+
+    Returns
+    -------
+    An array with right-justified strings of length ``width``.
+
+    Raises
+    ------
+    ValueError
+        When some values cannot be represented with the given width.
+
+    """
+    values = np.asarray(values, dtype=int)
+    limit = 10**width
+    block = 26 * 36 ** (width - 1)
+    if (values <= -(10 ** (width - 1))).any() or (values >= limit + 2 * block).any():
+        raise ValueError(f"Values out of range for hybrid-36 fields with width {width}.")
+    result = np.char.rjust(values.astype(str), width).astype(f"S{width}")
+    alnum = values >= limit
+    if alnum.any():
+        shifted = values[alnum] - limit + 10 * 36 ** (width - 1)
+        lower = shifted >= 36**width
+        shifted[lower] -= block
+        digits = shifted[:, None] // 36 ** np.arange(width - 1, -1, -1) % 36
+        chars = np.frombuffer(HYBRID36_DIGITS, np.uint8)[digits]
+        # Letters in the second block are written in lower case.
+        chars[lower] += (chars[lower] >= ord("A")) * np.uint8(ord("a") - ord("A"))
+        result[alnum] = chars.view(f"S{width}")[:, 0]
+    return result.astype(f"U{width}")
+
+
+def decode_hybrid36(width: int, fields: NDArray) -> NDArray[int]:
+    """Decode hybrid-36 fields with a fixed width.
+
+    Parameters
+    ----------
+    width
+        The width of the fields.
+    fields
+        An array of strings or bytes, each with ``width`` characters.
+        Decimal fields may be shorter or padded with whitespace.
+
+    Returns
+    -------
+    An integer array with the decoded values.
+
+    Raises
+    ------
+    ValueError
+        When some fields are not valid hybrid-36 literals.
+
+    """
+    fields = np.asarray(fields)
+    shape = fields.shape
+    fields = fields.ravel().astype(f"S{width}")
+    chars = fields.view(np.uint8).reshape(-1, width)
+    first = chars[:, 0]
+    upper = (first >= ord("A")) & (first <= ord("Z"))
+    lower = (first >= ord("a")) & (first <= ord("z"))
+    alnum = upper | lower
+    result = np.empty(len(fields), dtype=int)
+    result[~alnum] = fields[~alnum].astype(int)
+    if alnum.any():
+        chars = chars[alnum]
+        digits = HYBRID36_VALUES[chars]
+        # All letters in one field must have the same case.
+        mixed = np.where(
+            upper[alnum, None], chars >= ord("a"), (chars >= ord("A")) & (chars <= ord("Z"))
+        )
+        if (digits < 0).any() or mixed.any():
+            raise ValueError(f"Invalid hybrid-36 fields with width {width}.")
+        offsets = np.where(upper[alnum], -10, 16) * 36 ** (width - 1) + 10**width
+        result[alnum] = digits @ 36 ** np.arange(width - 1, -1, -1) + offsets
+    return result.reshape(shape)
+
+
+def _parse_pdb_atom_line(line, lit, lineno=None):
     """Parse an ATOM or HETATM line from a PDB file.
 
     Parameters
@@ -54,6 +153,8 @@ def _parse_pdb_atom_line(line, lit):
         A string with a single ATOM or HETATM line.
     lit
         The line iterator which read the line, used for generating warnings when needed.
+    lineno
+        The line number of the line, if it is not the last line read by ``lit``.
 
     Returns
     -------
@@ -103,14 +204,18 @@ def _parse_pdb_atom_line(line, lit):
         atname = line[12:16].strip()
         atnum = sym2num.get(atname, sym2num.get(atname[:2].title(), sym2num.get(atname[0], None)))
         warn(
-            LoadWarning("Using the atom name in the PDB file to guess the chemical element.", lit),
+            LoadWarning(
+                "Using the atom name in the PDB file to guess the chemical element.", lit, lineno
+            ),
             stacklevel=2,
         )
     if atnum is None:
         atnum = 0
         warn(
             LoadWarning(
-                f"Failed to determine the atomic number. atname='{atname}' symbol='{symbol}'", lit
+                f"Failed to determine the atomic number. atname='{atname}' symbol='{symbol}'",
+                lit,
+                lineno,
             ),
             stacklevel=2,
         )
@@ -119,7 +224,7 @@ def _parse_pdb_atom_line(line, lit):
     atname = line[12:16].strip()
     resname = line[17:20].strip()
     chainid = line[21]
-    resnum = int(line[22:26])
+    resnum = int(decode_hybrid36(4, line[22:26]))
     # add x, y, and z
     atcoord = [
         float(line[30:38]) * angstrom,
@@ -132,6 +237,88 @@ def _parse_pdb_atom_line(line, lit):
     return atnum, atname, resname, chainid, resnum, atcoord, occupancy, bfactor
 
 
+# Fixed columns of ATOM and HETATM records, see _parse_pdb_atom_line.
+# The topology field covers the columns from the atom name up to the insertion code.
+# It does not include the element, which is compared separately when frames share atoms.
+PDB_ATOM_DTYPE = np.dtype(
+    {
+        "names": [
+            "name",
+            "resname",
+            "chainid",
+            "resnum",
+            "x",
+            "y",
+            "z",
+            "occ",
+            "bfac",
+            "element",
+            "topology",
+        ],
+        "formats": ["S4", "S3", "S1", "S4", "S8", "S8", "S8", "S6", "S6", "S2", "S15"],
+        "offsets": [12, 17, 21, 22, 30, 38, 46, 54, 60, 76, 12],
+        "itemsize": 80,
+    }
+)
+
+
+def _decode_pdb_column(column: NDArray) -> NDArray[str]:
+    """Strip and decode a column of fixed-width byte strings."""
+    column = np.char.strip(column)
+    return column.astype(f"U{max(1, np.char.str_len(column).max())}")
+
+
+def _parse_pdb_atom_lines(lines: list[str]) -> tuple:
+    """Parse a block of ATOM or HETATM lines at once, by slicing the fixed columns.
+
+    Parameters
+    ----------
+    lines
+        A list of ATOM or HETATM lines.
+
+    Returns
+    -------
+    The same fields as :py:func:`_parse_pdb_atom_line`, as arrays with one element per line.
+
+    Raises
+    ------
+    ValueError
+        When a line is malformed or when the element symbol is missing or unknown.
+        In this case, the lines should be parsed one by one with
+        :py:func:`_parse_pdb_atom_line`, which can also deal with these cases.
+
+    """
+    records = _get_pdb_atom_records(lines)
+    symbols, inverse = np.unique(records["element"], return_inverse=True)
+    symbols = [symbol.strip().decode("ascii") for symbol in symbols]
+    if not all(symbol in sym2num for symbol in symbols):
+        raise ValueError("Element symbols are missing or unknown.")
+    atnums = np.array([sym2num[symbol] for symbol in symbols])[inverse.ravel()]
+    atcoords, occupancies, bfactors = _parse_pdb_atom_records(records)
+    return (
+        atnums,
+        _decode_pdb_column(records["name"]),
+        _decode_pdb_column(records["resname"]),
+        records["chainid"].astype("U1"),
+        decode_hybrid36(4, records["resnum"]),
+        atcoords,
+        occupancies,
+        bfactors,
+    )
+
+
+def _get_pdb_atom_records(lines: list[str]) -> NDArray:
+    """Convert ATOM or HETATM lines into a structured array with fixed-width byte strings."""
+    text = "".join(line.rstrip("\r\n")[:80].ljust(80) for line in lines)
+    return np.frombuffer(text.encode("ascii"), dtype=PDB_ATOM_DTYPE)
+
+
+def _parse_pdb_atom_records(records: NDArray) -> tuple[NDArray, NDArray, NDArray]:
+    """Convert the coordinates, occupancies and temperature factors of ATOM records."""
+    atcoords = np.array([records["x"], records["y"], records["z"]]).T.astype(float) * angstrom
+    return atcoords, records["occ"].astype(float), records["bfac"].astype(float)
+
+
 def _parse_pdb_conect_line(line):
     # Overview of CONECT records
     # COLUMNS       DATA  TYPE      FIELD        DEFINITION
@@ -142,28 +329,35 @@ def _parse_pdb_conect_line(line):
     # 17 - 21       Integer        serial       Serial number of bonded atom
     # 22 - 26       Integer        serial       Serial number of bonded atom
     # 27 - 31       Integer        serial       Serial number of bonded atom
-    iatom0 = int(line[7:12]) - 1
-    for ipos in 12, 17, 22, 27:
-        serial_str = line[ipos : ipos + 5].strip()
-        if serial_str != "":
-            iatom1 = int(serial_str) - 1
-            if iatom1 > iatom0:
-                yield iatom0, iatom1
+    fields = [line[ipos : ipos + 5] for ipos in range(6, 31, 5)]
+    fields = [field for field in fields if field.strip() != ""]
+    iatoms = decode_hybrid36(5, fields) - 1
+    for iatom1 in iatoms[1:]:
+        if iatom1 > iatoms[0]:
+            yield iatoms[0], iatom1
 
 
-@document_load_one("PDB", ["atcoords", "atnums", "atffparams", "extra"], ["title", "bonds"])
-def load_one(lit: LineIterator) -> dict:
-    """Do not edit this docstring. It will be overwritten."""
+def _read_pdb_frame(lit: LineIterator) -> tuple:
+    """Read all lines of one frame, up to and including the END or ENDMDL line.
+
+    Returns
+    -------
+    title_lines
+        The contents of the TITLE lines.
+    compnd_lines
+        The contents of the COMPND lines.
+    atom_lines
+        The ATOM and HETATM lines, which still need to be parsed.
+    atom_linenos
+        The line numbers of the ATOM and HETATM lines.
+    bonds
+        The bonds read from the CONECT lines.
+
+    """
     title_lines = []
     compnd_lines = []
-    atnums = []
-    attypes = []
-    restypes = []
-    chainids = []
-    resnums = []
-    atcoords = []
-    occupancies = []
-    bfactors = []
+    atom_lines = []
+    atom_linenos = []
     bonds = []
     molecule_found = False
     end_reached = False
@@ -172,24 +366,17 @@ def load_one(lit: LineIterator) -> dict:
             line = next(lit)
         except StopIteration:
             break
+        # The atom lines are parsed together after the loop.
+        if line.startswith(("ATOM", "HETATM")):
+            atom_lines.append(line)
+            atom_linenos.append(lit.lineno)
+            molecule_found = True
+            continue
         # If the PDB file has a title, replace the default.
         if line.startswith("TITLE"):
             title_lines.append(line[10:].strip())
         if line.startswith("COMPND"):
             compnd_lines.append(line[10:].strip())
-        if line.startswith(("ATOM", "HETATM")):
-            (atnum, attype, restype, chainid, resnum, atcoord, occupancy, bfactor) = (
-                _parse_pdb_atom_line(line, lit)
-            )
-            atnums.append(atnum)
-            attypes.append(attype)
-            restypes.append(restype)
-            chainids.append(chainid)
-            resnums.append(resnum)
-            atcoords.append(atcoord)
-            occupancies.append(occupancy)
-            bfactors.append(bfactor)
-            molecule_found = True
         if line.startswith("CONECT"):
             for iatom0, iatom1 in _parse_pdb_conect_line(line):
                 bonds.append([iatom0, iatom1, bond2num["un"]])
@@ -200,123 +387,247 @@ def load_one(lit: LineIterator) -> dict:
         raise LoadError("Molecule could not be read.", lit)
     if not end_reached:
         warn(
-            LoadWarning("The END is not found, but the parsed data is returned.", lit), stacklevel=2
+            LoadWarning("The END is not found, but the parsed data is returned.", lit), stacklevel=3
         )
+    return title_lines, compnd_lines, atom_lines, atom_linenos, bonds
 
-    # Data related to force fields
-    atffparams = {
-        "attypes": np.array(attypes),
-        "restypes": np.array(restypes),
-        "resnums": np.array(resnums),
-    }
-    # Extra data
-    extra = {
-        "occupancies": np.array(occupancies),
-        "bfactors": np.array(bfactors),
-    }
+
+def _set_pdb_title(result: dict, title_lines: list[str], compnd_lines: list[str]):
+    """Set the title and the compound in a result dictionary."""
+    extra = result["extra"]
     if len(compnd_lines) > 0:
         extra["compound"] = "\n".join(compnd_lines)
-    # add chain id, if it wasn't all empty
-    if not np.all(chainids == [" "] * len(chainids)):
-        extra["chainids"] = np.array(chainids)
     # Set a useful title
     if len(title_lines) == 0:
         # Some files use COMPND instead of TITLE, in which case COMPND will be
         # used as title.
         if "compound" in extra:
-            title = extra["compound"]
+            result["title"] = extra["compound"]
             del extra["compound"]
         else:
-            title = "PDB file loaded by IOData"
+            result["title"] = "PDB file loaded by IOData"
     else:
-        title = "\n".join(title_lines)
+        result["title"] = "\n".join(title_lines)
+
+
+@document_load_one("PDB", ["atcoords", "atnums", "atffparams", "extra"], ["title", "bonds"])
+def load_one(lit: LineIterator) -> dict:
+    """Do not edit this docstring. It will be overwritten."""
+    return _load_pdb_frame(lit, _read_pdb_frame(lit))
+
+
+def _load_pdb_frame(lit: LineIterator, frame: tuple) -> dict:
+    """Parse all fields of a frame, whose lines were read with ``_read_pdb_frame``."""
+    title_lines, compnd_lines, atom_lines, atom_linenos, bonds = frame
+    try:
+        atnums, attypes, restypes, chainids, resnums, atcoords, occupancies, bfactors = (
+            _parse_pdb_atom_lines(atom_lines)
+        )
+    except ValueError:
+        # Fall back to the line parser, which also handles missing or unknown elements.
+        atnums, attypes, restypes, chainids, resnums, atcoords, occupancies, bfactors = (
+            np.array(column)
+            for column in zip(
+                *(
+                    _parse_pdb_atom_line(line, lit, lineno)
+                    for line, lineno in zip(atom_lines, atom_linenos)
+                )
+            )
+        )
+
+    # Data related to force fields
+    atffparams = {
+        "attypes": attypes,
+        "restypes": restypes,
+        "resnums": resnums,
+    }
+    # Extra data
+    extra = {
+        "occupancies": occupancies,
+        "bfactors": bfactors,
+    }
+    # add chain id, if it wasn't all empty
+    if not (chainids == " ").all():
+        extra["chainids"] = chainids
     result = {
-        "atcoords": np.array(atcoords),
-        "atnums": np.array(atnums),
+        "atcoords": atcoords,
+        "atnums": atnums,
         "atffparams": atffparams,
-        "title": title,
         "extra": extra,
     }
+    _set_pdb_title(result, title_lines, compnd_lines)
     # assign bonds only if some were present
     if len(bonds) > 0:
         result["bonds"] = np.array(bonds)
     return result
 
 
-@document_load_many("PDB", ["atcoords", "atnums", "atffparams", "extra"], ["title"])
-def load_many(lit: LineIterator) -> Iterator[dict]:
+LOAD_MANY_KWDOCS = {
+    "shared_topology": "When True, the atoms, residues and chains are only parsed in the "
+    "first frame. For the following frames, only the coordinates, occupancies and "
+    "temperature factors are parsed, after checking that the atom, residue and chain "
+    "columns are identical to those of the first frame. All frames then share the same "
+    "arrays for atnums, atffparams, chainids and bonds. "
+    "When False, every frame is loaded independently.",
+}
+
+
+@document_load_many(
+    "PDB", ["atcoords", "atnums", "atffparams", "extra"], ["title"], LOAD_MANY_KWDOCS
+)
+def load_many(lit: LineIterator, shared_topology: bool = False) -> Iterator[dict]:
     """Do not edit this docstring. It will be overwritten."""
     # PDB files with more molecules are a simple concatenation of individual PDB files,'
     # making it trivial to load many frames.
+    if not shared_topology:
+        try:
+            while True:
+                yield load_one(lit)
+        except (StopIteration, LoadError):
+            return
     try:
-        while True:
-            yield load_one(lit)
-    except (StopIteration, LoadError):
+        frame = _read_pdb_frame(lit)
+    except LoadError:
         return
+    first = _load_pdb_frame(lit, frame)
+    yield first
+    records = _get_pdb_atom_records(frame[2])
+    topology = records["topology"]
+    # The atomic numbers are derived from the element column, so it must be the same too.
+    elements = records["element"]
+    while True:
+        try:
+            title_lines, compnd_lines, atom_lines, _atom_linenos, _bonds = _read_pdb_frame(lit)
+        except LoadError:
+            return
+        records = _get_pdb_atom_records(atom_lines)
+        if (
+            len(records) != len(topology)
+            or (records["topology"] != topology).any()
+            or (records["element"] != elements).any()
+        ):
+            raise LoadError("The atoms differ from those in the first frame.", lit)
+        atcoords, occupancies, bfactors = _parse_pdb_atom_records(records)
+        extra = {**first["extra"], "occupancies": occupancies, "bfactors": bfactors}
+        extra.pop("compound", None)
+        result = {
+            **first,
+            "atcoords": atcoords,
+            "atffparams": dict(first["atffparams"]),
+            "extra": extra,
+        }
+        _set_pdb_title(result, title_lines, compnd_lines)
+        yield result
+
+
+def skip_frame(lit: LineIterator):
+    """Skip one frame up to the next END or ENDMDL line, raising StopIteration after the last."""
+    # The same lines as in _read_pdb_frame end a frame, but none of them are parsed.
+    molecule_found = False
+    for line in lit:
+        if line.startswith(("ATOM", "HETATM")):
+            molecule_found = True
+        elif molecule_found and line.startswith("END"):
+            return
+    if not molecule_found:
+        raise StopIteration
 
 
-def _dump_multiline_str(f: TextIO, key: str, value: str):
-    r"""Write a multiline string in PDB format.
+def _format_multiline_str(key: str, value: str) -> str:
+    r"""Format a multiline string in PDB format.
 
     Parameters
     ----------
-    f
-        A file object to write to.
     key
         The key used to prefix the multiline string, e.g. `"TITLE"`.
     value
         A (multiline) string, with multiple lines separated by `\n`.
 
+    Returns
+    -------
+    The formatted lines, each terminated by a newline character.
+
     """
+    result = []
     prefix = key.ljust(10)
     for iline, line in enumerate(value.split("\n")):
-        print(prefix + line, file=f)
+        result.append(prefix + line + "\n")
         prefix = key + str(iline + 2).rjust(10 - len(key)) + " "
+    return "".join(result)
+
+
+def _format_pdb_conect_lines(bonds: NDArray[int], serials: NDArray[str]) -> str:
+    """Format the CONECT lines for all bonds.
+
+    Parameters
+    ----------
+    bonds
+        The bonds, with atom indexes in the first two columns.
+    serials
+        The formatted serial numbers of all atoms.
+
+    Returns
+    -------
+    The CONECT lines, listing for every atom its bonded atoms in groups of at most four.
+    The atoms are sorted by index and their bonded atoms are kept in the order of
+    the bonds.
+
+    """
+    if len(bonds) == 0:
+        return ""
+    # Every bond is listed for both atoms.
+    iatoms0 = bonds[:, :2].ravel()
+    iatoms1 = bonds[:, 1::-1].ravel()
+    order = iatoms0.argsort(kind="stable")
+    iatoms0 = iatoms0[order]
+    iatoms1 = iatoms1[order]
+    # A new line starts with every fifth bonded atom of the same atom.
+    ranks = np.arange(len(iatoms0)) - np.searchsorted(iatoms0, iatoms0)
+    prefixes = np.where(ranks % 4 == 0, np.char.add("\nCONECT", serials[iatoms0]), "")
+    return "".join(np.char.add(prefixes, serials[iatoms1]).tolist())[1:] + "\n"
 
 
 @document_dump_one("PDB", ["atcoords", "atnums", "extra"], ["atffparams", "title", "bonds"])
 def dump_one(f: TextIO, data: IOData):
     """Do not edit this docstring. It will be overwritten."""
-    _dump_multiline_str(f, "TITLE", data.title or "Created with IOData")
+    parts = [_format_multiline_str("TITLE", data.title or "Created with IOData")]
     if "compound" in data.extra:
-        _dump_multiline_str(f, "COMPND", data.extra["compound"])
-    # Prepare for ATOM lines.
-    attypes = data.atffparams.get("attypes", None)
-    restypes = data.atffparams.get("restypes", None)
-    resnums = data.atffparams.get("resnums", None)
-    occupancies = data.extra.get("occupancies", None)
-    bfactors = data.extra.get("bfactors", None)
-    chainids = data.extra.get("chainids", None)
-    # Write ATOM lines.
-    for i in range(data.natom):
-        n = num2sym[data.atnums[i]]
-        resnum = -1 if resnums is None else resnums[i]
-        x, y, z = data.atcoords[i] / angstrom
-        occ = 1.00 if occupancies is None else occupancies[i]
-        b = 0.00 if bfactors is None else bfactors[i]
-        attype = str(n + str(i + 1)) if attypes is None else attypes[i]
-        restype = "XXX" if restypes is None else restypes[i]
-        chain = " " if chainids is None else chainids[i]
-        out1 = f"{i+1:>5d} {attype:<4s} {restype:3s} {chain:1s}{resnum:>4d}    "
-        out2 = f"{x:8.3f}{y:8.3f}{z:8.3f}{occ:6.2f}{b:6.2f}{n:>12s}"
-        print("ATOM  " + out1 + out2, file=f)
+        parts.append(_format_multiline_str("COMPND", data.extra["compound"]))
+    # Prepare the columns of the ATOM lines.
+    symbols = [num2sym[atnum] for atnum in data.atnums]
+    attypes = data.atffparams.get("attypes")
+    if attypes is None:
+        attypes = [f"{symbol}{iatom + 1}" for iatom, symbol in enumerate(symbols)]
+    restypes = data.atffparams.get("restypes", ["XXX"] * data.natom)
+    resnums = data.atffparams.get("resnums", np.full(data.natom, -1))
+    occupancies = data.extra.get("occupancies", np.ones(data.natom))
+    bfactors = data.extra.get("bfactors", np.zeros(data.natom))
+    chainids = data.extra.get("chainids", [" "] * data.natom)
+    # Serial and residue numbers that do not fit are written in hybrid-36 format.
+    serials = encode_hybrid36(5, np.arange(1, data.natom + 1))
+    atcoords = data.atcoords / angstrom
+    parts.append(
+        format_table(
+            "ATOM  %s %-4s %-3s %-1s%s    %8.3f%8.3f%8.3f%6.2f%6.2f%12s",
+            [
+                serials,
+                attypes,
+                restypes,
+                chainids,
+                encode_hybrid36(4, resnums),
+                atcoords[:, 0],
+                atcoords[:, 1],
+                atcoords[:, 2],
+                occupancies,
+                bfactors,
+                symbols,
+            ],
+        )
+    )
     if data.bonds is not None:
-        # Prepare for CONECT lines.
-        connections = [[] for iatom in range(data.natom)]
-        for iatom0, iatom1 in data.bonds[:, :2]:
-            connections[iatom0].append(iatom1)
-            connections[iatom1].append(iatom0)
-        # Write CONECT lines.
-        for iatom0, iatoms1 in enumerate(connections):
-            if len(iatoms1) > 0:
-                # Write connection in groups of max 4
-                for ichunk in range(len(iatoms1) // 4 + 1):
-                    other_atoms_str = "".join(
-                        f"{iatom1 + 1:5d}" for iatom1 in iatoms1[ichunk * 4 : ichunk * 4 + 4]
-                    )
-                    conect_line = f"CONECT{iatom0 + 1:5d}{other_atoms_str}"
-                    print(conect_line, file=f)
-    print("END", file=f)
+        parts.append(_format_pdb_conect_lines(data.bonds, serials))
+    parts.append("END\n")
+    f.write("".join(parts))
 
 
 @document_dump_many("PDB", ["atcoords", "atnums", "extra"], ["atffparams", "title"])
@@ -29,8 +29,9 @@ This format is one of the chemical table file formats:
 https://en.wikipedia.org/wiki/Chemical_table_file
 """
 
+import re
 from collections.abc import Iterator
-from typing import TextIO
+from typing import Callable, Optional, TextIO
 
 import numpy as np
 
@@ -41,8 +42,16 @@ from ..docstrings import (
     document_load_one,
 )
 from ..iodata import IOData
+from ..parallel import PARALLEL_KWDOCS, load_many_parallel
 from ..periodic import num2sym, sym2num
-from ..utils import LineIterator, LoadError, angstrom
+from ..utils import (
+    RECORD_KWDOCS,
+    LineIterator,
+    LoadError,
+    angstrom,
+    format_table,
+    iter_selected_records,
+)
 
 __all__ = ()
 
@@ -79,6 +88,17 @@ def load_one(lit: LineIterator) -> dict:
         # Anything outside that range is not modified, just not to lose any
         # information, but could be potentially meaningless.
         bonds[ibond, 2] = int(words[2])
+    _skip_to_end(lit)
+    return {
+        "title": title,
+        "atcoords": atcoords,
+        "atnums": atnums,
+        "bonds": bonds,
+    }
+
+
+def _skip_to_end(lit: LineIterator):
+    """Skip the remaining lines of a molecule, up to and including the $$$$ line."""
     while True:
         try:
             words = next(lit)
@@ -86,17 +106,56 @@ def load_one(lit: LineIterator) -> dict:
             raise LoadError("Molecule specification did not end properly with $$$$.", lit) from exc
         if words == "$$$$\n":
             break
-    return {
-        "title": title,
-        "atcoords": atcoords,
-        "atnums": atnums,
-        "bonds": bonds,
-    }
 
 
-@document_load_many("SDF", ["atcoords", "atnums", "bonds", "title"])
-def load_many(lit: LineIterator) -> Iterator[dict]:
+def _read_header(lit: LineIterator) -> tuple[dict, list[str]]:
+    """Read the title and the counts line of the next molecule."""
+    lines = [next(lit) for _ in range(4)]
+    words = lines[3].split()
+    if words[-1].upper() != "V2000":
+        raise LoadError("Only V2000 SDF files are supported.", lit)
+    header = {"title": lines[0].strip(), "natom": int(words[0]), "nbond": int(words[1])}
+    return header, lines
+
+
+def _skip_record(lit: LineIterator, header: dict):
+    """Skip the atom and bond lines of a molecule without parsing them."""
+    nline = header["natom"] + header["nbond"]
+    if len(lit.next_lines(nline)) < nline:
+        # Same as in load_one, where a truncated molecule ends the file.
+        raise StopIteration
+    _skip_to_end(lit)
+
+
+def skip_frame(lit: LineIterator):
+    """Skip one molecule without parsing it, raising StopIteration after the last one."""
+    _skip_record(lit, _read_header(lit)[0])
+
+
+# The line after each record, used to find record boundaries without parsing.
+RECORD_END = re.compile(rb"^\$\$\$\$\r?\n", re.MULTILINE)
+
+
+LOAD_MANY_KWDOCS = {**PARALLEL_KWDOCS, **RECORD_KWDOCS}
+
+
+@document_load_many("SDF", ["atcoords", "atnums", "bonds", "title"], [], LOAD_MANY_KWDOCS)
+def load_many(
+    lit: LineIterator,
+    nworker: int = 0,
+    chunksize: int = 100,
+    where: Optional[Callable[[dict], bool]] = None,
+    records: Optional[range] = None,
+) -> Iterator[dict]:
     """Do not edit this docstring. It will be overwritten."""
+    if where is not None or records is not None:
+        if nworker > 0:
+            raise ValueError("Records cannot be selected when loading in parallel.")
+        yield from iter_selected_records(lit, _read_header, load_one, _skip_record, where, records)
+        return
+    if nworker > 0:
+        yield from load_many_parallel(lit, __name__, RECORD_END, nworker, chunksize)
+        return
     # SDF files with more molecules are a simple concatenation of individual SDF files,'
     # making it travial to load many frames.
     try:
@@ -109,20 +168,27 @@ def load_many(lit: LineIterator) -> Iterator[dict]:
 @document_dump_one("SDF", ["atcoords", "atnums"], ["title", "bonds"])
 def dump_one(f: TextIO, data: IOData):
     """Do not edit this docstring. It will be overwritten."""
-    print(data.title or "Created with IOData", file=f)
-    print("", file=f)
-    print("", file=f)
     nbond = 0 if data.bonds is None else len(data.bonds)
-    print(f"{data.natom:3d}{nbond:3d}  0     0  0  0  0  0  0999 V2000", file=f)
-    for iatom in range(data.natom):
-        n = num2sym[data.atnums[iatom]]
-        x, y, z = data.atcoords[iatom] / angstrom
-        print(f"{x:10.4f}{y:10.4f}{z:10.4f} {n:<3s} 0  0  0  0  0  0  0  0  0  0  0  0", file=f)
+    parts = [
+        f"{data.title or 'Created with IOData'}\n\n\n",
+        f"{data.natom:3d}{nbond:3d}  0     0  0  0  0  0  0999 V2000\n",
+    ]
+    atcoords = data.atcoords / angstrom
+    parts.append(
+        format_table(
+            "%10.4f%10.4f%10.4f %-3s 0  0  0  0  0  0  0  0  0  0  0  0",
+            [atcoords[:, 0], atcoords[:, 1], atcoords[:, 2], [num2sym[n] for n in data.atnums]],
+        )
+    )
     if data.bonds is not None:
-        for iatom, jatom, bondtype in data.bonds:
-            print(f"{iatom + 1:3d}{jatom + 1:3d}{bondtype:3d}  0  0  0  0", file=f)
-    print("M  END", file=f)
-    print("$$$$", file=f)
+        parts.append(
+            format_table(
+                "%3d%3d%3d  0  0  0  0",
+                [data.bonds[:, 0] + 1, data.bonds[:, 1] + 1, data.bonds[:, 2]],
+            )
+        )
+    parts.append("M  END\n$$$$\n")
+    f.write("".join(parts))
 
 
 @document_dump_many("SDF", ["atcoords", "atnums"], ["title", "bonds"])
@@ -27,7 +27,7 @@ Gaussian functions.
 
 import functools
 import operator
-from typing import TextIO
+from typing import Optional, TextIO
 
 import numpy as np
 from numpy.typing import NDArray
@@ -40,7 +40,13 @@ from ..orbitals import MolecularOrbitals
 from ..overlap import gob_cart_normalization
 from ..periodic import num2sym, sym2num
 from ..prepare import prepare_segmented, prepare_unrestricted_aminusb
-from ..utils import LineIterator, LoadError, PrepareDumpError
+from ..utils import (
+    LineIterator,
+    LoadError,
+    PrepareDumpError,
+    format_lines,
+    read_fortran_fields,
+)
 
 __all__ = ()
 
@@ -160,21 +166,10 @@ def _load_helper_atoms(lit: LineIterator, num_atoms: int) -> tuple[NDArray[int],
 
 
 def _load_helper_section(
-    lit: LineIterator, n: int, start: str, skip: int, step: int, dtype: np.dtype
+    lit: LineIterator, n: int, start: str, skip: int, step: int, nper_line: int, dtype: np.dtype
 ) -> NDArray:
     """Read CENTRE ASSIGNMENTS, TYPE ASSIGNMENTS, and EXPONENTS sections."""
-    section = []
-    while len(section) < n:
-        line = next(lit)
-        if not line.startswith(start):
-            raise LoadError(f"Expecting line to start with '{start}'.", lit)
-        line = line[skip:]
-        while len(line) >= step:
-            section.append(dtype(line[:step].replace("D", "E")))
-            line = line[step:]
-    if len(section) != n:
-        raise LoadError("Number of elements in section do not match 'n'.", lit)
-    return np.array(section, dtype=dtype)
+    return read_fortran_fields(lit, n, step, nper_line, dtype, start, skip)
 
 
 def _load_helper_mo(lit: LineIterator, nprim: int) -> tuple[int, float, float, NDArray[float]]:
@@ -187,7 +182,7 @@ def _load_helper_mo(lit: LineIterator, nprim: int) -> tuple[int, float, float, N
     occ = float(line[34:47])
     energy = float(line[62:74])
     # FORMAT (5E16.8)
-    coeffs = _load_helper_section(lit, nprim, "", 0, 16, float)
+    coeffs = _load_helper_section(lit, nprim, "", 0, 16, 5, float)
     return number, occ, energy, coeffs
 
 
@@ -209,7 +204,7 @@ def _load_helper_multiwfn(lit: LineIterator, num_mo: int) -> NDArray[int]:
     for line in lit:
         if "$MOSPIN $END" in line:
             # FORMAT (40I2)
-            return _load_helper_section(lit, num_mo, "", 0, 2, int)
+            return _load_helper_section(lit, num_mo, "", 0, 2, 40, int)
     return np.empty((0,), dtype=int)
 
 
@@ -227,14 +222,14 @@ def load_wfn_low(lit: LineIterator) -> tuple:
     num_mo, nprim, num_atoms = _load_helper_num(lit)
     atnums, atcoords = _load_helper_atoms(lit, num_atoms)
     # centers are indexed from zero in HORTON
-    icenters = _load_helper_section(lit, nprim, "CENTRE ASSIGNMENTS", 20, 3, int) - 1
+    icenters = _load_helper_section(lit, nprim, "CENTRE ASSIGNMENTS", 20, 3, 20, int) - 1
     # The type assignments are integer indices for individual basis functions,
     # while in IOData, only the order within shells is fixed by configurable
     # conventions. In principle, the wfn format makes it possible for two
     # shells with the same angular momentum to have a different ordering of
     # the basis functions.
-    type_assignments = _load_helper_section(lit, nprim, "TYPE ASSIGNMENTS", 20, 3, int) - 1
-    exponent = _load_helper_section(lit, nprim, "EXPONENTS", 10, 14, float)
+    type_assignments = _load_helper_section(lit, nprim, "TYPE ASSIGNMENTS", 20, 3, 20, int) - 1
+    exponent = _load_helper_section(lit, nprim, "EXPONENTS", 10, 14, 5, float)
     mo_numbers = np.empty(num_mo, int)
     mo_occs = np.empty(num_mo, float)
     mo_energies = np.empty(num_mo, float)
@@ -390,8 +385,164 @@ def get_mocoeff_scales(obasis: MolecularBasis) -> NDArray[float]:
     return np.array(scales)
 
 
-@document_load_one("WFN", ["atcoords", "atnums", "energy", "mo", "obasis", "title", "extra"])
-def load_one(lit: LineIterator) -> dict:
+def decontract_obasis(
+    obasis: MolecularBasis, coeffs: NDArray[float]
+) -> tuple[NDArray[int], NDArray[int], NDArray[float], NDArray[float]]:
+    """Expand a segmented Cartesian basis set and MO coefficients into primitives.
+
+    This is the inverse of :py:func:`build_obasis` and :py:func:`get_mocoeff_scales`.
+    All arrays are computed at once, without creating a shell for each primitive.
+
+    Parameters
+    ----------
+    obasis
+        A segmented basis set with only Cartesian shells.
+    coeffs
+        MO coefficients in this basis set. shape=(nbasis, norb)
+
+    Returns
+    -------
+    icenters
+        The center indices for all primitive basis functions, starting from zero.
+    type_assignments
+        Integer codes for the primitive basis function names, starting from zero.
+    exponents
+        The Gaussian exponents of all primitive basis functions.
+    prim_coeffs
+        The MO coefficients of the un-normalized primitive basis functions.
+        These include the contraction coefficients. shape=(nprim, norb)
+
+    """
+    for shell in obasis.shells:
+        if shell.ncon != 1:
+            raise RuntimeError("Generalized contractions not supported. Call prepare_dump first.")
+    permutation, signs = convert_conventions(obasis, CONVENTIONS)
+    raw_coeffs = coeffs[permutation] * signs.reshape(-1, 1)
+    # Arrays with one element per shell
+    shell_icenters = np.array([shell.icenter for shell in obasis.shells])
+    shell_angmoms = np.array([shell.angmoms[0] for shell in obasis.shells])
+    shell_nexps = np.array([shell.nexp for shell in obasis.shells])
+    shell_nbasis = np.array([shell.nbasis for shell in obasis.shells])
+    shell_offsets = np.cumsum(shell_nbasis) - shell_nbasis
+    # Arrays with one element per primitive shell
+    prim_shells = np.repeat(np.arange(len(obasis.shells)), shell_nexps)
+    prim_nbasis = shell_nbasis[prim_shells]
+    prim_exponents = np.concatenate([shell.exponents for shell in obasis.shells])
+    prim_contractions = np.concatenate([shell.coeffs[:, 0] for shell in obasis.shells])
+    # Arrays with one element per primitive basis function
+    func_prims = np.repeat(np.arange(len(prim_shells)), prim_nbasis)
+    func_shells = prim_shells[func_prims]
+    func_components = np.arange(len(func_prims)) - np.repeat(
+        np.cumsum(prim_nbasis) - prim_nbasis, prim_nbasis
+    )
+    func_angmoms = shell_angmoms[func_shells]
+    exponents = prim_exponents[func_prims]
+    # The normalization constants are computed for all functions of the same type at once.
+    scales = np.zeros(len(func_prims))
+    for angmom in np.unique(shell_angmoms):
+        for icomponent, name in enumerate(CONVENTIONS[(angmom, "c")]):
+            mask = (func_angmoms == angmom) & (func_components == icomponent)
+            n = np.array([name.count("x"), name.count("y"), name.count("z")])
+            scales[mask] = gob_cart_normalization(exponents[mask], n)
+    # The primitives of one shell share the MO coefficients of the contraction.
+    rows = shell_offsets[func_shells] + func_components
+    prim_coeffs = raw_coeffs[rows] * (prim_contractions[func_prims] * scales).reshape(-1, 1)
+    # The type codes number all Cartesian functions, in order of increasing angular momentum.
+    type_assignments = func_angmoms * (func_angmoms + 1) * (func_angmoms + 2) // 6 + func_components
+    return shell_icenters[func_shells], type_assignments, exponents, prim_coeffs
+
+
+# Relative tolerance for proportional MO coefficients when reconstructing contractions
+CONTRACTION_RTOL = 1e-6
+
+
+def _get_ratio(ref: NDArray[float], block: NDArray[float], rtol: float) -> Optional[float]:
+    """Return the ratio of two blocks of MO coefficients, or None if they are not proportional."""
+    ref_norm2 = np.vdot(ref, ref)
+    if ref_norm2 == 0.0:
+        return None
+    ratio = np.vdot(ref, block) / ref_norm2
+    if ratio == 0.0 or np.linalg.norm(block - ratio * ref) > rtol * np.linalg.norm(block):
+        return None
+    return ratio
+
+
+def contract_obasis(
+    obasis: MolecularBasis, mo_coeffs: NDArray[float], rtol: float = CONTRACTION_RTOL
+) -> tuple[MolecularBasis, NDArray[float]]:
+    """Reconstruct contracted shells from a basis set with one primitive per shell.
+
+    Consecutive shells on the same center and with the same angular momentum are
+    merged into one contracted shell when their MO coefficients are proportional.
+    The contracted basis functions are normalized and the MO coefficients are
+    transformed accordingly, such that the orbitals do not change.
+
+    Parameters
+    ----------
+    obasis
+        A basis set with L2-normalized primitive Cartesian shells, as returned by
+        :py:func:`build_obasis`.
+    mo_coeffs
+        The MO coefficients in this basis, after fixing the normalization.
+        shape=(nbasis, norb)
+    rtol
+        The relative tolerance on the norm of the deviation from proportionality.
+
+    Returns
+    -------
+    The contracted basis set and the corresponding MO coefficients.
+
+    """
+    shells = []
+    blocks = []
+    # Exponents, contraction coefficients and MO coefficients of the current group.
+    group_exponents, group_ratios, group_ref = [], [], None
+
+    def flush_group(icenter: int, angmom: int):
+        exponents = np.array(group_exponents)
+        ratios = np.array(group_ratios)
+        # Overlap matrix of normalized primitives with the same Cartesian powers.
+        olp = (
+            2 * np.sqrt(np.outer(exponents, exponents)) / np.add.outer(exponents, exponents)
+        ) ** (angmom + 1.5)
+        norm = np.sqrt(ratios @ olp @ ratios)
+        shells.append(Shell(icenter, [angmom], ["c"], exponents, (ratios / norm).reshape(-1, 1)))
+        blocks.append(group_ref * norm)
+
+    ibasis = 0
+    for ishell, shell in enumerate(obasis.shells):
+        block = mo_coeffs[ibasis : ibasis + shell.nbasis]
+        ibasis += shell.nbasis
+        if ishell > 0:
+            previous = obasis.shells[ishell - 1]
+            if previous.icenter == shell.icenter and previous.angmoms == shell.angmoms:
+                ratio = _get_ratio(group_ref, block, rtol)
+                if ratio is not None:
+                    group_exponents.append(shell.exponents[0])
+                    group_ratios.append(ratio)
+                    continue
+            flush_group(previous.icenter, previous.angmoms[0])
+        group_exponents, group_ratios, group_ref = [shell.exponents[0]], [1.0], block
+    if len(obasis.shells) > 0:
+        flush_group(obasis.shells[-1].icenter, obasis.shells[-1].angmoms[0])
+    contracted = MolecularBasis(shells, obasis.conventions, obasis.primitive_normalization)
+    return contracted, np.concatenate(blocks)
+
+
+LOAD_ONE_KWDOCS = {
+    "reconstruct_contractions": "When True, consecutive primitive shells on the same center "
+    "and with the same angular momentum are merged into contracted shells when their MO "
+    "coefficients are proportional. This reduces the size of the basis set, without "
+    "changing the orbitals. By default, every primitive becomes a separate shell.",
+}
+
+
+@document_load_one(
+    "WFN",
+    ["atcoords", "atnums", "energy", "mo", "obasis", "title", "extra"],
+    kwdocs=LOAD_ONE_KWDOCS,
+)
+def load_one(lit: LineIterator, reconstruct_contractions: bool = False) -> dict:
     """Do not edit this docstring. It will be overwritten."""
     (
         title,
@@ -419,6 +570,8 @@ def load_one(lit: LineIterator) -> dict:
     mo_coeffs = mo_coeffs[permutation]
     # Fix normalization.
     mo_coeffs /= get_mocoeff_scales(obasis).reshape(-1, 1)
+    if reconstruct_contractions:
+        obasis, mo_coeffs = contract_obasis(obasis, mo_coeffs)
     norb = mo_coeffs.shape[1]
     # Determine norb_a,norb_b,norb_ab from mo_spin information.
     if mo_spin.size:
@@ -466,18 +619,9 @@ def load_one(lit: LineIterator) -> dict:
     }
 
 
-def _format_helper_section(header: str, skip: int, spec: str, nline: int) -> tuple[str, int]:
-    """Return a format string for CENTRE_ASSIGMENTS, TYPE_ASSIGNMENTS, EXPONENTS lines."""
-    return f"{header[:skip].ljust(skip)}{spec * nline}", len(spec)
-
-
-def _dump_helper_section(f: TextIO, data: NDArray, fmt: str, skip: int, step: int, nline: int):
-    """Write a CENTRE_ASSIGNMENTS, TYPE_ASSIGNMENTS, or EXPONENTS section to file ``f``."""
-    while len(data) > 0:
-        chunk = data[:nline]
-        n_chunk = len(chunk)
-        print(fmt[: skip + n_chunk * step].format(*chunk), file=f)
-        data = data[n_chunk:]
+def _dump_helper_section(f: TextIO, data: NDArray, spec: str, prefix: str, nline: int):
+    """Write a CENTRE_ASSIGNMENTS, TYPE_ASSIGNMENTS, EXPONENTS, MO or MOSPIN section."""
+    f.write(format_lines(spec, data, nline, prefix))
 
 
 # FORMAT (16X,I7,13X,I7,11X,I9)
@@ -489,15 +633,15 @@ FMT_MOS = "MO{0:5d}     MO {1:3.1f}        OCC NO ={2:13.7f}  ORB. ENERGY ={3:12
 # FORMAT (17X,F20.12,18X,F13.8)
 FMT_ENERGY = " TOTAL ENERGY =  {0:20.12f} THE VIRIAL(-V/T)={1:13.8f}"
 # FORMAT (20X,20I3)
-FMT_CNTR, STEP_CNTR = _format_helper_section("CENTRE ASSIGNMENTS", 20, "{:3d}", 20)
+PREFIX_CNTR, SPEC_CNTR = "CENTRE ASSIGNMENTS  ", "%3d"
 # FORMAT (20X,20I3)
-FMT_TYPE, STEP_TYPE = _format_helper_section("TYPE ASSIGNMENTS", 20, "{:3d}", 20)
+PREFIX_TYPE, SPEC_TYPE = "TYPE ASSIGNMENTS    ", "%3d"
 # FORMAT (10X,5E14.7)
-FMT_EXPN, STEP_EXPN = _format_helper_section("EXPONENTS", 10, "{:14.7E}", 5)
+PREFIX_EXPN, SPEC_EXPN = "EXPONENTS ", "%14.7E"
 # FORMAT (5E16.8)
-FMT_COEF, STEP_COEF = _format_helper_section("", 0, "{:16.8E}", 5)
+SPEC_COEF = "%16.8E"
 # FORMAT (40I2)
-FMT_SPIN, STEP_SPIN = _format_helper_section("", 0, "{:2d}", 40)
+SPEC_SPIN = "%2d"
 # Default .WFN title
 DEFAULT_WFN_TTL = "WFN auto-generated by IOData"
 
@@ -548,80 +692,30 @@ def prepare_dump(data: IOData, allow_changes: bool, filename: str) -> IOData:
 )
 def dump_one(f: TextIO, data: IOData) -> None:
     """Do not edit this docstring. It will be overwritten."""
-    # get shells for the de-contracted basis
-    shells = []
-    for shell in data.obasis.shells:
-        if shell.ncon != 1:
-            raise RuntimeError("Generalized contractions not supported. Call prepare_dump first.")
-        # Decontract the shell
-        angmom = shell.angmoms[0]
-        kind = shell.kinds[0]
-        for exponent, coeff in zip(shell.exponents, shell.coeffs[:, 0]):
-            shells.append(Shell(shell.icenter, [angmom], [kind], [exponent], [[coeff]]))
-    # make a new instance of MolecularBasis with de-contracted basis shells; ideally for WFN we
-    # want the primitive basis set, but IOData only supports shells.
-    obasis = MolecularBasis(shells, data.obasis.conventions, data.obasis.primitive_normalization)
-    # expand mo.coeffs in the new basis by repeating de-contracted basis coefficients
-    permutation, signs = convert_conventions(data.obasis, CONVENTIONS)
-    raw_coeffs = data.mo.coeffs[permutation] * signs.reshape(-1, 1)
-    mo_coeffs = np.zeros((obasis.nbasis, data.mo.norb))
-    index_mo_old, index_mo_new = 0, 0
-    # loop over the shells of the old basis
-    for shell in data.obasis.shells:
-        for angmom, kind in zip(shell.angmoms, shell.kinds):
-            n = len(data.obasis.conventions[angmom, kind])
-            c = raw_coeffs[index_mo_old : index_mo_old + n]
-            for _ in range(shell.nexp):
-                mo_coeffs[index_mo_new : index_mo_new + n] = c
-                index_mo_new += n
-            index_mo_old += n
-
-    # fix MO coefficients
-    # 1) expansion coefficients in WFN correspond to un-normalized primitives, so the primitive
-    # normalization constants should be included in the MO coefficients. However, IOData stores
-    # normalized primitives (either L2 or L1 as recorded in MolecularBasis primitive types), so
-    # we need to multiply the MO coefficients by the primitive normalization constants
-    scales = get_mocoeff_scales(obasis)
-    # 2) expansion coefficients in WFN represent the primitive basis coefficients, so contraction
-    # coefficients needs to be multiplied by the MO expansion coefficients.
-    contractions = []
-    for shell in obasis.shells:
-        contractions.extend(np.repeat(shell.coeffs.ravel(), [shell.nbasis], axis=0))
-    contractions = np.array(contractions)
-
-    # update MO coefficients to include primitives contraction coefficients & normalization
-    for index in range(mo_coeffs.shape[1]):
-        mo_coeffs[:, index] *= contractions * scales
-
-    # Extract centre, type assignments and exponents from new obasis
-    cntrs = [shell.icenter + 1 for shell in obasis.shells for _ in range(shell.nbasis)]
-    expns = [shell.exponents[0] for shell in obasis.shells for _ in range(shell.nbasis)]
-    angmom_prim = {}
-    count = 1
-    for angmom in range(max([shell.angmoms[0] for shell in obasis.shells]) + 1):
-        angmom_prim[angmom] = [count + i for i in range(len(obasis.conventions[angmom, "c"]))]
-        count += len(obasis.conventions[angmom, "c"])
-    types = [item for shell in obasis.shells for item in angmom_prim[shell.angmoms[0]]]
+    # de-contract the basis set and the MO coefficients
+    icenters, type_assignments, exponents, mo_coeffs = decontract_obasis(
+        data.obasis, data.mo.coeffs
+    )
 
     # Write header (title, # MOs, # primitives, # atoms)
     print(f" {data.title if data.title else DEFAULT_WFN_TTL}", file=f)
-    print(FMT_NUM.format(data.mo.norb, obasis.nbasis, data.natom), file=f)
+    print(FMT_NUM.format(data.mo.norb, len(exponents), data.natom), file=f)
 
     # Write atoms (symbol, atom #, centre #, x pos., y pos., z pos., charge)
     for iatom, (n, (x, y, z)) in enumerate(zip(data.atnums, data.atcoords)):
         print(FMT_ATM.format(num2sym[n], iatom + 1, iatom + 1, x, y, z, n), file=f)
 
     # Write centre assignments, type assignments, exponents sections
-    _dump_helper_section(f, cntrs, FMT_CNTR, 20, STEP_CNTR, 20)
-    _dump_helper_section(f, types, FMT_TYPE, 20, STEP_TYPE, 20)
-    _dump_helper_section(f, expns, FMT_EXPN, 10, STEP_EXPN, 5)
+    _dump_helper_section(f, icenters + 1, SPEC_CNTR, PREFIX_CNTR, 20)
+    _dump_helper_section(f, type_assignments + 1, SPEC_TYPE, PREFIX_TYPE, 20)
+    _dump_helper_section(f, exponents, SPEC_EXPN, PREFIX_EXPN, 5)
 
     # Write MOs (mo #, occ #, energy)
     mo_iter = enumerate(zip(data.mo.occs, data.mo.energies, mo_coeffs.transpose()))
     for iorb, (occ, energy, coeffs) in mo_iter:
         print(FMT_MOS.format(iorb + 1, 0, occ, energy), file=f)
         # Write ``iorb``th coefficients section
-        _dump_helper_section(f, coeffs, FMT_COEF, 0, STEP_COEF, 5)
+        _dump_helper_section(f, coeffs, SPEC_COEF, "", 5)
 
     # Write energy and virial coefficient
     print("END DATA", file=f)
@@ -630,4 +724,4 @@ def dump_one(f: TextIO, data: IOData) -> None:
     # Write MOSPIN extension section (optional)
     if data.extra.get("mo_spin") is not None:
         print(" $MOSPIN $END\n\n", file=f)
-        _dump_helper_section(f, data.extra["mo_spin"], FMT_SPIN, 0, STEP_SPIN, 40)
+        _dump_helper_section(f, data.extra["mo_spin"], SPEC_SPIN, "", 40)
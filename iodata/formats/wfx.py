@@ -21,26 +21,34 @@
 See http://aim.tkgristmill.com/wfxformat.html
 """
 
-from collections.abc import Iterator
+from collections.abc import Collection, Iterator
 from typing import Optional, TextIO
 from warnings import warn
 
 import numpy as np
+from numpy.typing import NDArray
 
-from ..basis import MolecularBasis, Shell
-from ..convert import convert_conventions
 from ..docstrings import document_dump_one, document_load_one
 from ..iodata import IOData
 from ..orbitals import MolecularOrbitals
 from ..periodic import num2sym
 from ..prepare import prepare_segmented, prepare_unrestricted_aminusb
-from ..utils import LineIterator, LoadError, LoadWarning, PrepareDumpError
-from .wfn import CONVENTIONS, build_obasis, get_mocoeff_scales
+from ..utils import LineIterator, LoadError, LoadWarning, PrepareDumpError, format_lines
+from .wfn import (
+    LOAD_ONE_KWDOCS,
+    build_obasis,
+    contract_obasis,
+    decontract_obasis,
+    get_mocoeff_scales,
+)
 
 __all__ = ()
 
 PATTERNS = ["*.wfx"]
 
+# Format of floating point numbers, equivalent to "{: ,.14E}".
+SPEC_FLOAT = "% .14E"
+
 
 def _wfx_labels() -> tuple:
     """Build labels for wfx parser."""
@@ -118,17 +126,39 @@ def _wfx_labels() -> tuple:
     )
 
 
-def load_data_wfx(lit: LineIterator) -> dict:
-    """Process loaded WFX data."""
+def load_data_wfx(lit: LineIterator, tags: Optional[Collection[str]] = None) -> dict:
+    """Process loaded WFX data.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from.
+    tags
+        The tags of the sections to load, e.g. ``"<Nuclear Cartesian Energy Gradients>"``.
+        Required sections are always loaded. By default, all recognized sections are
+        loaded. Other sections are skipped without parsing their contents.
+
+    Returns
+    -------
+    A dictionary with the data in the requested sections, converted to the proper type.
+
+    """
     # get all section labels and required labels for WFX files
     lbs_str, lbs_int, lbs_float, lbs_aint, lbs_afloat, lbs_other, required_tags = _wfx_labels()
+    known_tags = {**lbs_str, **lbs_int, **lbs_float, **lbs_aint, **lbs_afloat, **lbs_other}
+    tags = set(known_tags if tags is None else tags) | set(required_tags)
+    # numerical arrays are parsed directly while reading the file
+    dtypes = dict.fromkeys(lbs_aint, int) | dict.fromkeys(lbs_afloat, float)
     # load sections in WFX and check required tags exists
-    data = parse_wfx(lit, required_tags)
+    data = parse_wfx(lit, required_tags, dtypes, tags)
 
     # process raw data to convert them to proper type based on their label
     result = {}
     for key, value in data.items():
-        if key in lbs_str:
+        if value is None:
+            if key not in known_tags:
+                warn(LoadWarning(f"Not recognized section label, skip {key}", lit), stacklevel=2)
+        elif key in lbs_str:
             if len(value) != 1:
                 raise LoadError(f"Expecting one value, got {len(value)}", lit)
             result[lbs_str[key]] = value[0]
@@ -141,13 +171,11 @@ def load_data_wfx(lit: LineIterator) -> dict:
                 raise LoadError(f"Expecting one value, got {len(value)}", lit)
             result[lbs_float[key]] = float(value[0])
         elif key in lbs_afloat:
-            result[lbs_afloat[key]] = np.fromstring(" ".join(value), dtype=float, sep=" ")
+            result[lbs_afloat[key]] = value
         elif key in lbs_aint:
-            result[lbs_aint[key]] = np.fromstring(" ".join(value), dtype=int, sep=" ")
-        elif key in lbs_other:
-            result[lbs_other[key]] = value
+            result[lbs_aint[key]] = value
         else:
-            warn(LoadWarning(f"Not recognized section label, skip {key}", lit), stacklevel=2)
+            result[lbs_other[key]] = value
 
     # reshape some arrays
     result["atcoords"] = result["atcoords"].reshape(-1, 3)
@@ -172,49 +200,252 @@ def load_data_wfx(lit: LineIterator) -> dict:
     return result
 
 
-def parse_wfx(lit: LineIterator, required_tags: Optional[list] = None) -> dict:
-    """Load data in all sections existing in the given WFX file LineIterator."""
+# The number of lines read at once in sections with numerical arrays.
+WFX_CHUNK = 4096
+
+# Sections whose product of integer values is the expected size of an array section.
+WFX_SIZE_TAGS = {
+    "<Atomic Numbers>": ["<Number of Nuclei>"],
+    "<Nuclear Charges>": ["<Number of Nuclei>"],
+    "<Nuclear Cartesian Coordinates>": ["<Number of Nuclei>", 3],
+    "<Primitive Centers>": ["<Number of Primitives>"],
+    "<Primitive Types>": ["<Number of Primitives>"],
+    "<Primitive Exponents>": ["<Number of Primitives>"],
+    "<Molecular Orbital Energies>": ["<Number of Occupied Molecular Orbitals>"],
+    "<Molecular Orbital Occupation Numbers>": ["<Number of Occupied Molecular Orbitals>"],
+    "<Molecular Orbital Primitive Coefficients>": [
+        "<Number of Primitives>",
+        "<Number of Occupied Molecular Orbitals>",
+    ],
+}
+
+
+def _get_size_hint(tag: str, data: dict) -> Optional[int]:
+    """Return the expected size of an array section, if it can be derived from the data."""
+    factors = WFX_SIZE_TAGS.get(tag)
+    if factors is None:
+        return None
+    size = 1
+    for factor in factors:
+        if isinstance(factor, str):
+            lines = data.get(factor)
+            if lines is None or len(lines) != 1 or not lines[0].isdigit():
+                return None
+            size *= int(lines[0])
+        else:
+            size *= factor
+    return size
+
+
+def _check_section_end(lit: LineIterator, section_end: str, line: str):
+    """Check that a line starting with ``</`` is the correct end of a section."""
+    # In some cases, closing tags have a different number of spaces. 8-[
+    if line.replace(" ", "") != section_end.replace(" ", ""):
+        raise LoadError(f"Expecting line {section_end} but got {line}.", lit)
+
+
+def _read_lines_section(lit: LineIterator, tag: str, section_end: str) -> list[str]:
+    """Read the stripped lines of a section up to its closing tag."""
+    lines = []
+    for line in lit:
+        line = line.strip()  # noqa: PLW2901
+        if line.startswith("</"):
+            _check_section_end(lit, section_end, line)
+            return lines
+        lines.append(line)
+    raise LoadError(f"Section {tag} is not closed at end of file.", lit)
+
+
+def _skip_section(lit: LineIterator, tag: str, section_end: str):
+    """Skip the contents of a section, including subsections, up to its closing tag."""
+    nested = 0
+    for line in lit:
+        line = line.strip()  # noqa: PLW2901
+        if line.startswith("</"):
+            if nested == 0:
+                _check_section_end(lit, section_end, line)
+                return
+            nested -= 1
+        elif line.startswith("<"):
+            nested += 1
+    raise LoadError(f"Section {tag} is not closed at end of file.", lit)
+
+
+def _rewind(lit: LineIterator, lines: list[str], iline: int):
+    """Go back to the line with index ``iline`` in a block of lines read with ``next_lines``."""
+    for line in reversed(lines[iline:]):
+        lit.back(line)
+
+
+def _read_array_section(
+    lit: LineIterator,
+    tag: str,
+    section_end: str,
+    dtype: type,
+    size_hint: Optional[int],
+    mo_numbers: Optional[list[str]] = None,
+) -> NDArray:
+    """Parse the numbers in a section into a one-dimensional array.
+
+    Lines are read in blocks of ``WFX_CHUNK``. The numbers in between two tags
+    of a block are parsed with a single conversion and copied into a preallocated
+    array, which is only enlarged when the size hint is missing or incorrect.
+
+    Parameters
+    ----------
+    lit
+        The line iterator, positioned after the opening tag.
+    tag
+        The opening tag of the section.
+    section_end
+        The expected closing tag of the section.
+    dtype
+        The data type of the numbers.
+    size_hint
+        The expected number of values, if known.
+    mo_numbers
+        When given, ``<MO Number>`` subsections are allowed and the numbers
+        they contain are appended to this list.
+
+    Returns
+    -------
+    An array with all numbers in the section.
+
+    """
+    values = np.empty(WFX_CHUNK if size_hint is None else size_hint, dtype=dtype)
+    nvalue = 0
+
+    def parse(text: str, lines: list[str], iline: int):
+        nonlocal values, nvalue
+        try:
+            new_values = np.array(text.split(), dtype=dtype)
+        except ValueError as exc:
+            _rewind(lit, lines, iline)
+            raise LoadError(f"Could not parse the numbers in section {tag}.", lit) from exc
+        if nvalue + len(new_values) > len(values):
+            values = np.concatenate(
+                [values[:nvalue], np.empty(max(len(values), len(new_values)), dtype=dtype)]
+            )
+        values[nvalue : nvalue + len(new_values)] = new_values
+        nvalue += len(new_values)
+
+    while True:
+        lines = lit.next_lines(WFX_CHUNK)
+        if len(lines) == 0:
+            raise LoadError(f"Section {tag} is not closed at end of file.", lit)
+        text = "".join(lines)
+        # Offset and line index of the part of the block that is not processed yet.
+        start, iline = 0, 0
+        while True:
+            pos = text.find("<", start)
+            if pos < 0:
+                parse(text[start:], lines, len(lines))
+                break
+            # Parse the numbers before the line with the tag.
+            itag = iline + text.count("\n", start, pos)
+            parse(text[start : text.rfind("\n", 0, pos) + 1], lines, itag)
+            line = lines[itag].strip()
+            if line.startswith("</"):
+                _rewind(lit, lines, itag + 1)
+                _check_section_end(lit, section_end, line)
+                return values[:nvalue] if nvalue == len(values) else values[:nvalue].copy()
+            if mo_numbers is None or line != "<MO Number>":
+                _rewind(lit, lines, itag + 1)
+                raise LoadError(f"Unexpected line {line} in section {tag}.", lit)
+            # Read the <MO Number> subsection, which may continue in the next block.
+            while len(lines) < itag + 3:
+                extra_lines = lit.next_lines(itag + 3 - len(lines))
+                if len(extra_lines) == 0:
+                    raise LoadError(f"Section {tag} is not closed at end of file.", lit)
+                lines.extend(extra_lines)
+                text += "".join(extra_lines)
+            mo_numbers.append(lines[itag + 1].strip())
+            line = lines[itag + 2].strip()
+            if line.replace(" ", "") != "</MONumber>":
+                _rewind(lit, lines, itag + 3)
+                raise LoadError(f"Expecting line </MO Number> but got {line}.", lit)
+            iline = itag + 3
+            start = pos
+            for _ in range(3):
+                start = text.find("\n", start) + 1 or len(text)
+
+
+def parse_wfx(
+    lit: LineIterator,
+    required_tags: Optional[list] = None,
+    dtypes: Optional[dict[str, type]] = None,
+    tags: Optional[Collection[str]] = None,
+) -> dict:
+    """Load data in all sections existing in the given WFX file LineIterator.
+
+    The file is read in a single pass, without keeping the lines of array sections
+    in memory.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the data from.
+    required_tags
+        The tags of the sections that must be present.
+    dtypes
+        The data types of sections with numerical arrays. These sections are
+        parsed into one-dimensional arrays. The numbers in ``<MO Number>``
+        subsections of ``<Molecular Orbital Primitive Coefficients>`` are stored
+        under the tag ``<MO Numbers>``.
+    tags
+        When given, only sections with these tags are loaded.
+
+    Returns
+    -------
+    A dictionary with the tags of all sections as keys. The values are lists of
+    stripped lines, arrays (for tags in ``dtypes``) or ``None`` (for skipped sections).
+
+    """
+    if dtypes is None:
+        dtypes = {}
     data = {}
     mo_start = "<Molecular Orbital Primitive Coefficients>"
-    section_start = None
 
-    while True:
-        # get a new line
-        try:
-            line = next(lit).strip()
-        except StopIteration:
-            break
-        # check whether line is the start of a section
-        if section_start is None and line.startswith("<"):
-            # set start & end of the section and add it to data dictionary
-            section_start = line
-            if section_start in data:
-                raise LoadError(f"Section with tag={section_start} is repeated.", lit)
-            data[section_start] = []
-            section_end = line[:1] + "/" + line[1:]
-            # special handling of <Molecular Orbital Primitive Coefficients> section
-            if section_start == mo_start:
-                data["<MO Numbers>"] = []
-        # check whether line is the (correct) end of the section
-        elif section_start is not None and line.startswith("</"):
-            # In some cases, closing tags have a different number of spaces. 8-[
-            if line.replace(" ", "") != section_end.replace(" ", ""):
-                raise LoadError(f"Expecting line {section_end} but got {line}.", lit)
-            # reset section_start variable to signal that section ended
-            section_start = None
-        # handle <MO Number> line under <Molecular Orbital Primitive Coefficients> section
-        elif section_start == mo_start and line == "<MO Number>":
-            # add MO Number to list
-            data["<MO Numbers>"].append(next(lit).strip())
-            # skip '</MO Number>' line
-            next(lit)
-        # add section content to the corresponding list in data dictionary
+    for line in lit:
+        section_start = line.strip()
+        # blank lines between sections are allowed
+        if section_start == "":
+            continue
+        if not section_start.startswith("<") or section_start.startswith("</"):
+            raise LoadError(f"Expecting the start of a section, got {section_start}.", lit)
+        if section_start in data:
+            raise LoadError(f"Section with tag={section_start} is repeated.", lit)
+        section_end = section_start[:1] + "/" + section_start[1:]
+        if tags is not None and section_start not in tags:
+            _skip_section(lit, section_start, section_end)
+            data[section_start] = None
+        elif section_start == mo_start:
+            # special handling of <MO Number> subsections
+            mo_numbers = []
+            data[section_start] = _read_array_section(
+                lit,
+                section_start,
+                section_end,
+                dtypes.get(section_start, float),
+                _get_size_hint(section_start, data),
+                mo_numbers,
+            )
+            data["<MO Numbers>"] = (
+                np.array(mo_numbers, dtype=dtypes["<MO Numbers>"])
+                if "<MO Numbers>" in dtypes
+                else mo_numbers
+            )
+        elif section_start in dtypes:
+            data[section_start] = _read_array_section(
+                lit,
+                section_start,
+                section_end,
+                dtypes[section_start],
+                _get_size_hint(section_start, data),
+            )
         else:
-            data[section_start].append(line)
+            data[section_start] = _read_lines_section(lit, section_start, section_end)
 
-    # check if last section was closed
-    if section_start is not None:
-        raise LoadError(f"Section {section_start} is not closed at end of file.", lit)
     # check required section tags
     if required_tags is not None:
         for section_tag in required_tags:
@@ -224,9 +455,11 @@ def parse_wfx(lit: LineIterator, required_tags: Optional[list] = None) -> dict:
 
 
 @document_load_one(
-    "WFX", ["atcoords", "atgradient", "atnums", "energy", "extra", "mo", "obasis", "title"]
+    "WFX",
+    ["atcoords", "atgradient", "atnums", "energy", "extra", "mo", "obasis", "title"],
+    kwdocs=LOAD_ONE_KWDOCS,
 )
-def load_one(lit: LineIterator) -> dict:
+def load_one(lit: LineIterator, reconstruct_contractions: bool = False) -> dict:
     """Do not edit this docstring. It will be overwritten."""
     # get data contained in WFX file with the proper type & shape
     data = load_data_wfx(lit)
@@ -258,6 +491,8 @@ def load_one(lit: LineIterator) -> dict:
     # L2-normalized (as stored in obasis.primitive_normalization) which is used in scaling MO
     # coefficients to be stored in MolecularOrbitals instance.
     data["mo_coeffs"] /= get_mocoeff_scales(obasis).reshape(-1, 1)
+    if reconstruct_contractions:
+        obasis, data["mo_coeffs"] = contract_obasis(obasis, data["mo_coeffs"])
 
     # process mo_spins and convert it into restricted or unrestricted & count alpha/beta orbitals
     # we do not using the <Model> section for this because it is not guaranteed to be present
@@ -386,53 +621,11 @@ def dump_one(f: TextIO, data: IOData):
     lbs = {**lbs_str, **lbs_int, **lbs_float, **lbs_aint, **lbs_afloat, **lbs_other}
     lbs = {v: k for k, v in lbs.items()}
 
-    # de-contract data.obasis
-    # -----------------------
-    # get shells for the de-contracted basis
-    shells = []
-    for shell in data.obasis.shells:
-        if shell.ncon != 1:
-            raise RuntimeError("Generalized contractions not supported. Call prepare_dump first.")
-        # Decontract the shell
-        angmom = shell.angmoms[0]
-        kind = shell.kinds[0]
-        for exponent, coeff in zip(shell.exponents, shell.coeffs[:, 0]):
-            shells.append(Shell(shell.icenter, [angmom], [kind], [exponent], [[coeff]]))
-    # make a new instance of MolecularBasis with de-contracted basis shells; ideally for WFX we
-    # want the primitive basis set, but IOData only supports shells.
-    obasis = MolecularBasis(shells, data.obasis.conventions, data.obasis.primitive_normalization)
-
-    # expand mo.coeffs in de-contracted basis primitives
-    # --------------------------------------------------
-    # expand mo.coeffs in the new basis by repeating de-contracted basis coefficients
-    permutation, signs = convert_conventions(data.obasis, CONVENTIONS)
-    raw_coeffs = data.mo.coeffs[permutation] * signs.reshape(-1, 1)
-    mo_coeffs = np.zeros((obasis.nbasis, data.mo.norb))
-    index_mo_old, index_mo_new = 0, 0
-    # loop over the shells of the old basis
-    for shell in data.obasis.shells:
-        for angmom, kind in zip(shell.angmoms, shell.kinds):
-            n = len(data.obasis.conventions[angmom, kind])
-            c = raw_coeffs[index_mo_old : index_mo_old + n]
-            for _j in range(shell.nexp):
-                mo_coeffs[index_mo_new : index_mo_new + n] = c
-                index_mo_new += n
-            index_mo_old += n
-    # fix MO coefficients
-    # 1) expansion coefficients in WFX correspond to un-normalized primitives, so the primitive
-    # normalization constants should be included in the MO coefficients. However, IOData stores
-    # normalized primitives (either L2 or L1 as recorded in MolecularBasis primitive types), so
-    # we need to multiply the MO coefficients by the primitive normalization constants
-    scales = get_mocoeff_scales(obasis)
-    # 2) expansion coefficients in WFX represent the primitive basis coefficients, so contraction
-    # coefficients needs to be multiplied by the MO expansion coefficients.
-    contractions = []
-    for shell in obasis.shells:
-        contractions.extend(np.repeat(shell.coeffs.ravel(), [shell.nbasis], axis=0))
-    contractions = np.array(contractions)
-    # update MO coefficients to include primitives contraction coefficients & normalization
-    for index in range(mo_coeffs.shape[1]):
-        mo_coeffs[:, index] *= contractions * scales
+    # de-contract data.obasis and expand mo.coeffs in de-contracted basis primitives
+    # ------------------------------------------------------------------------------
+    icenters, type_assignments, exponents, mo_coeffs = decontract_obasis(
+        data.obasis, data.mo.coeffs
+    )
 
     # write title & keywords
     _write_xml_single(tag=lbs["title"], info=data.title or "<Created with IOData>", file=f)
@@ -440,7 +633,7 @@ def dump_one(f: TextIO, data: IOData):
 
     # write number of nuclei & number of primitives
     _write_xml_single(tag=lbs["num_atoms"], info=data.natom, file=f)
-    _write_xml_single(tag=lbs["num_primitives"], info=obasis.nbasis, file=f)
+    _write_xml_single(tag=lbs["num_primitives"], info=len(exponents), file=f)
 
     # write number of occupied molecular orbitals
     # in practice wfx prints the total number of MO, even though the section title specifies
@@ -460,10 +653,9 @@ def dump_one(f: TextIO, data: IOData):
     _write_xml_iterator_scientific(tag=lbs["nuclear_charge"], info=data.atcorenums, file=f)
 
     # write nuclear cartesian coordinates
-    print("<Nuclear Cartesian Coordinates>", file=f)
-    for item in data.atcoords:
-        print(f"{item[0]: ,.14E} {item[1]: ,.14E} {item[2]: ,.14E}", file=f)
-    print("</Nuclear Cartesian Coordinates>", file=f)
+    _write_xml_lines(
+        lbs["atcoords"], format_lines(SPEC_FLOAT, data.atcoords.ravel(), 3, sep=" "), f
+    )
 
     # write net charge, number of electrons, number of alpha electrons, and number beta electrons
     _write_xml_single_scientific(tag=lbs["charge"], info=data.charge, file=f)
@@ -479,31 +671,10 @@ def dump_one(f: TextIO, data: IOData):
     if data.lot is not None:
         _write_xml_single(tag=lbs["model_name"], info=data.lot, file=f)
 
-    # write primitive centers
-    prim_centers = [shell.icenter + 1 for shell in obasis.shells for _ in range(shell.nbasis)]
-    print("<Primitive Centers>", file=f)
-    for j in range(0, len(prim_centers), 10):
-        print(" ".join([f"{c:d}" for c in prim_centers[j : j + 10]]), file=f)
-    print("</Primitive Centers>", file=f)
-
-    # write primitive types
-    angmom_prim = {}
-    count = 1
-    for angmom in range(max([shell.angmoms[0] for shell in obasis.shells]) + 1):
-        angmom_prim[angmom] = [count + i for i in range(len(obasis.conventions[angmom, "c"]))]
-        count += len(obasis.conventions[angmom, "c"])
-    prim_types = [item for shell in obasis.shells for item in angmom_prim[shell.angmoms[0]]]
-    print("<Primitive Types>", file=f)
-    for j in range(0, len(prim_types), 10):
-        print(" ".join([f"{c:d}" for c in prim_types[j : j + 10]]), file=f)
-    print("</Primitive Types>", file=f)
-
-    # write primitive exponents
-    exponents = [shell.exponents[0] for shell in obasis.shells for _ in range(shell.nbasis)]
-    print("<Primitive Exponents>", file=f)
-    for j in range(0, len(exponents), 4):
-        print(" ".join([f"{e: ,.14E}" for e in exponents[j : j + 4]]), file=f)
-    print("</Primitive Exponents>", file=f)
+    # write primitive centers, types and exponents
+    _write_xml_lines(lbs["centers"], format_lines("%d", icenters + 1, 10, sep=" "), f)
+    _write_xml_lines(lbs["types"], format_lines("%d", type_assignments + 1, 10, sep=" "), f)
+    _write_xml_lines(lbs["exponents"], format_lines(SPEC_FLOAT, exponents, 4, sep=" "), f)
 
     # write molecular orbital occupation numbers
     _write_xml_iterator_scientific(tag=lbs["mo_occs"], info=data.mo.occs, file=f)
@@ -518,15 +689,14 @@ def dump_one(f: TextIO, data: IOData):
         mo_spin = ["Alpha"] * len(data.mo.occsa) + ["Beta"] * len(data.mo.occsb)
     _write_xml_iterator(tag=lbs["mo_spins"], info=mo_spin, file=f)
 
-    # write MO primitive coefficients
-    print("<Molecular Orbital Primitive Coefficients>", file=f)
+    # write MO primitive coefficients, one orbital at a time to limit memory usage
+    f.write(f"{lbs['mo_coeffs']}\n")
     for mo in range(len(data.mo.occs)):
-        print("<MO Number>", file=f)
-        print(str(mo + 1), file=f)
-        print("</MO Number>", file=f)
-        for j in range(0, obasis.nbasis, 4):
-            print(" ".join([f"{c: ,.14E}" for c in mo_coeffs.T[mo][j : j + 4]]), file=f)
-    print("</Molecular Orbital Primitive Coefficients>", file=f)
+        f.write(
+            f"<MO Number>\n{mo + 1}\n</MO Number>\n"
+            + format_lines(SPEC_FLOAT, mo_coeffs[:, mo], 4, sep=" ")
+        )
+    f.write(f"</{lbs['mo_coeffs'][1:]}\n")
 
     # write energy and virial ratio; use ' NAN' when None (not available)
     _write_xml_single_scientific(tag=lbs["energy"], info=data.energy or np.nan, file=f)
@@ -534,15 +704,9 @@ def dump_one(f: TextIO, data: IOData):
 
     # write nuclear Cartesian energy gradients (optional)
     if data.atgradient is not None:
-        nuc_cart_energy_grad = list(zip(nuclear_names, data.atgradient))
-        print("<Nuclear Cartesian Energy Gradients>", file=f)
-        for atom in nuc_cart_energy_grad:
-            print(
-                atom[0],
-                f"{atom[1][0]: ,.14E} {atom[1][1]: ,.14E} {atom[1][2]: ,.14E}",
-                file=f,
-            )
-        print("</Nuclear Cartesian Energy Gradients>", file=f)
+        prefixes = [f"{name} " for name in nuclear_names]
+        gradient = format_lines(SPEC_FLOAT, data.atgradient.ravel(), 3, prefixes, " ")
+        _write_xml_lines(lbs["nuclear_gradient"], gradient, f)
 
     # nuclear virial of energy-gradient-based forces on nuclei (optional)
     if data.extra.get("nuc_viral") is not None:
@@ -557,31 +721,26 @@ def dump_one(f: TextIO, data: IOData):
         _write_xml_single(lbs["num_core_electrons"], data.extra["num_core_electrons"], f)
 
 
+def _write_xml_lines(tag: str, lines: str, file: TextIO) -> None:
+    """Write header, tail and the formatted lines between them into the file."""
+    file.write(f"{tag}\n{lines}</{tag[1:]}\n")
+
+
 def _write_xml_single(tag: str, info: [str, int], file: TextIO) -> None:
     """Write header, tail and the data between them into the file."""
-    print(tag, file=file)
-    print(info, file=file)
-    print("</" + tag.lstrip("<"), file=file)
+    _write_xml_lines(tag, f"{info}\n", file)
 
 
 def _write_xml_single_scientific(tag: str, info: float, file: TextIO) -> None:
     """Write header, tail and the data between them into the file."""
-    print(tag, file=file)
-    print(f"{info: ,.14E}", file=file)
-    print("</" + tag.lstrip("<"), file=file)
+    _write_xml_lines(tag, format_lines(SPEC_FLOAT, [info], 1), file)
 
 
 def _write_xml_iterator(tag: str, info: Iterator, file: TextIO) -> None:
     """Write list of arrays to file."""
-    print(tag, file=file)
-    for info_line in info:
-        print(info_line, file=file)
-    print("</" + tag.lstrip("<"), file=file)
+    _write_xml_lines(tag, "".join(f"{info_line}\n" for info_line in info), file)
 
 
 def _write_xml_iterator_scientific(tag: str, info: Iterator, file: TextIO) -> None:
     """Write list of arrays to file."""
-    print(tag, file=file)
-    for info_line in info:
-        print(f"{info_line: ,.14E}", file=file)
-    print("</" + tag.lstrip("<"), file=file)
+    _write_xml_lines(tag, format_lines(SPEC_FLOAT, info, 1), file)
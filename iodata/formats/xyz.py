@@ -53,10 +53,11 @@ information loaded from a file can also be written back out when dumping it.
 
 """
 
-from collections.abc import Iterator
-from typing import TextIO
+from collections.abc import Callable, Iterator
+from typing import Optional, TextIO
 
 import numpy as np
+from numpy.typing import NDArray
 
 from ..docstrings import (
     document_dump_many,
@@ -66,7 +67,15 @@ from ..docstrings import (
 )
 from ..iodata import IOData
 from ..periodic import num2sym, sym2num
-from ..utils import LineIterator, angstrom
+from ..utils import (
+    RECORD_KWDOCS,
+    LineIterator,
+    LoadError,
+    angstrom,
+    format_table,
+    iter_selected_records,
+    strtobool,
+)
 
 __all__ = ()
 
@@ -104,9 +113,58 @@ string).
 """
 
 
+def _load_unique_words(loadword: Callable) -> Callable:
+    """Return a function that calls loadword only once for every distinct word in an array."""
+
+    def load_words(words: NDArray[object]) -> list:
+        words = words.ravel().tolist()
+        values = {word: loadword(word) for word in dict.fromkeys(words)}
+        return [values[word] for word in words]
+
+    return load_words
+
+
+COLUMN_LOADERS = {
+    DEFAULT_ATOM_COLUMNS[0][4]: _load_unique_words(DEFAULT_ATOM_COLUMNS[0][4]),
+    DEFAULT_ATOM_COLUMNS[1][4]: (lambda words: words.astype(float) * angstrom),
+    float: (lambda words: words.astype(float)),
+    int: (lambda words: words.astype(int)),
+    str: (lambda words: words),
+    strtobool: _load_unique_words(strtobool),
+}
+"""Vectorized versions of load_word functions, used to convert all words of a column at once.
+
+The keys are load_word functions, as used in ``atom_columns``, and the values are
+functions that take a two-dimensional array of words (with dtype object) and return
+an array or list with the same number of values. Columns with other load_word functions
+are converted word by word.
+"""
+
+
 @document_load_one("XYZ", ["atcoords", "atnums", "title"], [], {"atom_columns": ATOM_COLUMNS_DOC})
 def load_one(lit: LineIterator, atom_columns=None) -> dict:
     """Do not edit this docstring. It will be overwritten."""
+    return _load_frame(lit, atom_columns, COLUMN_LOADERS)
+
+
+def _load_frame(lit: LineIterator, atom_columns: Optional[list], column_loaders: dict) -> dict:
+    """Load a single frame, converting the atom lines column by column when possible.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the frame from.
+    atom_columns
+        See ``ATOM_COLUMNS_DOC``. When None, ``DEFAULT_ATOM_COLUMNS`` is used.
+    column_loaders
+        A dictionary with vectorized versions of load_word functions,
+        see ``COLUMN_LOADERS``.
+
+    Returns
+    -------
+    The data loaded from the frame.
+
+    """
     # Load the header.
     natom = int(next(lit))
     title = next(lit).strip()
@@ -114,8 +172,12 @@ def load_one(lit: LineIterator, atom_columns=None) -> dict:
         atom_columns = DEFAULT_ATOM_COLUMNS
     data = {"title": title}
     # Initialize the arrays to be loaded from the XYZ file.
+    arrays = []
+    sizes = []
     for attrname, keyname, shapesuffix, dtype, _loadword, _dumpword in atom_columns:
         array = np.zeros((natom, *shapesuffix), dtype=dtype)
+        arrays.append(array)
+        sizes.append(int(np.prod(shapesuffix)))
         if keyname is None:
             # Store the initial array as a normal attribute.
             data[attrname] = array
@@ -123,28 +185,119 @@ def load_one(lit: LineIterator, atom_columns=None) -> dict:
             # Store the initial array as a value in an dictionary attribute.
             data.setdefault(attrname, {})[keyname] = array
     # Load the atom lines.
-    for iatom in range(natom):
-        words = next(lit).split()
-        for attrname, keyname, _shapesuffix, _dtype, loadword, _dumpword in atom_columns:
-            # Get the slice of the array where properties for the current atom
-            # must be stored.
-            if keyname is None:
-                # The array is a normal attribute.
-                atom_array = data[attrname][iatom : iatom + 1]
-            else:
-                # The array is a value of a dictionary attribute.
-                atom_array = data[attrname][keyname][iatom : iatom + 1]
+    lines = lit.next_lines(natom)
+    if len(lines) < natom:
+        raise StopIteration
+    words = _split_atom_lines(lines, sum(sizes))
+    if words is None:
+        _load_atom_lines(lines, atom_columns, arrays)
+        return data
+    # Convert the words, one column at a time.
+    begin = 0
+    for array, size, column in zip(arrays, sizes, atom_columns):
+        loadword = column[4]
+        column_words = words[:, begin : begin + size]
+        begin += size
+        load_words = column_loaders.get(loadword)
+        if load_words is None:
+            # Generic path for custom columns
+            values = [loadword(word) for word in column_words.flat]
+        else:
+            values = load_words(column_words)
+        array[:] = np.reshape(values, array.shape)
+    return data
+
+
+def _split_atom_lines(lines: list[str], nfield: int) -> Optional[NDArray[str]]:
+    """Split the atom lines into a two-dimensional array of words.
+
+    Parameters
+    ----------
+    lines
+        The atom lines.
+    nfield
+        The number of words to be loaded from each line.
+        Additional words at the end of a line are ignored.
+
+    Returns
+    -------
+    An array of words with shape ``(len(lines), nfield)``,
+    or None if some lines contain too few words.
+    The dtype is object, because such arrays of strings are much faster
+    to create and to convert than arrays with a fixed-width string dtype.
+
+    """
+    if len(lines) == 0:
+        return np.empty((0, nfield), dtype=object)
+    # All lines are split at once. A null character is inserted after every line,
+    # to check that each line contains exactly nfield words.
+    words = (" \0 ".join(lines) + " \0").split()
+    if words[nfield :: nfield + 1] == ["\0"] * len(lines):
+        del words[nfield :: nfield + 1]
+    else:
+        words = [word for line in lines for word in line.split()[:nfield]]
+        if len(words) != len(lines) * nfield:
+            return None
+    return np.array(words, dtype=object).reshape(len(lines), nfield)
+
+
+def _load_atom_lines(lines: list[str], atom_columns: list, arrays: list[NDArray]):
+    """Load the atom lines one by one, converting all words with the load_word functions."""
+    for iatom, line in enumerate(lines):
+        words = line.split()
+        for array, (_attrname, _keyname, _shapesuffix, _dtype, loadword, _dumpword) in zip(
+            arrays, atom_columns
+        ):
             # Fill in array elements with atomic properties. For each new value
             # to be loaded, the first element of the list words is consumed and
             # converted to the right format for IOData.
+            atom_array = array[iatom : iatom + 1]
             for ifield in range(atom_array.size):
                 atom_array.flat[ifield] = loadword(words.pop(0))
-    return data
 
 
-@document_load_many("XYZ", ["atcoords", "atnums", "title"], [], {"atom_columns": ATOM_COLUMNS_DOC})
-def load_many(lit: LineIterator, atom_columns=None) -> Iterator[dict]:
+LOAD_MANY_KWDOCS = {
+    "atom_columns": ATOM_COLUMNS_DOC,
+    "shared_topology": "When True, all frames must have the same atoms, which are only "
+    "converted to atomic numbers for the first frame. For the following frames with the "
+    "default atom_columns, only the coordinates are parsed, after checking that the "
+    "element column is identical to that of the first frame. All frames then share the "
+    "same atnums array. When False, every frame is loaded independently.",
+    **RECORD_KWDOCS,
+}
+
+
+@document_load_many("XYZ", ["atcoords", "atnums", "title"], [], LOAD_MANY_KWDOCS)
+def load_many(
+    lit: LineIterator,
+    atom_columns=None,
+    shared_topology: bool = False,
+    where: Optional[Callable[[dict], bool]] = None,
+    records: Optional[range] = None,
+) -> Iterator[dict]:
     """Do not edit this docstring. It will be overwritten."""
+    first = None
+    symbols = None
+
+    def load_frame(lit: LineIterator) -> dict:
+        nonlocal first, symbols
+        if first is None or not shared_topology:
+            first = load_one(lit, atom_columns)
+            return first
+        if atom_columns is None:
+            data, symbols = _load_coordinates(lit, first, symbols)
+            return data
+        data = load_one(lit, atom_columns)
+        if "atnums" in data:
+            _check_atnums(lit, first, data["atnums"])
+            data["atnums"] = first["atnums"]
+        return data
+
+    if where is not None or records is not None:
+        yield from iter_selected_records(
+            lit, _read_header, load_frame, _skip_record, where, records
+        )
+        return
     # XYZ Trajectory files are a simple concatenation of individual XYZ files,'
     # making it trivial to load many frames.
     try:
@@ -154,29 +307,114 @@ def load_many(lit: LineIterator, atom_columns=None) -> Iterator[dict]:
             if line.strip() == "":
                 return
             lit.back(line)
-            yield load_one(lit, atom_columns)
+            yield load_frame(lit)
     except StopIteration:
         return
 
 
+def _read_header(lit: LineIterator) -> Optional[tuple[dict, list[str]]]:
+    """Read the number of atoms and the title of the next frame."""
+    line = next(lit)
+    if line.strip() == "":
+        return None
+    title = next(lit)
+    return {"title": title.strip(), "natom": int(line)}, [line, title]
+
+
+def _skip_record(lit: LineIterator, header: dict):
+    """Skip the atom lines of a frame without parsing them."""
+    if len(lit.next_lines(header["natom"])) < header["natom"]:
+        raise StopIteration
+
+
+def skip_frame(lit: LineIterator):
+    """Skip one frame without parsing it, raising StopIteration after the last frame."""
+    header_lines = _read_header(lit)
+    if header_lines is None:
+        raise StopIteration
+    _skip_record(lit, header_lines[0])
+
+
+def _check_atnums(lit: LineIterator, first: dict, atnums: NDArray[int]):
+    """Check that a frame has the same atoms as the first frame."""
+    if not np.array_equal(atnums, first["atnums"]):
+        raise LoadError("The atoms differ from those in the first frame.", lit)
+
+
+def _load_coordinates(
+    lit: LineIterator, first: dict, symbols: Optional[NDArray[str]]
+) -> tuple[dict, NDArray[str]]:
+    """Load a frame with default atom columns, reusing the atomic numbers of the first frame.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the frame from.
+    first
+        The data loaded from the first frame.
+    symbols
+        The element column of a previous frame, which has been checked already
+        to be consistent with the first frame. Pass None if not available yet.
+
+    Returns
+    -------
+    data
+        The data loaded from the frame, with the atnums array of the first frame.
+    symbols
+        The element column of the current frame.
+
+    """
+    natom = int(next(lit))
+    title = next(lit).strip()
+    lines = lit.next_lines(natom)
+    if len(lines) < natom:
+        raise StopIteration
+    # Additional columns are ignored, as in load_one.
+    words = _split_atom_lines(lines, 4)
+    if words is None:
+        raise LoadError("Expecting at least four words on every atom line.", lit)
+    if symbols is None or not np.array_equal(words[:, 0], symbols):
+        # Only convert the elements when the column differs from the previous frame.
+        load_atnums = COLUMN_LOADERS[DEFAULT_ATOM_COLUMNS[0][4]]
+        _check_atnums(lit, first, np.array(load_atnums(words[:, :1]), dtype=int))
+    data = {
+        "title": title,
+        "atnums": first["atnums"],
+        "atcoords": COLUMN_LOADERS[DEFAULT_ATOM_COLUMNS[1][4]](words[:, 1:]),
+    }
+    return data, words[:, 0]
+
+
 @document_dump_one("XYZ", ["atcoords", "atnums"], ["title"], {"atom_columns": ATOM_COLUMNS_DOC})
 def dump_one(f: TextIO, data: IOData, atom_columns=None):
     """Do not edit this docstring. It will be overwritten."""
     if atom_columns is None:
         atom_columns = DEFAULT_ATOM_COLUMNS
-    # Write the header
-    print(data.natom, file=f)
-    print(data.title or "Created with IOData", file=f)
-    # Write the atom lines
-    for iatom in range(data.natom):
-        words = []
-        for attrname, keyname, _shapesuffix, _dtype, _loadword, dumpword in atom_columns:
-            values = getattr(data, attrname)
-            if keyname is not None:
-                # The data to be written is a value of a dictionary attribute.
-                values = values[keyname]
-            words.extend(dumpword(value) for value in values[iatom].flat)
-        print(" ".join(words), file=f)
+    # Prepare the columns of the atom lines. The default columns are formatted
+    # in bulk, giving the same result as their dump_word functions.
+    specs = []
+    columns = []
+    for column in atom_columns:
+        attrname, keyname, _shapesuffix, _dtype, _loadword, dumpword = column
+        values = getattr(data, attrname)
+        if keyname is not None:
+            # The data to be written is a value of a dictionary attribute.
+            values = values[keyname]
+        if column is DEFAULT_ATOM_COLUMNS[0]:
+            specs.append("%-2s")
+            columns.append([num2sym[atnum] for atnum in values.tolist()])
+        elif column is DEFAULT_ATOM_COLUMNS[1]:
+            specs.extend(["%15.10f"] * 3)
+            columns.extend((values / angstrom).T)
+        else:
+            specs.append("%s")
+            columns.append(
+                [" ".join(dumpword(value) for value in atom_values.flat) for atom_values in values]
+            )
+    f.write(
+        f"{data.natom}\n{data.title or 'Created with IOData'}\n"
+        + format_table(" ".join(specs), columns)
+    )
 
 
 @document_dump_many("XYZ", ["atcoords", "atnums"], ["title"], {"atom_columns": ATOM_COLUMNS_DOC})
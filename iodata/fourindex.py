@@ -0,0 +1,551 @@
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Packed storage of four-index objects with 8-fold permutational symmetry.
+
+Four-index objects with real basis functions, such as electron repulsion integrals or
+two-particle density matrices, have an 8-fold permutational symmetry. In chemists'
+notation, :math:`(ij|kl)` is invariant under the exchange of :math:`i` and :math:`j`,
+the exchange of :math:`k` and :math:`l`, and the exchange of the pairs :math:`ij` and
+:math:`kl`. In physicists' notation, the same element is written as
+:math:`\\langle ik|jl \\rangle`.
+
+The unique elements are stored in a one-dimensional array, using compound indices
+:math:`ij = i(i+1)/2 + j` for :math:`i \\ge j` and
+:math:`ijkl = ij(ij+1)/2 + kl` for :math:`ij \\ge kl` (in chemists' notation).
+The elements are stored in the order of increasing compound index.
+This requires about 1/8 of the memory of a dense array.
+
+Instances of :py:class:`PackedFourIndex` can be stored in ``IOData.two_ints`` and
+``IOData.two_rdms`` instead of dense arrays. They support NumPy-style indexing in
+physicists' notation and can be converted to dense arrays with ``numpy.asarray``.
+When most unique elements are zero, e.g. due to point-group symmetry,
+:py:class:`SparseFourIndex` stores only the compound indices and values of the
+nonzero elements and has the same interface.
+"""
+
+from collections.abc import Iterator
+from typing import Optional, Union
+
+import attrs
+import numpy as np
+from numpy.typing import NDArray
+
+from .attrutils import convert_array_to, validate_shape
+from .utils import set_four_index_element
+
+__all__ = ("PackedFourIndex", "SparseFourIndex", "pair_index", "unpair_index")
+
+
+# The number of elements processed at once when converting from or to dense arrays.
+CHUNK_SIZE = 1 << 20
+
+
+NOTATIONS = ("physicists", "chemists")
+
+
+def pair_index(
+    i0: Union[int, NDArray[int]], i1: Union[int, NDArray[int]]
+) -> Union[int, NDArray[int]]:
+    """Return the compound index of an unordered pair of indices.
+
+    Parameters
+    ----------
+    i0, i1
+        Integers or integer arrays with the two indices.
+
+    Returns
+    -------
+    The compound index ``i(i+1)/2 + j``, where ``i`` and ``j`` are the largest
+    and the smallest of both indices, respectively.
+
+    """
+    big = np.maximum(i0, i1).astype(np.int64)
+    small = np.minimum(i0, i1)
+    return big * (big + 1) // 2 + small
+
+
+def unpair_index(index: Union[int, NDArray[int]]) -> tuple[NDArray[int], NDArray[int]]:
+    """Split compound indices into pairs of indices, the inverse of ``pair_index``.
+
+    Parameters
+    ----------
+    index
+        An integer or integer array with compound indices.
+
+    Returns
+    -------
+    The largest and the smallest index of each pair.
+
+    """
+    index = np.asarray(index, dtype=np.int64)
+    big = ((np.sqrt(8.0 * index + 1) - 1) // 2).astype(np.int64)
+    # Correct for rounding errors in the square root.
+    big -= big * (big + 1) // 2 > index
+    big += (big + 1) * (big + 2) // 2 <= index
+    return big, index - big * (big + 1) // 2
+
+
+def _iter_packed_indices(
+    nbasis: int, chunk_size: int = CHUNK_SIZE
+) -> Iterator[tuple[int, NDArray[int], NDArray[int], NDArray[int], NDArray[int]]]:
+    """Iterate over chunks of unique elements of a packed four-index object.
+
+    Parameters
+    ----------
+    nbasis
+        The number of basis functions.
+    chunk_size
+        The (maximal) number of elements in one chunk.
+
+    Yields
+    ------
+    begin
+        The position of the first element of the chunk in the packed data.
+    i0, i1, i2, i3
+        The indices of the elements of the chunk in chemists' notation.
+
+    """
+    npair = nbasis * (nbasis + 1) // 2
+    size = npair * (npair + 1) // 2
+    for begin in range(0, size, chunk_size):
+        yield begin, *_split_compound_index(np.arange(begin, min(begin + chunk_size, size)))
+
+
+def _split_compound_index(
+    compound: NDArray[int],
+) -> tuple[NDArray[int], NDArray[int], NDArray[int], NDArray[int]]:
+    """Convert compound indices into four indices in chemists' notation."""
+    pair01, pair23 = unpair_index(compound)
+    i0, i1 = unpair_index(pair01)
+    i2, i3 = unpair_index(pair23)
+    return i0, i1, i2, i3
+
+
+def _check_notation(notation: str):
+    if notation not in NOTATIONS:
+        raise ValueError(f"Notation must be one of {NOTATIONS}, got {notation}.")
+
+
+def _compound_index(indices: tuple, notation: str) -> NDArray[int]:
+    """Return the compound index in the packed array of four (broadcastable) indices."""
+    _check_notation(notation)
+    i0, i1, i2, i3 = indices
+    if notation == "physicists":
+        return pair_index(pair_index(i0, i2), pair_index(i1, i3))
+    return pair_index(pair_index(i0, i1), pair_index(i2, i3))
+
+
+def _get_block_compound_index(nbasis: int, key: tuple, notation: str) -> tuple[NDArray[int], tuple]:
+    """Convert a key for a block of a four-index object into compound indices.
+
+    Parameters
+    ----------
+    nbasis
+        The number of basis functions.
+    key
+        A tuple with four items, each one being an integer, a slice or an integer array.
+    notation
+        The notation of the indices, ``physicists`` or ``chemists``.
+
+    Returns
+    -------
+    compound
+        A four-index array with the compound indices of the block.
+    squeeze
+        An index to remove the axes that were indexed with an integer.
+
+    """
+    _check_notation(notation)
+    if not isinstance(key, tuple) or len(key) != 4:
+        raise IndexError("Four indices are needed to index a four-index object.")
+    all_indices = np.arange(nbasis)
+    axis_indices = []
+    squeeze = []
+    for item in key:
+        if isinstance(item, slice):
+            axis_indices.append(all_indices[item])
+            squeeze.append(slice(None))
+        elif np.ndim(item) == 0:
+            axis_indices.append(all_indices[[item]])
+            squeeze.append(0)
+        else:
+            axis_indices.append(all_indices[np.asarray(item)].ravel())
+            squeeze.append(slice(None))
+    return _compound_index(np.ix_(*axis_indices), notation), tuple(squeeze)
+
+
+def _scatter_dense(
+    nbasis: int,
+    dtype,
+    chunks: Iterator[tuple[NDArray[int], NDArray[int], NDArray[int], NDArray[int], NDArray]],
+    notation: str,
+) -> NDArray:
+    """Create a dense array from chunks of unique elements in chemists' notation."""
+    _check_notation(notation)
+    result = np.zeros((nbasis,) * 4, dtype=dtype)
+    # Elements are always assigned in physicists' notation, possibly through a
+    # transposed view of the result.
+    target = result if notation == "physicists" else result.transpose(0, 2, 1, 3)
+    for i0, i1, i2, i3, values in chunks:
+        set_four_index_element(target, i0, i2, i1, i3, values)
+    return result
+
+
+def _validate_data(obj, attribute, value):
+    """Validate the length of the packed data."""
+    npair = obj.nbasis * (obj.nbasis + 1) // 2
+    expected = npair * (npair + 1) // 2
+    if value.shape != (expected,):
+        raise TypeError(
+            f"Expecting shape ({expected},) for attribute {attribute.name}, got {value.shape}"
+        )
+
+
+@attrs.define
+class PackedFourIndex:
+    """A four-index object with 8-fold permutational symmetry, storing only unique elements.
+
+    Indexing with ``obj[i, j, k, l]`` follows physicists' notation, like all four-index
+    objects in IOData. Each index can be an integer, a slice or an integer array (which
+    selects a block of elements, like ``numpy.ix_``). Use the ``chemists`` view to
+    index in chemists' notation instead.
+    """
+
+    nbasis: int = attrs.field()
+    """The number of basis functions (or orbitals)."""
+
+    data: NDArray[float] = attrs.field(
+        converter=lambda value: np.asarray(value, dtype=float), validator=_validate_data
+    )
+    """The unique elements, ordered by increasing compound index in chemists' notation."""
+
+    @classmethod
+    def zeros(cls, nbasis: int) -> "PackedFourIndex":
+        """Create a packed four-index object with all elements set to zero."""
+        npair = nbasis * (nbasis + 1) // 2
+        return cls(nbasis, np.zeros(npair * (npair + 1) // 2))
+
+    @classmethod
+    def from_dense(cls, array: NDArray[float], notation: str = "physicists") -> "PackedFourIndex":
+        """Create a packed four-index object from a dense array.
+
+        The symmetry of the dense array is not checked. For each set of symmetry-related
+        elements, only the one at the canonical position is used.
+
+        Parameters
+        ----------
+        array
+            The dense array with shape ``(nbasis, nbasis, nbasis, nbasis)``.
+        notation
+            The notation of the dense array, ``physicists`` or ``chemists``.
+
+        """
+        _check_notation(notation)
+        nbasis = array.shape[0]
+        if array.shape != (nbasis,) * 4:
+            raise TypeError(f"Expecting a four-index array, got shape {array.shape}")
+        if notation == "physicists":
+            array = array.transpose(0, 2, 1, 3)
+        result = cls.zeros(nbasis)
+        for begin, i0, i1, i2, i3 in _iter_packed_indices(nbasis):
+            result.data[begin : begin + len(i0)] = array[i0, i1, i2, i3]
+        return result
+
+    @classmethod
+    def from_elements(
+        cls,
+        nbasis: int,
+        i0: NDArray[int],
+        i1: NDArray[int],
+        i2: NDArray[int],
+        i3: NDArray[int],
+        values: NDArray[float],
+        notation: str = "physicists",
+    ) -> "PackedFourIndex":
+        """Create a packed four-index object from lists of (unique) elements.
+
+        Parameters
+        ----------
+        nbasis
+            The number of basis functions.
+        i0, i1, i2, i3
+            Arrays with the (zero-based) indices of the elements.
+        values
+            The values of the elements.
+        notation
+            The notation of the indices, ``physicists`` or ``chemists``.
+
+        """
+        result = cls.zeros(nbasis)
+        result.data[_compound_index((i0, i1, i2, i3), notation)] = values
+        return result
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        """Shape of the corresponding dense array."""
+        return (self.nbasis,) * 4
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the corresponding dense array."""
+        return 4
+
+    @property
+    def dtype(self):
+        """Data type of the elements."""
+        return self.data.dtype
+
+    @property
+    def physicists(self) -> "PackedFourIndex":
+        """Return the object itself, whose indexing uses physicists' notation."""
+        return self
+
+    @property
+    def chemists(self) -> "FourIndexView":
+        """Return a view for indexing in chemists' notation."""
+        return FourIndexView(self, "chemists")
+
+    def __getitem__(self, key) -> Union[float, NDArray[float]]:
+        """Get an element or a block in physicists' notation."""
+        return self.get_block(key, "physicists")
+
+    def __array__(self, dtype=None, copy=None) -> NDArray[float]:
+        """Convert to a dense array in physicists' notation."""
+        result = self.to_dense()
+        return result if dtype is None else result.astype(dtype)
+
+    def get_block(self, key: tuple, notation: str = "physicists") -> Union[float, NDArray[float]]:
+        """Get an element or a block of elements.
+
+        Parameters
+        ----------
+        key
+            A tuple with four items, each one being an integer, a slice or an integer array.
+            Axes with an integer index are removed from the result.
+        notation
+            The notation of the indices, ``physicists`` or ``chemists``.
+
+        Returns
+        -------
+        A single value when all four indices are integers, an array otherwise.
+
+        """
+        compound, squeeze = _get_block_compound_index(self.nbasis, key, notation)
+        result = self.data[compound][squeeze]
+        return result[()] if result.ndim == 0 else result
+
+    def to_dense(self, notation: str = "physicists") -> NDArray[float]:
+        """Convert to a dense array.
+
+        Parameters
+        ----------
+        notation
+            The notation of the dense array, ``physicists`` or ``chemists``.
+
+        Returns
+        -------
+        The dense array with shape ``(nbasis, nbasis, nbasis, nbasis)``.
+
+        """
+        return _scatter_dense(self.nbasis, self.dtype, self.iter_elements(), notation)
+
+    def iter_elements(
+        self, threshold: Optional[float] = None, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[tuple[NDArray[int], NDArray[int], NDArray[int], NDArray[int], NDArray[float]]]:
+        """Iterate over the unique elements, in chunks.
+
+        Parameters
+        ----------
+        threshold
+            When given, only elements whose absolute value exceeds the threshold are
+            included.
+        chunk_size
+            The number of unique elements considered in one iteration.
+
+        Yields
+        ------
+        i0, i1, i2, i3
+            The (zero-based) indices of the elements in chemists' notation,
+            with ``i0 >= i1``, ``i2 >= i3`` and ``(i0, i1) >= (i2, i3)``.
+        values
+            The values of the elements.
+
+        """
+        for begin, *indices in _iter_packed_indices(self.nbasis, chunk_size):
+            values = self.data[begin : begin + len(indices[0])]
+            if threshold is None:
+                yield (*indices, values)
+            else:
+                mask = abs(values) > threshold
+                yield (*(index[mask] for index in indices), values[mask])
+
+
+def _validate_compound(obj, attribute, value):
+    """Validate that compound indices are in range and strictly increasing."""
+    npair = obj.nbasis * (obj.nbasis + 1) // 2
+    if len(value) > 0 and (value[0] < 0 or value[-1] >= npair * (npair + 1) // 2):
+        raise ValueError(f"Attribute {attribute.name} contains compound indices out of range.")
+    if (value[1:] <= value[:-1]).any():
+        raise ValueError(f"Attribute {attribute.name} must be strictly increasing.")
+
+
+@attrs.define
+class SparseFourIndex:
+    """A four-index object with 8-fold permutational symmetry, storing only selected elements.
+
+    Unique elements are stored in coordinate format, i.e. as a sorted array of compound
+    indices in chemists' notation with the corresponding values. Elements that are not
+    stored are zero. Indexing works as for :py:class:`PackedFourIndex`.
+    """
+
+    nbasis: int = attrs.field()
+    """The number of basis functions (or orbitals)."""
+
+    compound: NDArray[int] = attrs.field(
+        converter=convert_array_to(np.int64),
+        validator=[validate_shape(None), _validate_compound],
+    )
+    """The strictly increasing compound indices of the stored elements."""
+
+    values: NDArray[float] = attrs.field(
+        converter=convert_array_to(float), validator=validate_shape(("compound", 0))
+    )
+    """The values of the stored elements."""
+
+    @classmethod
+    def from_packed(cls, packed: PackedFourIndex, threshold: float = 0.0) -> "SparseFourIndex":
+        """Create a sparse four-index object from a packed one.
+
+        Parameters
+        ----------
+        packed
+            The packed four-index object.
+        threshold
+            Only elements whose absolute value exceeds the threshold are stored.
+
+        """
+        (compound,) = np.nonzero(abs(packed.data) > threshold)
+        return cls(packed.nbasis, compound, packed.data[compound])
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        """Shape of the corresponding dense array."""
+        return (self.nbasis,) * 4
+
+    @property
+    def ndim(self) -> int:
+        """Number of dimensions of the corresponding dense array."""
+        return 4
+
+    @property
+    def dtype(self):
+        """Data type of the elements."""
+        return self.values.dtype
+
+    @property
+    def physicists(self) -> "SparseFourIndex":
+        """Return the object itself, whose indexing uses physicists' notation."""
+        return self
+
+    @property
+    def chemists(self) -> "FourIndexView":
+        """Return a view for indexing in chemists' notation."""
+        return FourIndexView(self, "chemists")
+
+    def __getitem__(self, key) -> Union[float, NDArray[float]]:
+        """Get an element or a block in physicists' notation."""
+        return self.get_block(key, "physicists")
+
+    def __array__(self, dtype=None, copy=None) -> NDArray[float]:
+        """Convert to a dense array in physicists' notation."""
+        result = self.to_dense()
+        return result if dtype is None else result.astype(dtype)
+
+    def get_block(self, key: tuple, notation: str = "physicists") -> Union[float, NDArray[float]]:
+        """Get an element or a block of elements.
+
+        See :py:meth:`PackedFourIndex.get_block` for the meaning of the arguments.
+        """
+        compound, squeeze = _get_block_compound_index(self.nbasis, key, notation)
+        result = np.zeros(compound.shape, dtype=self.dtype)
+        if len(self.compound) > 0:
+            positions = np.searchsorted(self.compound, compound).clip(max=len(self.compound) - 1)
+            found = self.compound[positions] == compound
+            result[found] = self.values[positions[found]]
+        result = result[squeeze]
+        return result[()] if result.ndim == 0 else result
+
+    def to_packed(self) -> PackedFourIndex:
+        """Convert to a packed four-index object."""
+        result = PackedFourIndex.zeros(self.nbasis)
+        result.data[self.compound] = self.values
+        return result
+
+    def to_dense(self, notation: str = "physicists") -> NDArray[float]:
+        """Convert to a dense array.
+
+        See :py:meth:`PackedFourIndex.to_dense` for the meaning of the arguments.
+        """
+        return _scatter_dense(self.nbasis, self.dtype, self.iter_elements(), notation)
+
+    def iter_elements(
+        self, threshold: Optional[float] = None, chunk_size: int = CHUNK_SIZE
+    ) -> Iterator[tuple[NDArray[int], NDArray[int], NDArray[int], NDArray[int], NDArray[float]]]:
+        """Iterate over the stored elements, in chunks.
+
+        See :py:meth:`PackedFourIndex.iter_elements` for the meaning of the arguments
+        and the yielded arrays.
+        """
+        for begin in range(0, len(self.compound), chunk_size):
+            compound = self.compound[begin : begin + chunk_size]
+            values = self.values[begin : begin + chunk_size]
+            if threshold is not None:
+                mask = abs(values) > threshold
+                compound = compound[mask]
+                values = values[mask]
+            yield (*_split_compound_index(compound), values)
+
+
+@attrs.define
+class FourIndexView:
+    """A view on a packed or sparse four-index object, using a different notation for indexing."""
+
+    packed: Union[PackedFourIndex, SparseFourIndex] = attrs.field()
+    """The packed or sparse four-index object."""
+
+    notation: str = attrs.field(validator=attrs.validators.in_(NOTATIONS))
+    """The notation used for indexing and for dense arrays."""
+
+    @property
+    def shape(self) -> tuple[int, int, int, int]:
+        """Shape of the corresponding dense array."""
+        return self.packed.shape
+
+    def __getitem__(self, key) -> Union[float, NDArray[float]]:
+        """Get an element or a block."""
+        return self.packed.get_block(key, self.notation)
+
+    def __array__(self, dtype=None, copy=None) -> NDArray[float]:
+        """Convert to a dense array."""
+        result = self.to_dense()
+        return result if dtype is None else result.astype(dtype)
+
+    def to_dense(self) -> NDArray[float]:
+        """Convert to a dense array."""
+        return self.packed.to_dense(self.notation)
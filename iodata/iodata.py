@@ -253,6 +253,8 @@ class IOData:
     basis the integrals are computed.
     See ``one_ints`` for more details.
     Array indexes are in physicists' notation.
+    Values may also be :py:class:`iodata.fourindex.PackedFourIndex` instances,
+    which only store the unique elements.
     """
 
     two_rdms: dict = attrs.field(factory=dict)
@@ -263,6 +265,8 @@ class IOData:
     basis the RDMs are computed.
     See ``one_rdms`` for more details.
     Array indexes are in physicists' notation.
+    Values may also be :py:class:`iodata.fourindex.PackedFourIndex` instances,
+    which only store the unique elements.
     """
 
     def __attrs_post_init__(self):
@@ -0,0 +1,209 @@
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Parallel loading of files with many independent records.
+
+Files such as SDF and MOL2 libraries are a concatenation of records, one per
+molecule. The functions in this module find the record boundaries with a fast scan
+of the raw bytes, after which chunks of records are parsed in a pool of worker
+processes. The results are yielded in the same order as in the file.
+"""
+
+import io
+import mmap
+import re
+import warnings
+from collections import deque
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
+from importlib import import_module
+from typing import Optional
+
+from .utils import LineIterator, LoadError
+
+__all__ = ("PARALLEL_KWDOCS", "iter_record_chunks", "load_many_parallel")
+
+
+PARALLEL_KWDOCS = {
+    "nworker": "The number of worker processes used to load the records in parallel. "
+    "With the default value 0, all records are loaded sequentially in the current process. "
+    "The results are the same in both cases, and they are always yielded in the order "
+    "of the file.",
+    "chunksize": "The number of records loaded at once by a worker process. "
+    "Larger chunks reduce the communication overhead, while smaller chunks "
+    "reduce the memory usage. This is ignored when nworker is 0.",
+}
+
+
+def iter_record_chunks(
+    filename: str, boundary: re.Pattern, chunksize: int
+) -> Iterator[tuple[int, int, int]]:
+    """Split a file into chunks of records, by scanning the raw bytes for record boundaries.
+
+    Parameters
+    ----------
+    filename
+        The file to scan.
+    boundary
+        A compiled regular expression for bytes. The end of every match is the position
+        in between two records.
+    chunksize
+        The (maximum) number of record boundaries in one chunk.
+
+    Yields
+    ------
+    begin
+        The position of the first byte of the chunk.
+    end
+        The position after the last byte of the chunk.
+    lineno
+        The number of lines preceding the chunk.
+
+    """
+    if chunksize < 1:
+        raise ValueError("The number of records in a chunk must be strictly positive.")
+    with open(filename, "rb") as f:
+        size = f.seek(0, io.SEEK_END)
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            begin = 0
+            lineno = 0
+            nboundary = 0
+            for match in boundary.finditer(mm):
+                nboundary += 1
+                if nboundary == chunksize:
+                    end = match.end()
+                    yield begin, end, lineno
+                    lineno += mm[begin:end].count(b"\n")
+                    begin = end
+                    nboundary = 0
+            if begin < size:
+                yield begin, size, lineno
+
+
+def _load_chunk(
+    modname: str, filename: str, begin: int, end: int, lineno: int
+) -> tuple[list[tuple[dict, list]], Optional[LoadError], Optional[Exception]]:
+    """Load all records in a chunk of a file, in a worker process.
+
+    Parameters
+    ----------
+    modname
+        The name of the format module, whose ``load_many`` function is used.
+    filename
+        The file to load from.
+    begin, end, lineno
+        The chunk to load, see ``iter_record_chunks``.
+
+    Returns
+    -------
+    results
+        A list of tuples, one for each record, with the data loaded from the record
+        and the warnings raised while loading it.
+    exception
+        The LoadError raised after the last record, if any. Other exceptions are
+        wrapped in a LoadError, such that the line number is not lost.
+    cause
+        The wrapped exception, if any. (The cause of an exception is not pickled.)
+
+    """
+    with open(filename, "rb") as f:
+        f.seek(begin)
+        raw = f.read(end - begin)
+    # The chunk is decoded in the same way as the original file would be, and the
+    # line numbers are continued as if the whole file was read.
+    lit = LineIterator(filename)
+    lit.fh = io.TextIOWrapper(io.BytesIO(raw))
+    lit.lineno = lineno
+    results = []
+    with warnings.catch_warnings(record=True) as caught:
+        warnings.simplefilter("always")
+        try:
+            for data in import_module(modname).load_many(lit):
+                results.append((data, [item.message for item in caught]))
+                caught.clear()
+        except Exception as exc:  # noqa: BLE001
+            # The exception is raised again in the main process, after yielding
+            # the records loaded before it.
+            results.append((None, [item.message for item in caught]))
+            if isinstance(exc, LoadError):
+                return results, exc, None
+            return results, LoadError("Uncaught exception while loading file.", lit), exc
+    return results, None, None
+
+
+def load_many_parallel(
+    lit: LineIterator, modname: str, boundary: re.Pattern, nworker: int, chunksize: int
+) -> Iterator[dict]:
+    """Load the records in a file in parallel, yielding the results in order.
+
+    Parameters
+    ----------
+    lit
+        The line iterator of the file. Only its filename is used.
+    modname
+        The name of the format module. Its ``load_many`` function, called without
+        optional arguments, is used to load the records in each chunk.
+    boundary
+        A compiled regular expression for bytes, see ``iter_record_chunks``.
+    nworker
+        The number of worker processes.
+    chunksize
+        The number of records loaded at once by a worker process.
+
+    Yields
+    ------
+    data
+        The data loaded from each record, in the order of the file.
+        Warnings raised in the worker processes are raised again, before yielding
+        the corresponding record.
+
+    Notes
+    -----
+    At most ``2 * nworker`` chunks are submitted to the worker processes
+    and not yet yielded. This bounds the memory usage, also when the records are
+    consumed more slowly than they are loaded.
+
+    """
+    if nworker < 1:
+        raise ValueError("The number of worker processes must be strictly positive.")
+    chunks = iter_record_chunks(lit.filename, boundary, chunksize)
+    pending = deque()
+    executor = ProcessPoolExecutor(nworker)
+    try:
+        while True:
+            # Submit new chunks until the maximum number of pending chunks is reached.
+            while len(pending) < 2 * nworker:
+                chunk = next(chunks, None)
+                if chunk is None:
+                    break
+                pending.append(executor.submit(_load_chunk, modname, lit.filename, *chunk))
+            if len(pending) == 0:
+                return
+            results, exception, cause = pending.popleft().result()
+            for data, messages in results:
+                for message in messages:
+                    warnings.warn(message, stacklevel=2)
+                if data is not None:
+                    yield data
+            if exception is not None:
+                raise exception from cause
+    finally:
+        chunks.close()
+        executor.shutdown(wait=True, cancel_futures=True)
@@ -23,13 +23,14 @@ and focus on the functionality of the API rather than the formats.
 """
 
 import os
+from importlib.resources import as_file, files
 
 import pytest
 from numpy.testing import assert_allclose, assert_array_equal
 
 from ..api import dump_many, dump_one, load_many, write_input
 from ..iodata import IOData
-from ..utils import DumpError, FileFormatError, PrepareDumpError
+from ..utils import DumpError, FileFormatError, LoadError, PrepareDumpError
 
 
 def test_json_no_pattern(tmpdir):
@@ -116,3 +117,58 @@ def test_dump_many_generator(tmpdir):
     assert_array_equal(iodatas[1].atnums, iodata1.atnums)
     assert_allclose(iodatas[0].atcoords, iodata0.atcoords)
     assert_allclose(iodatas[1].atcoords, iodata1.atcoords)
+
+
+@pytest.mark.parametrize(
+    ("fn", "fmt", "kwargs"),
+    [
+        ("water_trajectory.xyz", "xyz", {}),
+        ("water_trajectory.xyz", "xyz", {"shared_topology": True}),
+        ("dataset_blanklines.xyz", "xyz", {}),
+        ("water_extended_trajectory.xyz", "extxyz", {}),
+        ("water2.gro", "gromacs", {}),
+        ("water_trajectory.pdb", "pdb", {}),
+        ("water_trajectory_no_model.pdb", "pdb", {"shared_topology": True}),
+        ("example.sdf", "sdf", {}),
+        ("caffeine.mol2", "mol2", {}),
+        ("peroxide_irc.fchk", "fchk", {}),
+    ],
+)
+@pytest.mark.parametrize(
+    ("start", "stop", "step"), [(0, None, 2), (1, None, 3), (1, 3, 1), (2, 2, 1), (0, 100, 5)]
+)
+def test_load_many_slice(fn, fmt, kwargs, start, stop, step):
+    with as_file(files("iodata.test.data").joinpath(fn)) as path:
+        iodatas0 = list(load_many(str(path), fmt=fmt, **kwargs))[start:stop:step]
+        iodatas1 = list(load_many(str(path), fmt=fmt, start=start, stop=stop, step=step, **kwargs))
+    assert len(iodatas0) == len(iodatas1)
+    for iodata0, iodata1 in zip(iodatas0, iodatas1):
+        assert iodata0.title == iodata1.title
+        assert_array_equal(iodata0.atnums, iodata1.atnums)
+        assert_array_equal(iodata0.atcoords, iodata1.atcoords)
+
+
+def test_load_many_slice_skipped(tmpdir):
+    # Frames outside the slice are not parsed, so errors in them go unnoticed.
+    path_xyz = os.path.join(tmpdir, "traj.xyz")
+    with open(path_xyz, "w") as f:
+        f.write("1\na\nH 0 0 0\n1\nb\nXx 0 0 x\n1\nc\nHe 0 0 1\n")
+    with pytest.raises(LoadError):
+        list(load_many(path_xyz))
+    iodatas = list(load_many(path_xyz, step=2))
+    assert [iodata.title for iodata in iodatas] == ["a", "c"]
+    assert_array_equal(iodatas[1].atnums, [2])
+    with pytest.raises(ValueError):
+        list(load_many(path_xyz, step=0))
+
+
+def test_load_many_slice_where(tmpdir):
+    # The slice applies to the frames selected with where or records.
+    path_xyz = os.path.join(tmpdir, "traj.xyz")
+    with open(path_xyz, "w") as f:
+        for i in range(6):
+            f.write(f"1\nmol{i}\nH 0 0 {i}\n")
+    iodatas = load_many(path_xyz, where=lambda header: header["index"] % 2 == 1, step=2)
+    assert [iodata.title for iodata in iodatas] == ["mol1", "mol5"]
+    iodatas = load_many(path_xyz, records=range(1, 6), start=1, stop=3)
+    assert [iodata.title for iodata in iodatas] == ["mol2", "mol3"]
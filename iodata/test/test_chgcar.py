@@ -53,3 +53,44 @@ def test_load_chgcar_water():
     assert_equal(mol.cube.shape, (3, 3, 3))
     assert_allclose(mol.cube.axes, mol.cellvecs / 3, atol=1.0e-10)
     assert abs(mol.cube.origin).max() < 1e-10
+
+
+def test_load_chgcar_water_region():
+    with as_file(files("iodata.test.data").joinpath("CHGCAR.water")) as fn:
+        mol1 = load_one(str(fn))
+        mol2 = load_one(str(fn), region=(slice(1, None), slice(None), slice(0, 3, 2)))
+    assert_equal(mol2.cube.shape, (2, 3, 2))
+    assert_allclose(mol2.cube.data, mol1.cube.data[1:, :, ::2])
+    assert_allclose(mol2.cube.origin, mol1.cube.axes[0], atol=1.0e-10)
+    assert_allclose(mol2.cube.axes, mol1.cube.axes * [[1], [1], [2]], atol=1.0e-10)
+    assert_allclose(mol2.cellvecs, mol1.cellvecs)
+
+
+def test_load_chgcar_oxygen_spin():
+    with as_file(files("iodata.test.data").joinpath("CHGCAR.oxygen.spin")) as fn:
+        mol1 = load_one(str(fn))
+        mol2 = load_one(str(fn), load_magnetization=True)
+        mol3 = load_one(
+            str(fn), region=(slice(None), slice(1, 2), slice(None)), load_magnetization=True
+        )
+    vol = volume(mol1.cellvecs)
+    assert_equal(mol1.cube.shape, [2, 2, 3])
+    assert "magnetization" not in mol1.extra
+    assert_allclose(mol1.cube.data[1, 0, 0], 0.76183317989e04 / vol, atol=1.0e-10)
+    assert_allclose(mol1.cube.data[1, 1, 2], 0.52389208413e03 / vol, atol=1.0e-10)
+    assert_allclose(mol2.cube.data, mol1.cube.data)
+    mag = mol2.extra["magnetization"]
+    assert_equal(mag.shape, [2, 2, 3])
+    assert_allclose(mag.axes, mol2.cube.axes)
+    assert_allclose(mag.origin, mol2.cube.origin)
+    assert_allclose(mag.data[0, 0, 0], 0.12345678901e03 / vol, atol=1.0e-10)
+    assert_allclose(mag.data[0, 1, 0], 0.34567890123e03 / vol, atol=1.0e-10)
+    assert_allclose(mag.data[1, 1, 2], -0.43456789012e02 / vol, atol=1.0e-10)
+    assert_allclose(mol3.cube.data, mol1.cube.data[:, 1:2])
+    assert_allclose(mol3.extra["magnetization"].data, mag.data[:, 1:2])
+
+
+def test_load_chgcar_oxygen_no_magnetization():
+    with as_file(files("iodata.test.data").joinpath("CHGCAR.oxygen")) as fn:
+        mol = load_one(str(fn), load_magnetization=True)
+    assert "magnetization" not in mol.extra
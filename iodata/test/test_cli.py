@@ -21,6 +21,7 @@
 import os
 import subprocess
 import sys
+from argparse import ArgumentTypeError
 from functools import partial
 from importlib.resources import as_file, files
 from typing import Optional
@@ -30,6 +31,7 @@ import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..__main__ import convert as convfn
+from ..__main__ import parse_frames
 from ..api import load_many, load_one
 from ..utils import FileFormatError, PrepareDumpError, PrepareDumpWarning
 
@@ -41,6 +43,7 @@ def _convscript(
     infmt: Optional[str] = None,
     outfmt: Optional[str] = None,
     allow_changes: bool = False,
+    frames: Optional[slice] = None,
 ):
     """Simulate the convert function by calling iodata-convert in a subprocess."""
     args = [sys.executable, "-m", "iodata.__main__", infn, outfn]
@@ -52,6 +55,9 @@ def _convscript(
         args.append(f"--outfmt={outfmt}")
     if allow_changes:
         args.append("-c")
+    if frames is not None:
+        fields = [frames.start, frames.stop, frames.step]
+        args.append("--frames=" + ":".join("" if field is None else str(field) for field in fields))
     cp = subprocess.run(args, capture_output=True, check=False, encoding="utf8")
     if cp.returncode == 0:
         if allow_changes and "PrepareDumpWarning" in cp.stderr:
@@ -149,3 +155,25 @@ def test_convert_many_autofmt(tmpdir, convert):
 def test_convert_many_manfmt(tmpdir, convert):
     myconvert = partial(convert, many=True, infmt="fchk", outfmt="xyz")
     _check_convert_many(myconvert, tmpdir)
+
+
+@pytest.mark.parametrize("convert", [convfn, _convscript])
+def test_convert_many_frames(tmpdir, convert):
+    outfn = os.path.join(tmpdir, "tmp.xyz")
+    with as_file(files("iodata.test.data").joinpath("water_trajectory.xyz")) as infn:
+        convert(infn, outfn, frames=slice(1, None, 2))
+        iodatas0 = list(load_many(infn))
+    iodatas1 = list(load_many(outfn))
+    assert [iodata.title for iodata in iodatas1] == ["Frame 1", "Frame 3"]
+    for iodata0, iodata1 in zip(iodatas0[1::2], iodatas1):
+        assert_equal(iodata0.atnums, iodata1.atnums)
+        assert_allclose(iodata0.atcoords, iodata1.atcoords, atol=1e-5)
+
+
+def test_parse_frames():
+    assert parse_frames("1:10") == slice(1, 10)
+    assert parse_frames("::5") == slice(None, None, 5)
+    assert parse_frames("2::3") == slice(2, None, 3)
+    for text in ["5", "1:2:3:4", "a:b"]:
+        with pytest.raises(ArgumentTypeError):
+            parse_frames(text)
@@ -21,9 +21,12 @@
 from importlib.resources import as_file, files
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_one, load_one
+from ..formats.cube import _iter_grid_planes
+from ..utils import Cube, LineIterator, LoadError
 
 
 def test_load_aelta():
@@ -125,3 +128,151 @@ def test_load_dump_nh3_7points(tmpdir):
         content1 = f.read().split("\n", 2)[-1]
     content2 = fn_cube2.read().split("\n", 2)[-1]
     assert content1 == content2
+
+
+def test_dump_chunked_nh3_7points(tmpdir, monkeypatch):
+    # Writing in chunks that do not align with the file layout must not change the output.
+    with as_file(files("iodata.test.data").joinpath("cubegen_nh3_7points.cube")) as fn_cube1:
+        mol1 = load_one(str(fn_cube1))
+    fn_cube2 = tmpdir.join("iodata_nh3_7points.cube")
+    monkeypatch.setattr("iodata.formats.cube.CUBE_WRITE_CHUNK", 10)
+    dump_one(mol1, fn_cube2)
+    with open(fn_cube1) as f:
+        content1 = f.read().split("\n", 2)[-1]
+    content2 = fn_cube2.read().split("\n", 2)[-1]
+    assert content1 == content2
+
+
+@pytest.mark.parametrize(
+    ("region", "stride"),
+    [
+        ((slice(2, 9), slice(None), slice(5, None)), None),
+        (None, 4),
+        (None, (1, 3, 5)),
+        ((slice(1, None, 2), slice(10, 2, -3), slice(None, 5)), 2),
+        ((slice(11, 12), slice(0, 1), slice(None)), None),
+    ],
+)
+def test_load_region_stride_aelta(region, stride):
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol1 = load_one(str(fn_cube))
+        mol2 = load_one(str(fn_cube), region=region, stride=stride)
+    if region is None:
+        region = (slice(None),) * 3
+    if stride is None:
+        stride = 1
+    strides = np.broadcast_to(stride, 3)
+    index = tuple(np.arange(12)[s][::t] for s, t in zip(region, strides))
+    assert_allclose(mol2.cube.data, mol1.cube.data[np.ix_(*index)])
+    # Check that the grid points are at the correct positions.
+    grid1 = mol1.cube.origin + np.dot(
+        np.array(np.meshgrid(*index, indexing="ij")).T, mol1.cube.axes
+    )
+    ranges = [np.arange(size) for size in mol2.cube.shape]
+    grid2 = mol2.cube.origin + np.dot(
+        np.array(np.meshgrid(*ranges, indexing="ij")).T, mol2.cube.axes
+    )
+    assert_allclose(grid1, grid2, atol=1e-10)
+    assert_allclose(mol2.cellvecs, mol2.cube.axes * np.array(mol2.cube.shape)[:, None])
+    assert_equal(mol2.atnums, mol1.atnums)
+
+
+@pytest.mark.parametrize(
+    ("region", "stride"), [((slice(5, 5), slice(None), slice(None)), None), (None, 0)]
+)
+def test_load_region_stride_invalid(region, stride):
+    with (
+        as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube,
+        pytest.raises(LoadError),
+    ):
+        load_one(str(fn_cube), region=region, stride=stride)
+
+
+def _water_mos_value(ix, iy, iz, imo):
+    # Values used to generate the test file water_mos.cube.
+    return np.sin(ix + 2 * iy + 3 * iz + 0.5 * imo) * 10.0 ** (3 - imo)
+
+
+def test_load_water_mos():
+    with as_file(files("iodata.test.data").joinpath("water_mos.cube")) as fn_cube:
+        mol = load_one(str(fn_cube))
+    assert mol.title == "Water orbitals 4, 5 and 7"
+    assert_equal(mol.atnums, [8, 1, 1])
+    assert_allclose(mol.atcoords[1], [0.0, 1.430901, -0.886659])
+    assert_allclose(mol.cube.origin, [-1.0, -2.0, -0.5])
+    assert_allclose(mol.cube.axes, np.diag([1.5, 1.2, 1.0]))
+    assert_equal(mol.cube.mo_indices, [4, 5, 7])
+    assert_equal(mol.cube.shape, (2, 3, 4))
+    assert_equal(mol.cube.data.shape, (3, 2, 3, 4))
+    expected = _water_mos_value(*np.ix_(range(2), range(3), range(4), [4, 5, 7]))
+    assert_allclose(mol.cube.data, np.moveaxis(expected, 3, 0), rtol=1e-5)
+
+
+def test_load_water_mos_selection():
+    with as_file(files("iodata.test.data").joinpath("water_mos.cube")) as fn_cube:
+        mol1 = load_one(str(fn_cube))
+        mol2 = load_one(
+            str(fn_cube), mo_indices=[7, 4], region=(slice(1, 2), slice(None), slice(1, None, 2))
+        )
+    assert_equal(mol2.cube.mo_indices, [7, 4])
+    assert_equal(mol2.cube.data.shape, (2, 1, 3, 2))
+    assert_allclose(mol2.cube.data, mol1.cube.data[[2, 0], 1:2, :, 1::2])
+    assert_allclose(mol2.cube.origin, mol1.cube.origin + np.array([1.5, 0.0, 1.0]))
+
+
+def test_load_water_mos_selection_invalid():
+    with (
+        as_file(files("iodata.test.data").joinpath("water_mos.cube")) as fn_cube,
+        pytest.raises(LoadError),
+    ):
+        load_one(str(fn_cube), mo_indices=[4, 6])
+    with (
+        as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube,
+        pytest.raises(LoadError),
+    ):
+        load_one(str(fn_cube), mo_indices=[1])
+
+
+def test_load_dump_water_mos(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("water_mos.cube")) as fn_cube1:
+        mol1 = load_one(str(fn_cube1))
+    fn_cube2 = tmpdir.join("water_mos.cube")
+    dump_one(mol1, fn_cube2)
+    with open(fn_cube1) as f:
+        content1 = f.read().split("\n", 2)[-1]
+    content2 = fn_cube2.read().split("\n", 2)[-1]
+    assert content1 == content2
+
+
+def test_dump_many_mos(tmpdir):
+    # More than nine orbitals need more than one line for the orbital indices.
+    with as_file(files("iodata.test.data").joinpath("water_mos.cube")) as fn_cube1:
+        mol1 = load_one(str(fn_cube1))
+    mo_indices = np.arange(1, 13)
+    data = np.random.default_rng(42).normal(size=(12, *mol1.cube.shape))
+    mol1.cube = Cube(mol1.cube.origin, mol1.cube.axes, data, mo_indices)
+    fn_cube2 = str(tmpdir.join("water_mos.cube"))
+    dump_one(mol1, fn_cube2)
+    with open(fn_cube2) as f:
+        lines = f.readlines()
+    assert lines[2].split()[0] == "-3"
+    assert_equal([int(word) for word in lines[9].split()], [12, *range(1, 10)])
+    assert_equal([int(word) for word in lines[10].split()], [10, 11, 12])
+    mol2 = load_one(fn_cube2)
+    assert_equal(mol2.cube.mo_indices, mo_indices)
+    assert_allclose(mol2.cube.data, data, rtol=1e-4)
+
+
+@pytest.mark.parametrize("iplanes", [[0, 2, 4], [1, 5], [3]])
+def test_iter_grid_planes_long_lines(tmpdir, iplanes):
+    # More values on a line than on a plane, as in VASP files with small planes.
+    fn = str(tmpdir.join("grid.txt"))
+    values = np.arange(24.0)
+    with open(fn, "w") as f:
+        for i in range(0, 24, 10):
+            f.write(" ".join(str(value) for value in values[i : i + 10]) + "\n")
+    with LineIterator(fn) as lit:
+        planes = list(_iter_grid_planes(lit, np.array([6, 2, 2]), iplanes))
+    assert [iplane for iplane, _plane in planes] == iplanes
+    for iplane, plane in planes:
+        assert_equal(plane, values.reshape(6, 2, 2)[iplane])
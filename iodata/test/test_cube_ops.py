@@ -0,0 +1,148 @@
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Test iodata.cube_ops module."""
+
+from importlib.resources import as_file, files
+
+import numpy as np
+import pytest
+from numpy.testing import assert_allclose, assert_equal
+
+from ..api import dump_one, load_one
+from ..cube_ops import (
+    integrate,
+    iter_cube_slabs,
+    linear_combination,
+    load_cube_header,
+    minmax,
+    reduce,
+)
+from ..utils import LoadError
+
+
+@pytest.mark.parametrize("nslab", [1, 5, 12, 20])
+def test_iter_cube_slabs_aelta(nslab):
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol = load_one(str(fn_cube))
+        slabs = [slab.copy() for slab in iter_cube_slabs(str(fn_cube), nslab)]
+    assert all(len(slab) <= nslab for slab in slabs)
+    assert_allclose(np.concatenate(slabs), mol.cube.data)
+
+
+def test_load_cube_header_aelta():
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol = load_one(str(fn_cube))
+        header = load_cube_header(str(fn_cube))
+    assert header.title == mol.title
+    assert header.natom == mol.natom
+    assert_equal(header.atnums, mol.atnums)
+    assert_allclose(header.atcorenums, mol.atcorenums)
+    assert_allclose(header.atcoords, mol.atcoords)
+    assert_allclose(header.origin, mol.cube.origin)
+    assert_allclose(header.axes, mol.cube.axes)
+    assert header.shape == mol.cube.shape
+
+
+@pytest.mark.parametrize("nslab", [1, 5])
+def test_integrate_minmax_aelta(nslab):
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol = load_one(str(fn_cube))
+        integral = integrate(str(fn_cube), nslab=nslab)
+        integral_squared = integrate(str(fn_cube), np.square, nslab)
+        lower, upper = minmax(str(fn_cube), nslab)
+    dv = abs(np.linalg.det(mol.cube.axes))
+    assert_allclose(integral, mol.cube.data.sum() * dv)
+    assert_allclose(integral_squared, (mol.cube.data**2).sum() * dv)
+    assert lower == mol.cube.data.min()
+    assert upper == mol.cube.data.max()
+
+
+def test_linear_combination_aelta(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol1 = load_one(str(fn_cube))
+    mol2 = load_one(str(fn_cube))
+    mol2.cube.data[:] = np.cos(mol2.cube.data)
+    fn_cube1 = str(tmpdir.join("cube1.cube"))
+    fn_cube2 = str(tmpdir.join("cube2.cube"))
+    fn_cube3 = str(tmpdir.join("cube3.cube"))
+    dump_one(mol1, fn_cube1)
+    dump_one(mol2, fn_cube2)
+    linear_combination([fn_cube1, fn_cube2], [2.0, -0.5], fn_cube3, "Combined", nslab=5)
+    mol3 = load_one(fn_cube3)
+    assert mol3.title == "Combined"
+    assert_equal(mol3.atnums, mol1.atnums)
+    assert_allclose(mol3.atcoords, mol1.atcoords, atol=1e-5)
+    assert_allclose(mol3.cube.axes, mol1.cube.axes, atol=1e-5)
+    assert_allclose(mol3.cube.data, 2.0 * mol1.cube.data - 0.5 * mol2.cube.data, rtol=1e-4)
+    # The same result with a generic reduction.
+    result = reduce(
+        [fn_cube1, fn_cube2],
+        lambda acc, slab1, slab2: [*acc, 2.0 * slab1 - 0.5 * slab2],
+        [],
+        nslab=7,
+    )
+    assert_allclose(np.concatenate(result), mol3.cube.data, rtol=1e-4)
+
+
+def test_linear_combination_inconsistent(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol1 = load_one(str(fn_cube))
+    mol2 = load_one(str(fn_cube), stride=2)
+    fn_cube1 = str(tmpdir.join("cube1.cube"))
+    fn_cube2 = str(tmpdir.join("cube2.cube"))
+    dump_one(mol1, fn_cube1)
+    dump_one(mol2, fn_cube2)
+    with pytest.raises(LoadError):
+        linear_combination([fn_cube1, fn_cube2], [1.0, 1.0], str(tmpdir.join("out.cube")))
+
+
+def test_linear_combination_overwrite_input(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube:
+        mol = load_one(str(fn_cube))
+    fn_cube1 = str(tmpdir.join("cube1.cube"))
+    dump_one(mol, fn_cube1)
+    with open(fn_cube1) as f:
+        content = f.read()
+    fn_alias = str(tmpdir.join(".", "cube1.cube"))
+    with pytest.raises(ValueError):
+        linear_combination([fn_cube1, fn_cube1], [1.0, -1.0], fn_alias)
+    # The input file is not modified.
+    with open(fn_cube1) as f:
+        assert f.read() == content
+
+
+def test_iter_cube_slabs_truncated(tmpdir):
+    with (
+        as_file(files("iodata.test.data").joinpath("aelta.cube")) as fn_cube,
+        open(fn_cube) as f,
+    ):
+        lines = f.readlines()
+    fn_truncated = str(tmpdir.join("truncated.cube"))
+    with open(fn_truncated, "w") as f:
+        f.writelines(lines[:-10])
+    with pytest.raises(LoadError):
+        list(iter_cube_slabs(fn_truncated, 4))
+
+
+def test_load_cube_header_mos():
+    with (
+        as_file(files("iodata.test.data").joinpath("water_mos.cube")) as fn_cube,
+        pytest.raises(LoadError),
+    ):
+        load_cube_header(str(fn_cube))
@@ -18,12 +18,16 @@
 # --
 """Test iodata.formats.extxyz module."""
 
+import os
+import shlex
 from importlib.resources import as_file, files
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import load_many, load_one
+from ..formats.extxyz import _split_title
 from ..utils import angstrom
 
 
@@ -79,3 +83,40 @@ def test_load_many_extended():
     assert hasattr(mols[2], "atmasses")
     assert mols[2].atmasses.dtype == float
     assert_allclose(mols[2].atmasses, np.array([29164.39290107, 1837.47159474, 1837.47159474]))
+
+
+@pytest.mark.parametrize(
+    "title",
+    [
+        "",
+        '  energy=-1.5  pbc="T T F"\tis_true ',
+        'Lattice="1 0 0 0 1 0 0 0 1" Properties=species:S:1:pos:R:3 empty=""',
+        "quoted='a \"b\" c' mixed=a\"b c\"d'e f'",
+        'escaped="a \\" b" other=c\\ d',
+    ],
+)
+def test_split_title(title):
+    assert _split_title(title) == shlex.split(title)
+
+
+def test_split_title_unbalanced():
+    with pytest.raises(ValueError):
+        _split_title('energy=1.0 pbc="T T T')
+
+
+def test_load_many_cached_title(tmpdir):
+    fn_xyz = os.path.join(tmpdir, "test.xyz")
+    with open(fn_xyz, "w") as f:
+        for energy in -1.0, -2.0:
+            f.write(
+                f'1\nProperties=species:S:1:pos:R:3 energy={energy} pbc="T T T" label=md\n'
+                "H 0.0 0.0 0.0\n"
+            )
+    mols = list(load_many(fn_xyz, fmt="extxyz"))
+    assert [mol.energy for mol in mols] == [-1.0, -2.0]
+    assert mols[1].extra["label"] == "md"
+    assert_equal(mols[1].extra["pbc"], [True, True, True])
+    # Arrays loaded from identical title values must not be shared.
+    assert mols[0].extra["pbc"] is not mols[1].extra["pbc"]
+    mols[0].extra["pbc"][0] = False
+    assert mols[1].extra["pbc"][0]
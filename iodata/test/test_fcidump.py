@@ -22,9 +22,13 @@ import os
 from importlib.resources import as_file, files
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_one, load_one
+from ..formats import fcidump
+from ..fourindex import PackedFourIndex, SparseFourIndex
+from ..utils import LoadError, LoadWarning, PrepareDumpError
 
 
 def test_load_fcidump_psi4_h2():
@@ -102,3 +106,143 @@ def test_dump_load_fcidimp_consistency_ao(tmpdir):
     assert_equal(mol0.spinpol, mol1.spinpol)
     assert_allclose(mol0.one_ints["core_mo"], mol1.one_ints["core_mo"])
     assert_allclose(mol0.two_ints["two_mo"], mol1.two_ints["two_mo"])
+
+
+def test_load_fcidump_packed():
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol_dense = load_one(str(fn))
+        mol_packed = load_one(str(fn), packed=True)
+    two_mo = mol_packed.two_ints["two_mo"]
+    assert isinstance(two_mo, PackedFourIndex)
+    assert_equal(two_mo.to_dense(), mol_dense.two_ints["two_mo"])
+    assert_allclose(two_mo[6, 1, 5, 0], 0.5335846565304321e-01)
+    assert_allclose(two_mo.chemists[6, 5, 1, 0], 0.5335846565304321e-01)
+
+
+def test_dump_fcidump_packed(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.molpro.h2")) as fn:
+        mol = load_one(str(fn))
+    fn_dense = os.path.join(tmpdir, "dense.fcidump")
+    dump_one(mol, fn_dense)
+    mol.two_ints["two_mo"] = PackedFourIndex.from_dense(mol.two_ints["two_mo"])
+    fn_packed = os.path.join(tmpdir, "packed.fcidump")
+    dump_one(mol, fn_packed)
+    with open(fn_dense) as f_dense, open(fn_packed) as f_packed:
+        assert f_dense.read() == f_packed.read()
+
+
+def test_load_fcidump_chunks(monkeypatch):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol0 = load_one(str(fn))
+        monkeypatch.setattr(fcidump, "FCIDUMP_LOAD_CHUNK", 7)
+        mol1 = load_one(str(fn))
+    assert_equal(mol1.core_energy, mol0.core_energy)
+    assert_equal(mol1.one_ints["core_mo"], mol0.one_ints["core_mo"])
+    assert_equal(mol1.two_ints["two_mo"], mol0.two_ints["two_mo"])
+
+
+def test_load_fcidump_duplicates(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.molpro.h2")) as fn, open(fn) as f:
+        lines = f.readlines()
+    # The last of equivalent records is used. Overwriting a zero is not a duplicate.
+    lines[-1:-1] = [
+        "  0.5 1 1 1 1\n",
+        "  0.0 2 1 2 1\n",
+        "  0.3 2 1 2 1\n",
+        "  0.7 1 2 1 2\n",
+        "  0.1 2 1 0 0\n",
+        "  0.2 1 2 0 0\n",
+    ]
+    fn_tmp = os.path.join(tmpdir, "duplicates.fcidump")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    with pytest.warns(LoadWarning, match="3 nonzero integrals"):
+        mol = load_one(fn_tmp)
+    two_mo = mol.two_ints["two_mo"]
+    assert_equal(two_mo[0, 0, 0, 0], 0.5)
+    assert_equal(two_mo[1, 1, 0, 0], 0.7)
+    assert_equal(two_mo[0, 1, 1, 0], 0.7)
+    assert_equal(mol.one_ints["core_mo"][0, 1], 0.2)
+    assert_equal(mol.one_ints["core_mo"][1, 0], 0.2)
+    assert_allclose(mol.core_energy, 0.7151043364864863e00)
+
+
+def test_load_fcidump_bad_line(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.molpro.h2")) as fn, open(fn) as f:
+        lines = f.readlines()
+    lines[10] = "  0.5 1 1 1\n"
+    fn_tmp = os.path.join(tmpdir, "bad.fcidump")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    with pytest.raises(LoadError, match="Expecting 5 fields") as excinfo:
+        load_one(fn_tmp)
+    assert excinfo.value.lineno == 11
+
+
+def test_dump_fcidump_threshold(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol0 = load_one(str(fn))
+    fn_tmp = os.path.join(tmpdir, "threshold.fcidump")
+    dump_one(mol0, fn_tmp, threshold=1e-2)
+    mol1 = load_one(fn_tmp)
+    for ints in mol0.two_ints["two_mo"], mol0.one_ints["core_mo"]:
+        ints[abs(ints) <= 1e-2] = 0.0
+    assert_equal(mol1.one_ints["core_mo"], mol0.one_ints["core_mo"])
+    assert_equal(mol1.two_ints["two_mo"], mol0.two_ints["two_mo"])
+    assert (abs(mol1.two_ints["two_mo"][mol1.two_ints["two_mo"] != 0]) > 1e-2).all()
+
+
+def test_load_fcidump_orbsym():
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol = load_one(str(fn))
+    assert_equal(mol.extra["orbsym"], [1, 1, 1, 2, 3, 5, 5, 5, 6, 7])
+    assert mol.extra["isym"] == 1
+
+
+def test_dump_fcidump_orbsym(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol0 = load_one(str(fn))
+    # Symmetry-forbidden integrals are not written.
+    mol0.two_ints["two_mo"][3, 0, 0, 0] = 1.0
+    mol0.one_ints["core_mo"][4, 0] = 1.0
+    fn_tmp = os.path.join(tmpdir, "orbsym.fcidump")
+    dump_one(mol0, fn_tmp)
+    mol1 = load_one(fn_tmp)
+    assert_equal(mol1.extra["orbsym"], mol0.extra["orbsym"])
+    assert mol1.extra["isym"] == 1
+    assert mol1.two_ints["two_mo"][3, 0, 0, 0] == 0.0
+    assert mol1.one_ints["core_mo"][4, 0] == 0.0
+    mol1.two_ints["two_mo"][3, 0, 0, 0] = 1.0
+    mol1.one_ints["core_mo"][4, 0] = 1.0
+    assert_equal(mol1.two_ints["two_mo"], mol0.two_ints["two_mo"])
+    assert_equal(mol1.one_ints["core_mo"], mol0.one_ints["core_mo"])
+
+
+def test_dump_fcidump_orbsym_invalid(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol = load_one(str(fn))
+    fn_tmp = os.path.join(tmpdir, "invalid.fcidump")
+    mol.extra["orbsym"] = [1, 2, 3]
+    with pytest.raises(PrepareDumpError):
+        dump_one(mol, fn_tmp)
+    mol.extra["orbsym"] = [0] * 10
+    with pytest.raises(PrepareDumpError):
+        dump_one(mol, fn_tmp)
+
+
+def test_load_dump_fcidump_sparse(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("FCIDUMP.psi4.h2")) as fn:
+        mol_dense = load_one(str(fn))
+        mol_sparse = load_one(str(fn), sparse=True, cutoff=1e-3)
+        with pytest.raises(LoadError):
+            load_one(str(fn), sparse=True, packed=True)
+    two_mo = mol_sparse.two_ints["two_mo"]
+    assert isinstance(two_mo, SparseFourIndex)
+    expected = mol_dense.two_ints["two_mo"]
+    expected[abs(expected) <= 1e-3] = 0.0
+    assert_equal(two_mo.to_dense(), expected)
+    assert len(two_mo.compound) == np.count_nonzero(two_mo.to_packed().data)
+    fn_tmp = os.path.join(tmpdir, "sparse.fcidump")
+    dump_one(mol_sparse, fn_tmp)
+    mol1 = load_one(fn_tmp)
+    assert_equal(mol1.two_ints["two_mo"], expected)
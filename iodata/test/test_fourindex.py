@@ -0,0 +1,150 @@
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Unit tests for iodata.fourindex."""
+
+import numpy as np
+import pytest
+from numpy.testing import assert_equal
+
+from ..fourindex import PackedFourIndex, SparseFourIndex, pair_index, unpair_index
+
+
+def get_random_chemists(nbasis, seed=1):
+    """Return a random four-index array in chemists' notation with 8-fold symmetry."""
+    rng = np.random.default_rng(seed)
+    result = rng.uniform(-1, 1, (nbasis,) * 4)
+    result = result + result.transpose(1, 0, 2, 3)
+    result = result + result.transpose(0, 1, 3, 2)
+    return result + result.transpose(2, 3, 0, 1)
+
+
+def test_pair_index():
+    assert pair_index(0, 0) == 0
+    assert pair_index(1, 0) == 1
+    assert pair_index(0, 1) == 1
+    assert pair_index(2, 1) == 4
+    big, small = unpair_index(np.arange(10))
+    assert_equal(big, [0, 1, 1, 2, 2, 2, 3, 3, 3, 3])
+    assert_equal(small, [0, 0, 1, 0, 1, 2, 0, 1, 2, 3])
+
+
+def test_unpair_index_large():
+    # Large values test the correction of rounding errors in the square root.
+    big = np.array([10**8, 10**8 - 1, 3 * 10**7, 94906265])
+    small = np.array([0, 10**8 - 1, 12345, 94906264])
+    assert_equal(unpair_index(pair_index(big, small)), (big, small))
+
+
+@pytest.mark.parametrize("nbasis", [1, 2, 5])
+def test_dense_roundtrip(nbasis):
+    chemists = get_random_chemists(nbasis)
+    physicists = chemists.transpose(0, 2, 1, 3)
+    packed = PackedFourIndex.from_dense(physicists)
+    npair = nbasis * (nbasis + 1) // 2
+    assert packed.data.shape == (npair * (npair + 1) // 2,)
+    assert packed.shape == (nbasis,) * 4
+    assert_equal(packed.to_dense(), physicists)
+    assert_equal(packed.to_dense("chemists"), chemists)
+    assert_equal(np.asarray(packed), physicists)
+    assert_equal(np.asarray(packed.chemists), chemists)
+    assert_equal(PackedFourIndex.from_dense(chemists, "chemists").data, packed.data)
+
+
+def test_getitem():
+    chemists = get_random_chemists(4)
+    physicists = chemists.transpose(0, 2, 1, 3)
+    packed = PackedFourIndex.from_dense(physicists)
+    assert packed[1, 2, 3, 0] == physicists[1, 2, 3, 0]
+    assert packed.physicists[3, 2, 1, 0] == physicists[3, 2, 1, 0]
+    assert packed.chemists[1, 2, 3, 0] == chemists[1, 2, 3, 0]
+    assert_equal(packed[:, 1, 2, 3], physicists[:, 1, 2, 3])
+    assert_equal(packed[1:3, 0, :, ::2], physicists[1:3, 0, :, ::2])
+    assert_equal(packed[[3, 0], 1, [2, 2, 1], :], physicists[[3, 0], 1][:, [2, 2, 1]])
+    assert_equal(packed.chemists[0, :, 1:, 2], chemists[0, :, 1:, 2])
+    assert_equal(packed.get_block((0, 1, slice(None), 3), "chemists"), chemists[0, 1, :, 3])
+    with pytest.raises(IndexError):
+        packed[0, 1]
+    with pytest.raises(ValueError):
+        packed.get_block((0, 1, 2, 3), "foo")
+
+
+def test_from_elements():
+    packed = PackedFourIndex.from_elements(3, [2, 1], [0, 1], [1, 0], [1, 0], [0.5, 0.25])
+    dense = packed.to_dense()
+    assert_equal(np.count_nonzero(dense), 8 + 4)
+    assert dense[2, 0, 1, 1] == 0.5
+    assert dense[0, 1, 1, 2] == 0.5
+    assert dense[1, 1, 0, 0] == 0.25
+    assert dense[0, 0, 1, 1] == 0.25
+    packed = PackedFourIndex.from_elements(3, [2], [0], [1], [1], [0.5], "chemists")
+    assert packed.chemists[0, 2, 1, 1] == 0.5
+    assert packed[1, 0, 1, 2] == 0.5
+
+
+def test_iter_elements():
+    packed = PackedFourIndex.from_dense(get_random_chemists(4))
+    packed.data[::3] = 0.0
+    chunks = list(packed.iter_elements(threshold=0.0, chunk_size=7))
+    assert len(chunks) == 8
+    i0, i1, i2, i3, values = (np.concatenate(arrays) for arrays in zip(*chunks))
+    assert_equal(values, packed.data[packed.data != 0])
+    assert (i0 >= i1).all()
+    assert (i2 >= i3).all()
+    assert_equal(pair_index(pair_index(i0, i1), pair_index(i2, i3)), np.nonzero(packed.data)[0])
+
+
+def test_validation():
+    with pytest.raises(TypeError):
+        PackedFourIndex(2, np.zeros(5))
+    with pytest.raises(TypeError):
+        PackedFourIndex.from_dense(np.zeros((2, 2, 3, 3)))
+
+
+def test_sparse():
+    chemists = get_random_chemists(4)
+    chemists[abs(chemists) < 1.0] = 0.0
+    physicists = chemists.transpose(0, 2, 1, 3)
+    packed = PackedFourIndex.from_dense(physicists)
+    sparse = SparseFourIndex.from_packed(packed)
+    assert len(sparse.compound) == np.count_nonzero(packed.data)
+    assert sparse.shape == (4, 4, 4, 4)
+    assert_equal(sparse.to_packed().data, packed.data)
+    assert_equal(sparse.to_dense(), physicists)
+    assert_equal(np.asarray(sparse.chemists), chemists)
+    assert sparse[1, 2, 3, 0] == physicists[1, 2, 3, 0]
+    assert sparse.chemists[0, 0, 0, 0] == chemists[0, 0, 0, 0]
+    assert_equal(sparse[1:3, 0, :, ::2], physicists[1:3, 0, :, ::2])
+    assert_equal(sparse.chemists[[3, 0], 1, :, 2], chemists[[3, 0], 1, :, 2])
+    chunks = list(sparse.iter_elements(threshold=2.0, chunk_size=5))
+    values = np.concatenate([chunk[-1] for chunk in chunks])
+    assert_equal(values, packed.data[abs(packed.data) > 2.0])
+    empty = SparseFourIndex(4, [], [])
+    assert empty[0, 1, 2, 3] == 0.0
+    assert_equal(empty.to_dense(), 0.0)
+
+
+def test_sparse_validation():
+    with pytest.raises(ValueError):
+        SparseFourIndex(2, [3, 1], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        SparseFourIndex(2, [1, 1], [1.0, 2.0])
+    with pytest.raises(ValueError):
+        SparseFourIndex(2, [6], [1.0])
+    with pytest.raises(TypeError):
+        SparseFourIndex(2, [1, 2], [1.0])
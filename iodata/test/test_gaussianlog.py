@@ -23,12 +23,13 @@ from importlib.resources import as_file, files
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import load_one
+from ..fourindex import PackedFourIndex
 
 
-def load_log_helper(fn_log):
+def load_log_helper(fn_log, **kwargs):
     """Load a testing Gaussian log file with iodata.load_one."""
     with as_file(files("iodata.test.data").joinpath(fn_log)) as fn:
-        return load_one(fn)
+        return load_one(fn, **kwargs)
 
 
 def test_load_operators_water_sto3g_hf_g03():
@@ -100,3 +101,13 @@ def test_load_operators_water_ccpvdz_pure_hf_g03():
     assert_allclose(er_ao[23, 23, 23, 23], 0.785718708997, atol=eps)
     assert_allclose(er_ao[23, 8, 23, 2], -0.0400337571969, atol=eps)
     assert_allclose(er_ao[15, 2, 12, 0], -0.0000308196281033, atol=eps)
+
+
+def test_load_operators_packed_water_ccpvdz_pure_hf_g03():
+    mol_dense = load_log_helper("water_ccpvdz_pure_hf_g03.log")
+    mol_packed = load_log_helper("water_ccpvdz_pure_hf_g03.log", packed=True)
+    er_ao = mol_packed.two_ints["er_ao"]
+    assert isinstance(er_ao, PackedFourIndex)
+    assert_equal(er_ao.shape, (24, 24, 24, 24))
+    assert_equal(er_ao.to_dense(), mol_dense.two_ints["er_ao"])
+    assert_allclose(er_ao[23, 8, 23, 2], -0.0400337571969, atol=1e-5)
@@ -18,12 +18,16 @@
 # --
 """Test iodata.formats.gromacs module."""
 
+import os
 from importlib.resources import as_file, files
 
+import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import load_many, load_one
-from ..utils import nanometer, picosecond
+from ..formats.gromacs import _helper_unwrap
+from ..utils import LoadError, nanometer, picosecond
 
 
 def test_load_water():
@@ -55,3 +59,51 @@ def test_load_many():
     assert mols[1].extra["time"] == 1.0 * picosecond
     for mol in mols:
         check_water(mol)
+
+
+def test_load_many_shared_topology():
+    with as_file(files("iodata.test.data").joinpath("water2.gro")) as fn_gro:
+        mols0 = list(load_many(str(fn_gro)))
+        mols1 = list(load_many(str(fn_gro), shared_topology=True))
+    assert len(mols1) == 2
+    assert mols1[1].extra["time"] == 1.0 * picosecond
+    for mol0, mol1 in zip(mols0, mols1):
+        check_water(mol1)
+        assert_equal(mol0.atcoords, mol1.atcoords)
+        assert_equal(mol0.extra["velocities"], mol1.extra["velocities"])
+        assert_equal(mol0.cellvecs, mol1.cellvecs)
+        for key, value in mols1[0].atffparams.items():
+            assert mol1.atffparams[key] is value
+
+
+def test_load_many_shared_topology_inconsistent(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("water2.gro")) as fn_gro, open(fn_gro) as f:
+        lines = f.readlines()
+    lines[-2] = lines[-2].replace("HW3", "HW4")
+    fn_tmp = os.path.join(tmpdir, "test.gro")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    assert len(list(load_many(fn_tmp))) == 2
+    with pytest.raises(LoadError, match="atoms differ"):
+        list(load_many(fn_tmp, shared_topology=True))
+
+
+def test_helper_unwrap():
+    assert_equal(_helper_unwrap(np.array([1, 2, 3])), [1, 2, 3])
+    assert_equal(_helper_unwrap(np.array([5, 6, 1, 2])), [5, 6, 1, 2])
+    assert_equal(
+        _helper_unwrap(np.array([99998, 99999, 0, 1, 99999, 0])),
+        [99998, 99999, 100000, 100001, 199999, 200000],
+    )
+
+
+def test_load_wrapped_resnums(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("water.gro")) as fn_gro, open(fn_gro) as f:
+        lines = f.readlines()
+    for i in range(2, 8):
+        lines[i] = ("99999" if i < 5 else "    0") + lines[i][5:]
+    fn_tmp = os.path.join(tmpdir, "test.gro")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    mol = load_one(fn_tmp)
+    assert_equal(mol.atffparams["resnums"], [99999] * 3 + [100000] * 3)
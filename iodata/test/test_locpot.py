@@ -40,3 +40,12 @@ def test_load_locpot_oxygen():
     assert_allclose(d[0, 1, 0] / electronvolt, 0.213732132354e01, 1.0e-10)
     assert_allclose(d[0, 2, 0] / electronvolt, -0.65465465497e01, 1.0e-10)
     assert_allclose(d[0, 2, 1] / electronvolt, -0.546876467887e01, 1.0e-10)
+
+
+def test_load_locpot_oxygen_stride():
+    with as_file(files("iodata.test.data").joinpath("LOCPOT.oxygen")) as fn:
+        mol1 = load_one(str(fn))
+        mol2 = load_one(str(fn), stride=(1, 2, 1))
+    assert_equal(mol2.cube.shape, [1, 2, 2])
+    assert_allclose(mol2.cube.data, mol1.cube.data[:, ::2])
+    assert_allclose(mol2.cube.axes[1], 2 * mol1.cube.axes[1])
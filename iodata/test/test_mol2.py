@@ -148,3 +148,50 @@ def test_load_water_bonds_warning():
     ):
         mol = load_one(fn_mol)
     assert_equal(mol.bonds, [[0, 1, bond2num["un"]], [0, 2, bond2num["un"]]])
+
+
+@pytest.mark.parametrize(("nworker", "chunksize"), [(1, 1), (2, 2)])
+def test_load_many_parallel(tmpdir, nworker, chunksize):
+    fn_tmp = os.path.join(tmpdir, "library.mol2")
+    with open(fn_tmp, "w") as f:
+        for name in ["caffeine.mol2", "water.mol2", "benzene.mol2"] * 2:
+            f.write(files("iodata.test.data").joinpath(name).read_text())
+    with pytest.warns(LoadWarning) as record0:
+        mols0 = list(load_many(fn_tmp))
+    with pytest.warns(LoadWarning) as record1:
+        mols1 = list(load_many(fn_tmp, nworker=nworker, chunksize=chunksize))
+    assert [str(item.message) for item in record0] == [str(item.message) for item in record1]
+    assert len(mols0) == 8
+    assert len(mols1) == 8
+    for mol0, mol1 in zip(mols0, mols1):
+        assert mol0.title == mol1.title
+        assert_equal(mol0.atnums, mol1.atnums)
+        assert_equal(mol0.atcoords, mol1.atcoords)
+        assert_equal(mol0.atcharges["mol2charges"], mol1.atcharges["mol2charges"])
+        assert_equal(mol0.bonds, mol1.bonds)
+
+
+def test_load_many_where(tmpdir):
+    fn_tmp = os.path.join(tmpdir, "library.mol2")
+    with open(fn_tmp, "w") as f:
+        for name in ["caffeine.mol2", "water.mol2", "benzene.mol2"] * 2:
+            f.write(files("iodata.test.data").joinpath(name).read_text())
+    with pytest.warns(LoadWarning):
+        mols0 = list(load_many(fn_tmp))
+    # The skipped records are not parsed, so no warnings are raised for them.
+    assert len(mols0) == 8
+    mols1 = list(
+        load_many(fn_tmp, where=lambda header: header["title"] == "Generated with OpenBabel")
+    )
+    mols2 = list(load_many(fn_tmp, records=range(3, 8, 4)))
+    for mols in mols1, mols2:
+        assert len(mols) == 2
+        for mol0, mol1 in zip([mols0[3], mols0[7]], mols):
+            assert mol0.title == mol1.title
+            assert_equal(mol0.atnums, mol1.atnums)
+            assert_equal(mol0.atcoords, mol1.atcoords)
+            assert_equal(mol0.bonds, mol1.bonds)
+    titles = [
+        mol.title for mol in load_many(fn_tmp, records=range(4, 20), where=lambda h: h["nbond"] > 2)
+    ]
+    assert titles == [mol.title for mol in mols0[4:6] + mols0[7:]]
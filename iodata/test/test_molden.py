@@ -38,6 +38,7 @@ from ..overlap import OVERLAP_CONVENTIONS, compute_overlap
 from ..utils import (
     DumpError,
     LineIterator,
+    LoadError,
     LoadWarning,
     PrepareDumpError,
     PrepareDumpWarning,
@@ -139,6 +140,30 @@ def test_load_molden_nh3_molden_pure():
     assert_allclose(charges, molden_charges, atol=1.0e-3)
 
 
+def test_load_molden_coeffs_fortran_order():
+    with as_file(files("iodata.test.data").joinpath("nh3_molden_pure.molden")) as fn_molden:
+        mol = load_one(str(fn_molden))
+    assert mol.mo.coeffs.shape == (mol.obasis.nbasis, mol.mo.norb)
+    assert mol.mo.coeffs.flags.f_contiguous
+
+
+def test_load_molden_missing_coeff(tmpdir):
+    with (
+        as_file(files("iodata.test.data").joinpath("nh3_molden_pure.molden")) as fn_molden,
+        open(fn_molden) as f,
+    ):
+        lines = f.readlines()
+    # Remove the last coefficient of the second orbital (before the Ene, Spin and Occup lines).
+    iline = [i for i, line in enumerate(lines) if "Occup=" in line][2] - 3
+    assert lines[iline].split()[0] == "50"
+    del lines[iline]
+    fn_tmp = os.path.join(tmpdir, "missing.molden")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    with pytest.raises(LoadError, match="Expecting 50 orbital coefficients, got 49"):
+        load_one(fn_tmp)
+
+
 def test_load_molden_low_nh3_molden_cart():
     with (
         as_file(files("iodata.test.data").joinpath("nh3_molden_cart.molden")) as fn_molden,
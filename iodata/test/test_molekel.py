@@ -29,7 +29,7 @@ from numpy.testing import assert_allclose, assert_equal
 from ..api import dump_one, load_one
 from ..convert import convert_conventions
 from ..overlap import compute_overlap
-from ..utils import LoadWarning, PrepareDumpError, PrepareDumpWarning, angstrom
+from ..utils import LoadError, LoadWarning, PrepareDumpError, PrepareDumpWarning, angstrom
 from .common import (
     check_orthonormal,
     compare_mols,
@@ -185,3 +185,19 @@ def test_load_wrong_spin_mult():
     ):
         data = load_one(fn_molekel)
     assert_allclose(data.spinpol, 3)
+
+
+def test_load_mkl_wrong_number_of_coeffs(tmpdir):
+    with (
+        as_file(files("iodata.test.data").joinpath("h2_sto3g.mkl")) as fn_molekel,
+        open(fn_molekel) as f,
+    ):
+        lines = f.readlines()
+    assert lines[34] == "   0.5458586   -1.2462451\n"
+    lines[34] = "   0.5458586\n"
+    fn_tmp = os.path.join(tmpdir, "wrong.mkl")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    with pytest.raises(LoadError, match="expected 2, got 1") as excinfo:
+        load_one(fn_tmp)
+    assert excinfo.value.lineno == 35
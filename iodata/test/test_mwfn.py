@@ -21,16 +21,18 @@
 from importlib.resources import as_file, files
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import load_one
+from ..formats.mwfn import index_orbitals
 from ..overlap import compute_overlap
 
 
-def load_helper(fn):
+def load_helper(fn, **kwargs):
     """Load a test file with iodata.iodata.load_one."""
     with as_file(files("iodata.test.data").joinpath(fn)) as absfn:
-        return load_one(absfn)
+        return load_one(absfn, **kwargs)
 
 
 def test_load_mwfn_ch3_rohf_g03():
@@ -283,3 +285,46 @@ def test_load_mwfn_he_spdfgh_g03():
     olp_fchk = compute_overlap(mol2.obasis, mol2.atcoords)
     assert_allclose(mol.atcoords, mol2.atcoords, atol=1e-7, rtol=1e-7)
     assert_allclose(olp, olp_fchk, atol=1e-7, rtol=1e-7)
+
+
+@pytest.mark.parametrize(
+    "fn",
+    [
+        "ch3_hf_sto3g_fchk_multiwfn3.7.mwfn",
+        "ch3_rohf_sto3g_g03_fchk_multiwfn3.7.mwfn",
+        "he_spdfgh_virtual_fchk_multiwfn3.7.mwfn",
+    ],
+)
+def test_load_mwfn_orbital_window(fn):
+    mol = load_helper(fn)
+    mol_window = load_helper(fn, orbitals=slice(2, 6))
+    if mol.mo.kind == "restricted":
+        select = np.arange(2, 6)
+    else:
+        select = np.concatenate([np.arange(2, 6), mol.mo.norba + np.arange(2, 6)])
+    assert mol_window.mo.kind == mol.mo.kind
+    assert mol_window.mo.norba == 4
+    assert mol_window.mo.norbb == 4
+    assert_equal(mol_window.mo.coeffs, mol.mo.coeffs[:, select])
+    assert_equal(mol_window.mo.energies, mol.mo.energies[select])
+    assert_equal(mol_window.mo.occs, mol.mo.occs[select])
+    assert_equal(mol_window.extra["mo_sym"], mol.extra["mo_sym"][select])
+    assert_equal(mol_window.atcoords, mol.atcoords)
+    assert mol_window.obasis.nbasis == mol.obasis.nbasis
+
+
+@pytest.mark.parametrize(
+    "fn", ["ch3_hf_sto3g_fchk_multiwfn3.7.mwfn", "he_spdfgh_virtual_fchk_multiwfn3.7.mwfn"]
+)
+def test_index_orbitals(fn):
+    mol = load_helper(fn)
+    with as_file(files("iodata.test.data").joinpath(fn)) as absfn:
+        index = index_orbitals(absfn)
+        assert index.norb == mol.mo.norb
+        assert index.nbasis == mol.obasis.nbasis
+        assert_equal(index.numbers, np.arange(1, index.norb + 1))
+        assert_equal(index.energies, mol.mo.energies)
+        assert_equal(index.occs, mol.mo.occs)
+        assert_equal(index.load_coeffs(slice(None)), mol.mo.coeffs)
+        assert_equal(index.load_coeffs(3), mol.mo.coeffs[:, 3:4])
+        assert_equal(index.load_coeffs([5, 1]), mol.mo.coeffs[:, [5, 1]])
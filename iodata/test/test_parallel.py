@@ -0,0 +1,52 @@
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Test iodata.parallel module."""
+
+import re
+
+import pytest
+
+from ..parallel import iter_record_chunks
+
+RECORD_END = re.compile(rb"^END\r?\n", re.MULTILINE)
+
+
+@pytest.mark.parametrize("newline", ["\n", "\r\n"])
+def test_iter_record_chunks(tmpdir, newline):
+    fn = tmpdir.join("records.txt")
+    lines = ["a", "END", "b", "b", "END", "c", "END", "d"]
+    with open(fn, "w", newline="") as f:
+        f.write(newline.join(lines))
+    data = fn.read_binary()
+    chunks = list(iter_record_chunks(str(fn), RECORD_END, 2))
+    assert [(data[begin:end].decode(), lineno) for begin, end, lineno in chunks] == [
+        (newline.join(["a", "END", "b", "b", "END", ""]), 0),
+        (newline.join(["c", "END", "d"]), 5),
+    ]
+    chunks = list(iter_record_chunks(str(fn), RECORD_END, 1))
+    assert [lineno for _begin, _end, lineno in chunks] == [0, 2, 5, 7]
+    assert chunks[-1][1] == len(data)
+
+
+def test_iter_record_chunks_empty(tmpdir):
+    fn = tmpdir.join("empty.txt")
+    fn.write("")
+    assert list(iter_record_chunks(str(fn), RECORD_END, 1)) == []
+    with pytest.raises(ValueError):
+        list(iter_record_chunks(str(fn), RECORD_END, 0))
@@ -26,7 +26,15 @@ import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_many, dump_one, load_many, load_one
-from ..utils import LoadWarning, angstrom
+from ..formats.pdb import (
+    _format_pdb_conect_lines,
+    _parse_pdb_atom_line,
+    _parse_pdb_atom_lines,
+    _parse_pdb_conect_line,
+    decode_hybrid36,
+    encode_hybrid36,
+)
+from ..utils import LineIterator, LoadError, LoadWarning, angstrom
 
 
 @pytest.mark.parametrize("case", ["single", "single_model"])
@@ -245,3 +253,169 @@ def test_indomethacin_dimer():
     assert mol.atnums[14] == 17
     assert mol.atnums[15] == 6
     assert mol.atnums[55] == 17
+
+
+def read_atom_lines(fn_base):
+    with as_file(files("iodata.test.data").joinpath(fn_base)) as fn_pdb, open(fn_pdb) as f:
+        return [line for line in f if line.startswith(("ATOM", "HETATM"))]
+
+
+@pytest.mark.parametrize(
+    "fn_base", ["water_single.pdb", "ch5plus.pdb", "2bcw.pdb", "water_trajectory.pdb"]
+)
+def test_parse_pdb_atom_lines(fn_base):
+    lines = read_atom_lines(fn_base)
+    fast = _parse_pdb_atom_lines(lines)
+    with (
+        as_file(files("iodata.test.data").joinpath(fn_base)) as fn_pdb,
+        LineIterator(fn_pdb) as lit,
+    ):
+        slow = [
+            np.array(column) for column in zip(*(_parse_pdb_atom_line(line, lit) for line in lines))
+        ]
+    assert len(fast) == len(slow)
+    for fast_column, slow_column in zip(fast, slow):
+        assert fast_column.dtype == slow_column.dtype
+        assert_equal(fast_column, slow_column)
+
+
+def test_parse_pdb_atom_lines_fallback():
+    # Without element symbols, the fast path gives up.
+    with pytest.raises(ValueError):
+        _parse_pdb_atom_lines(read_atom_lines("2luv.pdb"))
+    lines = read_atom_lines("water_single.pdb")
+    with pytest.raises(ValueError):
+        _parse_pdb_atom_lines([*lines, "ATOM      4  O   HOH     1    garbage"])
+    with pytest.raises(ValueError):
+        _parse_pdb_atom_lines([line[:76] + "Xx" + line[78:] for line in lines])
+
+
+def test_load_many_shared_topology():
+    with as_file(files("iodata.test.data").joinpath("water_trajectory.pdb")) as fn_pdb:
+        mols0 = list(load_many(str(fn_pdb)))
+        mols1 = list(load_many(str(fn_pdb), shared_topology=True))
+    assert len(mols1) == 5
+    for mol0, mol1 in zip(mols0, mols1):
+        assert mol0.title == mol1.title
+        assert_equal(mol0.atnums, mol1.atnums)
+        assert_equal(mol0.atcoords, mol1.atcoords)
+        assert mol0.extra.keys() == mol1.extra.keys()
+        for key, value in mol0.extra.items():
+            assert_equal(mol1.extra[key], value)
+        for key, value in mols1[0].atffparams.items():
+            assert_equal(mol0.atffparams[key], value)
+            assert mol1.atffparams[key] is value
+        assert mol1.atnums is mols1[0].atnums
+        assert mol1.bonds is mols1[0].bonds
+
+
+def test_load_many_shared_topology_inconsistent(tmpdir):
+    with (
+        as_file(files("iodata.test.data").joinpath("water_trajectory.pdb")) as fn_pdb,
+        open(fn_pdb) as f,
+    ):
+        lines = f.readlines()
+    iline = [i for i, line in enumerate(lines) if line.startswith("HETATM")][-1]
+    lines[iline] = lines[iline][:17] + "WAT" + lines[iline][20:]
+    fn_tmp = os.path.join(tmpdir, "test.pdb")
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    assert len(list(load_many(fn_tmp))) == 5
+    with pytest.raises(LoadError, match="atoms differ"):
+        list(load_many(fn_tmp, shared_topology=True))
+    # Only the element column of one atom differs.
+    lines[iline] = lines[iline][:17] + "HOH" + lines[iline][20:]
+    assert lines[iline][76:78] == " H"
+    lines[iline] = lines[iline][:76] + " F" + lines[iline][78:]
+    with open(fn_tmp, "w") as f:
+        f.writelines(lines)
+    mols = list(load_many(fn_tmp))
+    assert len(mols) == 5
+    assert_equal(mols[-1].atnums, [8, 1, 9])
+    with pytest.raises(LoadError, match="atoms differ"):
+        list(load_many(fn_tmp, shared_topology=True))
+
+
+@pytest.mark.parametrize(
+    ("width", "value", "field"),
+    [
+        (4, -999, "-999"),
+        (4, 9999, "9999"),
+        (4, 10000, "A000"),
+        (4, 1223055, "ZZZZ"),
+        (4, 1223056, "a000"),
+        (4, 2436111, "zzzz"),
+        (5, 1, "    1"),
+        (5, 99999, "99999"),
+        (5, 100000, "A0000"),
+        (5, 43770015, "ZZZZZ"),
+        (5, 43770016, "a0000"),
+        (5, 87440031, "zzzzz"),
+    ],
+)
+def test_hybrid36(width, value, field):
+    assert encode_hybrid36(width, [value])[0] == field
+    assert decode_hybrid36(width, [field])[0] == value
+    assert decode_hybrid36(width, [field.encode("ascii")])[0] == value
+
+
+def test_hybrid36_array():
+    values = np.arange(-999, 2436112, 7)
+    fields = encode_hybrid36(4, values)
+    assert fields.dtype == "U4"
+    assert_equal(decode_hybrid36(4, fields), values)
+    assert_equal(decode_hybrid36(4, fields[:100].reshape(10, 10)), values[:100].reshape(10, 10))
+
+
+@pytest.mark.parametrize("value", [-1000, 2436112])
+def test_encode_hybrid36_range(value):
+    with pytest.raises(ValueError):
+        encode_hybrid36(4, [value])
+
+
+@pytest.mark.parametrize("field", ["A0a0", "a0A0", "A-00", "    ", "1A00"])
+def test_decode_hybrid36_invalid(field):
+    with pytest.raises(ValueError):
+        decode_hybrid36(4, [field])
+
+
+def test_parse_pdb_conect_line_hybrid36():
+    line = "CONECTA0000   12A0001A0002     \n"
+    assert [(int(iatom0), int(iatom1)) for iatom0, iatom1 in _parse_pdb_conect_line(line)] == [
+        (99999, 100000),
+        (99999, 100001),
+    ]
+
+
+def test_load_dump_hybrid36(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("water_single.pdb")) as fn_pdb:
+        mol0 = load_one(str(fn_pdb))
+    mol0.atffparams["resnums"] = np.array([9999, 10000, 2436111])
+    fn_tmp = os.path.join(tmpdir, "test.pdb")
+    dump_one(mol0, fn_tmp)
+    with open(fn_tmp) as f:
+        assert [line[22:26] for line in f if line.startswith("ATOM")] == ["9999", "A000", "zzzz"]
+    mol1 = load_one(fn_tmp)
+    assert_equal(mol1.atffparams["resnums"], mol0.atffparams["resnums"])
+    assert_equal(mol1.atnums, mol0.atnums)
+
+
+def test_format_pdb_conect_lines():
+    bonds = np.array([[0, i, 1] for i in range(1, 9)] + [[2, 1, 1], [9, 0, 1]])
+    serials = encode_hybrid36(5, np.arange(1, 11))
+    lines = _format_pdb_conect_lines(bonds, serials).splitlines()
+    assert lines == [
+        "CONECT    1    2    3    4    5",
+        "CONECT    1    6    7    8    9",
+        "CONECT    1   10",
+        "CONECT    2    1    3",
+        "CONECT    3    1    2",
+        "CONECT    4    1",
+        "CONECT    5    1",
+        "CONECT    6    1",
+        "CONECT    7    1",
+        "CONECT    8    1",
+        "CONECT    9    1",
+        "CONECT   10    1",
+    ]
+    assert _format_pdb_conect_lines(bonds[:0], serials) == ""
@@ -130,3 +130,65 @@ def test_v2000_check():
         pytest.raises(LoadError),
     ):
         load_one(fn_sdf)
+
+
+def write_library(tmpdir, names) -> str:
+    """Concatenate test files into a library with many records."""
+    fn_tmp = os.path.join(tmpdir, "library.sdf")
+    with open(fn_tmp, "w") as f:
+        for name in names:
+            f.write(files("iodata.test.data").joinpath(name).read_text())
+    return fn_tmp
+
+
+@pytest.mark.parametrize(("nworker", "chunksize"), [(1, 1), (2, 3), (3, 100)])
+def test_load_many_parallel(tmpdir, nworker, chunksize):
+    fn_tmp = write_library(tmpdir, ["example.sdf", "formamide.sdf"] * 4)
+    mols0 = list(load_many(fn_tmp))
+    mols1 = list(load_many(fn_tmp, nworker=nworker, chunksize=chunksize))
+    assert len(mols0) == 12
+    assert len(mols1) == 12
+    for mol0, mol1 in zip(mols0, mols1):
+        assert mol0.title == mol1.title
+        assert_equal(mol0.atnums, mol1.atnums)
+        assert_equal(mol0.atcoords, mol1.atcoords)
+        assert_equal(mol0.bonds, mol1.bonds)
+
+
+def test_load_many_parallel_error(tmpdir):
+    fn_tmp = write_library(tmpdir, ["example.sdf", "formamide.sdf", "molv3000.sdf"])
+    with pytest.raises(LoadError) as excinfo0:
+        list(load_many(fn_tmp))
+    titles = []
+    with pytest.raises(LoadError) as excinfo1:
+        titles.extend(mol.title for mol in load_many(fn_tmp, nworker=2, chunksize=2))
+    assert str(excinfo0.value) == str(excinfo1.value)
+    assert excinfo1.value.lineno == excinfo0.value.lineno
+    assert len(titles) == 3
+
+
+def test_load_many_where(tmpdir):
+    fn_tmp = write_library(tmpdir, ["example.sdf", "formamide.sdf"] * 4)
+    mols0 = list(load_many(fn_tmp))
+    assert len(mols0) == 12
+    mols1 = list(load_many(fn_tmp, where=lambda header: header["natom"] == 21))
+    assert [mol.title for mol in mols1] == ["24978481"] * 4
+    mols2 = list(load_many(fn_tmp, where=lambda header: header["index"] in (2, 5)))
+    mols3 = list(load_many(fn_tmp, records=range(2, 7, 3)))
+    for mols in mols2, mols3:
+        assert len(mols) == 2
+        for mol0, mol1 in zip([mols0[2], mols0[5]], mols):
+            assert mol0.title == mol1.title
+            assert_equal(mol0.atnums, mol1.atnums)
+            assert_equal(mol0.atcoords, mol1.atcoords)
+            assert_equal(mol0.bonds, mol1.bonds)
+    with pytest.raises(LoadError, match="Uncaught"):
+        list(load_many(fn_tmp, records=range(3), nworker=2))
+
+
+def test_load_many_records_stop(tmpdir):
+    # Reading stops after the last selected record, before the unsupported one.
+    fn_tmp = write_library(tmpdir, ["example.sdf", "formamide.sdf", "molv3000.sdf"])
+    assert [mol.title for mol in load_many(fn_tmp, records=range(1, 2))] == ["24978481"]
+    with pytest.raises(LoadError, match="V2000"):
+        list(load_many(fn_tmp, where=lambda header: False))
@@ -18,9 +18,23 @@
 # --
 """Unit tests for iodata.utils."""
 
+import pickle
+
+import numpy as np
 import pytest
+from numpy.testing import assert_allclose, assert_equal
 
-from ..utils import amu, strtobool
+from ..utils import (
+    LineIterator,
+    LoadError,
+    amu,
+    format_lines,
+    format_table,
+    parse_fortran_fields,
+    read_fortran_fields,
+    set_four_index_element,
+    strtobool,
+)
 
 
 def test_amu():
@@ -33,3 +47,88 @@ def test_strtobool():
     assert strtobool("y") is True
     with pytest.raises(ValueError):
         strtobool("whatever")
+
+
+def test_set_four_index_element_arrays():
+    rng = np.random.default_rng(1)
+    indices = rng.integers(0, 5, size=(4, 30))
+    # Elements related by symmetry are permutations of each other. Keep only one
+    # of them, such that the result does not depend on the order of assignment.
+    indices = np.unique(np.sort(indices, axis=0), axis=1)
+    values = rng.uniform(0, 1, indices.shape[1])
+    expected = np.zeros((5, 5, 5, 5))
+    for i0, i1, i2, i3, value in zip(*indices, values):
+        set_four_index_element(expected, i0, i1, i2, i3, value)
+    result = np.zeros((5, 5, 5, 5))
+    set_four_index_element(result, *indices, values)
+    assert_equal(result, expected)
+
+
+def test_line_iterator_next_lines(tmpdir):
+    fn = tmpdir.join("lines.txt")
+    fn.write("".join(f"line {i}\n" for i in range(10)))
+    with LineIterator(str(fn)) as lit:
+        assert next(lit) == "line 0\n"
+        lit.back("other\n")
+        assert lit.next_lines(3) == ["other\n", "line 1\n", "line 2\n"]
+        assert lit.lineno == 3
+        assert lit.next_lines(4) == [f"line {i}\n" for i in range(3, 7)]
+        assert lit.lineno == 7
+        assert next(lit) == "line 7\n"
+        assert lit.next_lines(5) == ["line 8\n", "line 9\n"]
+        assert lit.lineno == 10
+        assert lit.next_lines(5) == []
+
+
+def test_load_error_pickle():
+    error = pickle.loads(pickle.dumps(LoadError("Something went wrong.", "test.txt", 5)))
+    assert isinstance(error, LoadError)
+    assert error.filename == "test.txt"
+    assert error.lineno == 5
+    assert str(error) == "Something went wrong. (test.txt:5)"
+
+
+def test_format_lines():
+    values = np.array([1.5, -2.25, 3.0, 4.125, 5.0])
+    assert format_lines("%6.2f", values, 2) == "  1.50 -2.25\n  3.00  4.12\n  5.00\n"
+    assert format_lines("%d", [1, 2, 3], 3, prefix="A% ", sep=",") == "A% 1,2,3\n"
+    assert format_lines("%.1f", values[:2], 1, prefix=["a ", "b "]) == "a 1.5\nb -2.2\n"
+    assert format_lines("%d", [], 5, prefix="X") == ""
+    with pytest.raises(ValueError):
+        format_lines("%d", [1, 2, 3], 2, prefix=["a"])
+
+
+def test_format_table():
+    columns = [np.array(["H", "He"]), np.array([1.5, -2.25]), [3, 4]]
+    assert format_table("%-3s%6.2f %d", columns) == "H    1.50 3\nHe  -2.25 4\n"
+    assert format_table("%s %d", [[], []]) == ""
+    with pytest.raises(ValueError):
+        format_table("%d %d", [[1, 2], [3]])
+
+
+def test_parse_fortran_fields():
+    lines = ["A  -0.1234D+01-0.5678D+00\n", "B   0.1000E+01\n", "C\n"]
+    assert_allclose(parse_fortran_fields(lines, 11, skip=3), [-1.234, -0.5678, 1.0])
+    values = parse_fortran_fields(["  1 12123", "  4"], 3, int)
+    assert values.dtype == int
+    assert_equal(values, [1, 12, 123, 4])
+    assert parse_fortran_fields([], 5).shape == (0,)
+    with pytest.raises(ValueError):
+        parse_fortran_fields(["  1.0  x.0"], 5)
+
+
+def test_read_fortran_fields(tmpdir):
+    fn = tmpdir.join("fields.txt")
+    fn.write("X 1 2 3\nX 4 5\nX 6\nY 7\n")
+    with LineIterator(str(fn)) as lit:
+        values = read_fortran_fields(lit, 6, 2, 3, int, "X", 1)
+        assert_equal(values, [1, 2, 3, 4, 5, 6])
+        assert lit.lineno == 3
+        with pytest.raises(LoadError, match="start with 'X'"):
+            read_fortran_fields(lit, 1, 2, 3, int, "X", 1)
+    with LineIterator(str(fn)) as lit, pytest.raises(LoadError, match="Expecting 2 fields, got 3"):
+        read_fortran_fields(lit, 2, 2, 3, int, skip=1)
+    with LineIterator(str(fn)) as lit, pytest.raises(LoadError, match="File ended"):
+        read_fortran_fields(lit, 10, 2, 3, int, skip=1)
+    with LineIterator(str(fn)) as lit, pytest.raises(LoadError, match="Could not convert"):
+        read_fortran_fields(lit, 3, 3, 3, int)
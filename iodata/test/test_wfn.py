@@ -305,6 +305,44 @@ def test_load_one_cah110_hf_sto3g_g09():
     check_orthonormal(mol.mo.coeffsb, olp, 1e-5)
 
 
+@pytest.mark.parametrize(
+    ("fn_wfn", "nbasis"),
+    [
+        ("h2o_sto3g.wfn", 7),
+        ("h2o_sto3g_decontracted.wfn", 21),
+        ("lih_cation_cisd.wfn", 11),
+        ("o2_uhf_virtual.wfn", 46),
+        ("cah110_hf_sto3g_g09.wfn", 123),
+    ],
+)
+def test_load_wfn_reconstruct_contractions(fn_wfn, nbasis):
+    with as_file(files("iodata.test.data").joinpath(fn_wfn)) as file_wfn:
+        mol0 = load_one(str(file_wfn))
+        mol1 = load_one(str(file_wfn), reconstruct_contractions=True)
+    assert mol1.obasis.nbasis == nbasis
+    assert mol1.mo.coeffs.shape == (nbasis, mol0.mo.norb)
+    assert_equal(mol1.mo.occs, mol0.mo.occs)
+    assert_equal(mol1.mo.energies, mol0.mo.energies)
+    # The contracted basis functions are normalized.
+    olp1 = compute_overlap(mol1.obasis, mol1.atcoords)
+    assert_allclose(np.diag(olp1), 1.0, rtol=0.0, atol=1.0e-12)
+    check_orthonormal(mol1.mo.coeffsa, olp1, 1.0e-5)
+    # The orbitals are the same as in the primitive basis.
+    olp01 = compute_overlap(mol0.obasis, mol0.atcoords, mol1.obasis, mol1.atcoords)
+    overlaps = np.einsum("ij,ik,kj->j", mol0.mo.coeffs, olp01, mol1.mo.coeffs)
+    assert_allclose(overlaps, 1.0, rtol=0.0, atol=1.0e-5)
+
+
+def test_load_wfn_reconstruct_contractions_h2o_sto3g():
+    with as_file(files("iodata.test.data").joinpath("h2o_sto3g.wfn")) as file_wfn:
+        mol = load_one(str(file_wfn), reconstruct_contractions=True)
+    assert [shell.icenter for shell in mol.obasis.shells] == [0, 0, 0, 1, 2]
+    assert [shell.angmoms[0] for shell in mol.obasis.shells] == [0, 0, 1, 0, 0]
+    assert [shell.nexp for shell in mol.obasis.shells] == [3] * 5
+    charges = compute_mulliken_charges(mol)
+    assert_allclose(charges, [-0.330532, 0.165266, 0.165266], rtol=0.0, atol=1.0e-5)
+
+
 def check_load_dump_consistency(fn: str, tmpdir: str, atol: float = 1.0e-6, allow_changes=False):
     """Check if data is preserved after dumping and loading a WFN file.
 
@@ -370,6 +408,19 @@ def test_load_dump_consistency_from_molden_nh3(tmpdir):
     check_load_dump_consistency("nh3_molden_cart.molden", tmpdir)
 
 
+def test_dump_one_cartesian_conventions(tmpdir):
+    # The fchk file uses a different order of the Cartesian g functions.
+    with as_file(files("iodata.test.data").joinpath("he_spdfgh_virtual.fchk")) as file_fchk:
+        mol1 = load_one(str(file_fchk))
+    fn_tmp = os.path.join(tmpdir, "foo.wfn")
+    dump_one(mol1, fn_tmp)
+    mol2 = load_one(fn_tmp)
+    # The orbitals must be the same, irrespective of the basis set conventions.
+    olp = compute_overlap(mol1.obasis, mol1.atcoords, mol2.obasis, mol2.atcoords)
+    overlaps = np.einsum("ij,ik,kj->j", mol1.mo.coeffs, olp, mol2.mo.coeffs)
+    assert_allclose(overlaps, 1.0, rtol=0.0, atol=1.0e-6)
+
+
 def test_dump_one_pure_functions(tmpdir):
     with pytest.raises(PrepareDumpError):
         check_load_dump_consistency("water_ccpvdz_pure_hf_g03.fchk", tmpdir)
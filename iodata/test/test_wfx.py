@@ -188,6 +188,19 @@ def test_dump_one_from_molden_neon(tmpdir):
     )
 
 
+def test_dump_one_cartesian_conventions(tmpdir):
+    # The fchk file uses a different order of the Cartesian g functions.
+    with as_file(files("iodata.test.data").joinpath("he_spdfgh_virtual.fchk")) as file_fchk:
+        mol1 = load_one(str(file_fchk))
+    fn_tmp = os.path.join(tmpdir, "foo.wfx")
+    dump_one(mol1, fn_tmp)
+    mol2 = load_one(fn_tmp)
+    # The orbitals must be the same, irrespective of the basis set conventions.
+    olp = compute_overlap(mol1.obasis, mol1.atcoords, mol2.obasis, mol2.atcoords)
+    overlaps = np.einsum("ij,ik,kj->j", mol1.mo.coeffs, olp, mol2.mo.coeffs)
+    assert_allclose(overlaps, 1.0, rtol=0.0, atol=1.0e-6)
+
+
 def test_dump_one_pure_functions(tmpdir):
     # li2.mkl contains pure functions
     with pytest.raises(PrepareDumpError):
@@ -586,6 +599,41 @@ def test_load_data_wfx_water():
     assert_allclose(data["mo_coeffs"][1, 3], -4.27845789719456e-001)
 
 
+def test_load_data_wfx_chunks(monkeypatch):
+    data1 = helper_load_data_wfx("lih_cation_uhf.wfx")
+    monkeypatch.setattr("iodata.formats.wfx.WFX_CHUNK", 3)
+    data2 = helper_load_data_wfx("lih_cation_uhf.wfx")
+    assert data1.keys() == data2.keys()
+    for key, value in data1.items():
+        if isinstance(value, np.ndarray):
+            assert_equal(data2[key], value)
+        else:
+            assert data2[key] == value
+
+
+def test_load_data_wfx_tags():
+    with (
+        as_file(files("iodata.test.data").joinpath("water_sto3g_hf.wfx")) as fn_wfx,
+        LineIterator(fn_wfx) as lit,
+    ):
+        data = load_data_wfx(lit, tags=[])
+    assert "atgradient" not in data
+    assert "model_name" not in data
+    assert data["mo_coeffs"].shape == (21, 5)
+    assert_equal(data["mo_numbers"], [1, 2, 3, 4, 5])
+
+
+def test_parse_wfx_dtypes():
+    with (
+        as_file(files("iodata.test.data").joinpath("water_sto3g_hf.wfx")) as fn_wfx,
+        LineIterator(fn_wfx) as lit,
+    ):
+        data = parse_wfx(lit, dtypes={"<Primitive Centers>": int}, tags=["<Primitive Centers>"])
+    assert_equal(data["<Primitive Centers>"], [1] * 15 + [2] * 3 + [3] * 3)
+    assert data["<Title>"] is None
+    assert "<MO Numbers>" not in data
+
+
 def test_parse_wfx_missing_tag_h2o():
     """Check that missing sections result in an exception."""
     with (
@@ -686,6 +734,22 @@ def test_load_one_h2o():
     check_orthonormal(mol.mo.coeffsa, olp, 1.0e-5)
 
 
+def test_load_one_h2o_reconstruct_contractions():
+    with as_file(files("iodata.test.data").joinpath("water_sto3g_hf.wfx")) as file_wfx:
+        mol0 = load_one(str(file_wfx))
+        mol1 = load_one(str(file_wfx), reconstruct_contractions=True)
+    assert mol1.obasis.nbasis == 7
+    assert mol1.mo.coeffs.shape == (7, 5)
+    assert [shell.icenter for shell in mol1.obasis.shells] == [0, 0, 0, 1, 2]
+    assert_allclose(mol1.obasis.shells[0].exponents, [130.709321, 23.8088661, 6.44360831])
+    assert_allclose(mol1.obasis.shells[2].exponents, [5.03315132, 1.16959612, 0.38038896])
+    olp1 = compute_overlap(mol1.obasis, mol1.atcoords)
+    check_orthonormal(mol1.mo.coeffsa, olp1, 1.0e-5)
+    olp01 = compute_overlap(mol0.obasis, mol0.atcoords, mol1.obasis, mol1.atcoords)
+    overlaps = np.einsum("ij,ik,kj->j", mol0.mo.coeffs, olp01, mol1.mo.coeffs)
+    assert_allclose(overlaps, 1.0, rtol=0.0, atol=1.0e-5)
+
+
 def test_load_one_h2():
     """Test load_one with h2 ub3lyp_ccpvtz WFX input."""
     with as_file(files("iodata.test.data").joinpath("h2_ub3lyp_ccpvtz.wfx")) as file_wfx:
@@ -20,13 +20,15 @@
 
 import os
 from importlib.resources import as_file, files
+from itertools import islice
 
 import numpy as np
+import pytest
 from numpy.testing import assert_allclose, assert_equal
 
 from ..api import dump_many, dump_one, load_many, load_one
-from ..formats.xyz import DEFAULT_ATOM_COLUMNS
-from ..utils import angstrom
+from ..formats.xyz import DEFAULT_ATOM_COLUMNS, _split_atom_lines
+from ..utils import LoadError, angstrom
 
 
 def test_load_water_number():
@@ -182,3 +184,104 @@ def test_load_dump_many_consistency(tmpdir):
         assert mol0.title == mol1.title
         assert_equal(mol0.atnums, mol1.atnums)
         assert_allclose(mol0.atcoords, mol1.atcoords, atol=1.0e-5)
+
+
+@pytest.mark.parametrize("atom_columns", [None, DEFAULT_ATOM_COLUMNS])
+def test_load_many_shared_topology(atom_columns):
+    with as_file(files("iodata.test.data").joinpath("water_trajectory.xyz")) as fn_xyz:
+        mols0 = list(load_many(str(fn_xyz), atom_columns=atom_columns))
+        mols1 = list(load_many(str(fn_xyz), atom_columns=atom_columns, shared_topology=True))
+    assert len(mols1) == 5
+    for mol0, mol1 in zip(mols0, mols1):
+        assert mol0.title == mol1.title
+        assert_equal(mol0.atnums, mol1.atnums)
+        assert_equal(mol0.atcoords, mol1.atcoords)
+        assert mol1.atnums is mols1[0].atnums
+
+
+def test_load_many_shared_topology_inconsistent(tmpdir):
+    with as_file(files("iodata.test.data").joinpath("dataset_blanklines.xyz")) as fn_xyz:
+        assert len(list(load_many(str(fn_xyz)))) == 3
+        with pytest.raises(LoadError, match="atoms differ"):
+            list(load_many(str(fn_xyz), shared_topology=True))
+    # Same number of atoms, different elements, with lower case symbols in between.
+    fn_tmp = os.path.join(tmpdir, "test.xyz")
+    with open(fn_tmp, "w") as f:
+        f.write("2\na\nH 0 0 0\nO 1 0 0\n2\nb\nh 0 0 0\no 1 0 0\n2\nc\nO 0 0 0\nH 1 0 0\n")
+    mols = list(islice(load_many(fn_tmp, shared_topology=True), 2))
+    assert_equal(mols[1].atnums, [1, 8])
+    with pytest.raises(LoadError, match="atoms differ"):
+        list(load_many(fn_tmp, shared_topology=True))
+
+
+def test_split_atom_lines():
+    words = _split_atom_lines(["H 1 2\n", " O 3 4 x\n"], 3)
+    assert words.dtype == object
+    assert words.tolist() == [["H", "1", "2"], ["O", "3", "4"]]
+    assert _split_atom_lines(["H 1 2 x\n", "O 3\n"], 3) is None
+    assert _split_atom_lines([], 3).shape == (0, 3)
+
+
+@pytest.mark.parametrize("shared_topology", [False, True])
+def test_load_many_zero_atoms(tmpdir, shared_topology):
+    fn_tmp = os.path.join(tmpdir, "test.xyz")
+    with open(fn_tmp, "w") as f:
+        f.write("0\nempty\n0\nempty\n3\nwater\nO 0 0 0\nH 0 0 1\nH 0 1 0\n")
+    if shared_topology:
+        # All frames must have the same atoms, so only the empty frames are loaded.
+        with pytest.raises(LoadError, match="atoms differ"):
+            list(load_many(fn_tmp, shared_topology=True))
+        mols = list(islice(load_many(fn_tmp, shared_topology=True), 2))
+        assert [mol.natom for mol in mols] == [0, 0]
+    else:
+        mols = list(load_many(fn_tmp))
+        assert [mol.natom for mol in mols] == [0, 0, 3]
+        assert mols[0].atcoords.shape == (0, 3)
+        assert_equal(mols[2].atnums, [8, 1, 1])
+
+
+@pytest.mark.parametrize("extra", ["", " 1.5 text"])
+def test_load_bulk_generic(tmpdir, extra):
+    # Custom columns with the same meaning as the defaults are converted word by word.
+    generic_atom_columns = [
+        (*column[:4], (lambda word, loadword=column[4]: loadword(word)), column[5])
+        for column in DEFAULT_ATOM_COLUMNS
+    ]
+    fn_xyz = os.path.join(tmpdir, "test.xyz")
+    with open(fn_xyz, "w") as f:
+        f.write("3\ntitle\nO 0.0 0.1 0.2\nh 1.0 1.1 1.2" + extra + "\n1 2.0 2.1 2.2\n")
+    mol0 = load_one(fn_xyz)
+    mol1 = load_one(fn_xyz, atom_columns=generic_atom_columns)
+    assert_equal(mol0.atnums, [8, 1, 1])
+    assert_equal(mol0.atnums, mol1.atnums)
+    assert_equal(mol0.atcoords, mol1.atcoords)
+    assert_allclose(mol0.atcoords[2], [2.0 * angstrom, 2.1 * angstrom, 2.2 * angstrom])
+
+
+def test_load_many_where():
+    with as_file(files("iodata.test.data").joinpath("dataset_blanklines.xyz")) as fn_xyz:
+        mols = list(load_many(str(fn_xyz), where=lambda header: header["natom"] != 1))
+        assert [mol.title for mol in mols] == ["H2O molecule", "CH4 molecule"]
+        mols = list(load_many(str(fn_xyz), where=lambda header: header["title"].startswith("N")))
+        assert [mol.title for mol in mols] == ["N atom"]
+        mols = list(load_many(str(fn_xyz), records=range(1, 10)))
+        assert [mol.title for mol in mols] == ["N atom", "CH4 molecule"]
+
+
+@pytest.mark.parametrize("shared_topology", [False, True])
+def test_load_many_records(shared_topology):
+    with as_file(files("iodata.test.data").joinpath("water_trajectory.xyz")) as fn_xyz:
+        mols0 = list(load_many(str(fn_xyz)))
+        mols1 = list(
+            load_many(
+                str(fn_xyz),
+                shared_topology=shared_topology,
+                records=range(1, 5, 2),
+                where=lambda header: header["index"] != 1,
+            )
+        )
+        assert len(mols1) == 1
+        assert mols1[0].title == "Frame 3"
+        assert_equal(mols1[0].atcoords, mols0[3].atcoords)
+        with pytest.raises(LoadError, match="Uncaught"):
+            list(load_many(str(fn_xyz), records=range(4, 0, -1)))
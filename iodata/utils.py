@@ -18,9 +18,11 @@
 # --
 """Utility functions module."""
 
+from collections.abc import Iterator
 from io import TextIOBase
+from itertools import islice
 from pathlib import Path
-from typing import Optional, TextIO, Union
+from typing import Callable, Optional, TextIO, Union
 
 import attrs
 import numpy as np
@@ -28,7 +30,7 @@ import scipy.constants as spc
 from numpy.typing import NDArray
 from scipy.linalg import eigh
 
-from .attrutils import validate_shape
+from .attrutils import convert_array_to, validate_shape
 
 __all__ = (
     "LineIterator",
@@ -46,6 +48,12 @@ __all__ = (
     "derive_naturals",
     "check_dm",
     "strtobool",
+    "format_lines",
+    "format_table",
+    "parse_fortran_fields",
+    "read_fortran_fields",
+    "RECORD_KWDOCS",
+    "iter_selected_records",
 )
 
 
@@ -113,6 +121,30 @@ class LineIterator:
         self.stack.append(line)
         self.lineno -= 1
 
+    def next_lines(self, nline: int) -> list[str]:
+        """Return the next lines and increase the lineno attribute accordingly.
+
+        This is equivalent to ``list(itertools.islice(self, nline))``,
+        but it is faster for large blocks of lines.
+
+        Parameters
+        ----------
+        nline
+            The number of lines to read.
+
+        Returns
+        -------
+        A list with (at most) ``nline`` lines.
+        Fewer lines are returned when the end of the file is reached.
+
+        """
+        lines = []
+        while self.stack and len(lines) < nline:
+            lines.append(self.stack.pop())
+        lines.extend(islice(self.fh, nline - len(lines)))
+        self.lineno += len(lines)
+        return lines
+
 
 def _interpret_file_lineno(
     file: Optional[Union[str, Path, LineIterator, TextIO]] = None, lineno: Optional[int] = None
@@ -189,6 +221,10 @@ class BaseFileError(Exception):
     def __str__(self):
         return _format_file_message(super().__str__(), self.filename, self.lineno)
 
+    def __reduce__(self):
+        # Keep the filename and line number when pickled, e.g. by a process pool.
+        return self.__class__, (self.args[0], self.filename, self.lineno)
+
 
 class FileFormatError(BaseFileError):
     """Raise when a file or input format cannot be identified."""
@@ -235,6 +271,25 @@ class PrepareDumpWarning(BaseFileWarning):
     """Raised when an IOData object is made compatible with a format before dumping to a file."""
 
 
+def validate_cube_data(cube, attribute, value):
+    """Validate the shape of the cube data, which depends on the mo_indices attribute.
+
+    Parameters
+    ----------
+    cube
+        The Cube instance being validated.
+    attribute
+        Attribute instance being changed.
+    value
+        The new value.
+
+    """
+    if cube.mo_indices is None:
+        validate_shape(None, None, None)(cube, attribute, value)
+    else:
+        validate_shape(("mo_indices", 0), None, None, None)(cube, attribute, value)
+
+
 @attrs.define
 class Cube:
     """The volumetric data from a cube (or similar) file."""
@@ -248,17 +303,35 @@ class Cube:
     along the first, second and third axis, respectively.
     """
 
-    data: NDArray[float] = attrs.field(validator=validate_shape(None, None, None))
-    """A (K, L, M) array of data on a uniform grid"""
+    data: NDArray[float] = attrs.field(validator=validate_cube_data)
+    """
+    A (K, L, M) array of data on a uniform grid.
+    When ``mo_indices`` is set, a (nmo, K, L, M) array with one grid for each orbital.
+    """
+
+    mo_indices: Optional[NDArray[int]] = attrs.field(
+        default=None,
+        converter=convert_array_to(int),
+        validator=attrs.validators.optional(validate_shape(None)),
+    )
+    """
+    The (one-based) indices of the orbitals in a multi-orbital cube file. (optional)
+    When set, the first axis of ``data`` runs over these orbitals.
+    """
 
     @property
     def shape(self):
         """Shape of the rectangular grid."""
-        return self.data.shape
+        return self.data.shape[-3:]
 
 
 def set_four_index_element(
-    four_index_object: NDArray[float], i0: int, i1: int, i2: int, i3: int, value: float
+    four_index_object: NDArray[float],
+    i0: Union[int, NDArray[int]],
+    i1: Union[int, NDArray[int]],
+    i2: Union[int, NDArray[int]],
+    i3: Union[int, NDArray[int]],
+    value: Union[float, NDArray[float]],
 ):
     """Assign values to a four index object, account for 8-fold index symmetry.
 
@@ -270,9 +343,11 @@ def set_four_index_element(
         The four-index object. It will be written to.
         shape=(nbasis, nbasis, nbasis, nbasis), dtype=float
     i0, i1, i2, i3
-        The indices to assign to.
+        The indices to assign to. These may also be integer arrays with equal
+        shapes, to assign many elements at once.
     value
-        The value of the matrix element to store.
+        The value of the matrix element to store, or an array with one value
+        for each element when the indices are arrays.
 
     """
     four_index_object[i0, i1, i2, i3] = value
@@ -403,3 +478,261 @@ def strtobool(value: str) -> bool:
     if result is None:
         raise ValueError(f"'{value}' cannot be converted to boolean")
     return result
+
+
+def format_lines(
+    spec: str,
+    values,
+    nper_line: int,
+    prefix: Union[str, list[str]] = "",
+    sep: str = "",
+) -> str:
+    """Format a sequence of values with a fixed number of fields per line.
+
+    All values are formatted with a single %-style format operation, which is
+    considerably faster than formatting (and writing) the values one by one.
+
+    Parameters
+    ----------
+    spec
+        The %-style format specification of a single field, e.g. ``"%16.8E"``.
+    values
+        A one-dimensional array or sequence of values.
+    nper_line
+        The (maximum) number of fields on one line. The last line may contain fewer.
+    prefix
+        The text at the beginning of every line. When a list is given, it should
+        contain one prefix for every line.
+    sep
+        The text in between two fields on the same line.
+
+    Returns
+    -------
+    The formatted lines, each terminated by a newline character.
+    An empty string is returned when there are no values.
+
+    """
+    values = values.tolist() if isinstance(values, np.ndarray) else list(values)
+    nline = -(-len(values) // nper_line)
+    if isinstance(prefix, str):
+        prefix = [prefix] * nline
+    elif len(prefix) != nline:
+        raise ValueError(f"Expecting {nline} line prefixes, got {len(prefix)}.")
+    nrest = len(values) - (nline - 1) * nper_line
+    fields = [sep.join([spec] * nper_line)] * (nline - 1)
+    if nline > 0:
+        fields.append(sep.join([spec] * nrest))
+    fmt = "".join(
+        f"{line_prefix.replace('%', '%%')}{line_fields}\n"
+        for line_prefix, line_fields in zip(prefix, fields)
+    )
+    return fmt % tuple(values)
+
+
+def format_table(spec: str, columns: list) -> str:
+    """Format columns of values with one line per row.
+
+    All rows are formatted with a single %-style format operation, which is
+    considerably faster than formatting (and writing) the rows one by one.
+
+    Parameters
+    ----------
+    spec
+        The %-style format specification of a single line, without the newline
+        character, e.g. ``"%-2s %15.10f %15.10f %15.10f"``.
+    columns
+        A list of one-dimensional arrays or sequences with equal lengths,
+        one for each field in ``spec``.
+
+    Returns
+    -------
+    The formatted lines, each terminated by a newline character.
+    An empty string is returned when there are no rows.
+
+    """
+    columns = [
+        column.tolist() if isinstance(column, np.ndarray) else list(column) for column in columns
+    ]
+    nrow = len(columns[0])
+    values = [None] * (nrow * len(columns))
+    for icolumn, column in enumerate(columns):
+        if len(column) != nrow:
+            raise ValueError(f"Expecting {nrow} values in every column, got {len(column)}.")
+        values[icolumn :: len(columns)] = column
+    return (spec + "\n") * nrow % tuple(values)
+
+
+_FORTRAN_EXPONENTS = str.maketrans("Dd", "Ee")
+
+
+def parse_fortran_fields(lines: list[str], width: int, dtype=float, skip: int = 0) -> NDArray:
+    """Convert fixed-width Fortran fields on a block of lines into an array.
+
+    All fields are converted at once, which is considerably faster than
+    slicing and converting the fields one by one.
+
+    Parameters
+    ----------
+    lines
+        The lines with the fields.
+    width
+        The width of one field. Fields do not need whitespace in between them,
+        e.g. ``-0.1234D+01-0.5678D+00`` contains two fields with width 11.
+    dtype
+        The data type of the fields. For floating point numbers, exponents
+        marked with ``D`` are also supported.
+    skip
+        The number of characters to skip at the beginning of each line.
+
+    Returns
+    -------
+    A one-dimensional array with the fields of all lines. A line may end with an
+    incomplete field, e.g. when trailing whitespace is missing.
+
+    Raises
+    ------
+    ValueError
+        When a field cannot be converted.
+
+    """
+    contents = [line.rstrip()[skip:] for line in lines]
+    text = "".join(content.ljust(-(-len(content) // width) * width) for content in contents)
+    if np.dtype(dtype).kind == "f":
+        text = text.translate(_FORTRAN_EXPONENTS)
+    return np.frombuffer(text.encode("ascii"), dtype=f"S{width}").astype(dtype)
+
+
+def read_fortran_fields(
+    lit: LineIterator,
+    nfield: int,
+    width: int,
+    nper_line: int,
+    dtype=float,
+    start: str = "",
+    skip: int = 0,
+) -> NDArray:
+    """Read a known number of fixed-width Fortran fields from consecutive lines.
+
+    The lines are read in blocks, whose size is derived from the remaining
+    number of fields, and each block is converted with
+    :py:func:`parse_fortran_fields`.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the lines from.
+    nfield
+        The number of fields to read.
+    width
+        The width of one field.
+    nper_line
+        The maximum number of fields on one line, as in the Fortran format.
+        Lines may contain fewer fields.
+    dtype
+        The data type of the fields.
+    start
+        Every line should start with this prefix.
+    skip
+        The number of characters to skip at the beginning of each line.
+
+    Returns
+    -------
+    A one-dimensional array with ``nfield`` elements.
+
+    """
+    blocks = []
+    nread = 0
+    while nread < nfield:
+        lines = lit.next_lines(-(-(nfield - nread) // nper_line))
+        if len(lines) == 0:
+            raise LoadError("File ended before all data was read.", lit)
+        for iline, line in enumerate(lines):
+            if not line.startswith(start):
+                raise LoadError(
+                    f"Expecting line to start with '{start}'.",
+                    lit,
+                    lit.lineno - len(lines) + iline + 1,
+                )
+        try:
+            block = parse_fortran_fields(lines, width, dtype, skip)
+        except ValueError as exc:
+            raise LoadError(f"Could not convert fields with width {width}.", lit) from exc
+        blocks.append(block)
+        nread += len(block)
+    if nread != nfield:
+        raise LoadError(f"Expecting {nfield} fields, got {nread}.", lit)
+    return blocks[0] if len(blocks) == 1 else np.concatenate(blocks)
+
+
+RECORD_KWDOCS = {
+    "where": "A function to select records from their header lines, before the atoms and bonds "
+    "are parsed. It is called with a dictionary with the position of the record in the file "
+    "(``index``, starting from zero), the ``title`` and the number of atoms (``natom``). "
+    "If the format specifies the number of bonds in the header, it is also included "
+    "(``nbond``). Records for which the function does not return True are skipped "
+    "without parsing them.",
+    "records": "A ``range`` of record indexes to load, e.g. ``range(100, 200)``. "
+    "Records outside the range are skipped without parsing them, and the file is "
+    "not read beyond the last record in the range.",
+}
+
+
+def iter_selected_records(
+    lit: LineIterator,
+    read_header: Callable[[LineIterator], Optional[tuple[dict, list[str]]]],
+    load_record: Callable[[LineIterator], dict],
+    skip_record: Callable[[LineIterator, dict], None],
+    where: Optional[Callable[[dict], bool]] = None,
+    records: Optional[range] = None,
+) -> Iterator[dict]:
+    """Load a subset of the records in a file, selected from their header lines.
+
+    Parameters
+    ----------
+    lit
+        The line iterator to read the records from.
+    read_header
+        A function that reads the header lines of the next record and returns a
+        dictionary with header fields and a list with the lines read.
+        It returns None when there are no more records.
+    load_record
+        A function that loads the next record, including the header lines.
+        These are put back into the line iterator before this function is called.
+    skip_record
+        A function that skips the remaining lines of a record, after its header lines.
+        It is called with the dictionary returned by ``read_header``.
+    where
+        A function that is called with the header fields. Only records for which it
+        returns True are loaded. The header fields are extended with the index of the
+        record in the file.
+    records
+        A range of record indexes to load, with a positive step.
+
+    Yields
+    ------
+    data
+        A dictionary with the data loaded from each selected record.
+
+    """
+    if records is not None:
+        if not isinstance(records, range):
+            raise TypeError("The records argument must be a range.")
+        if records.step < 1:
+            raise ValueError("The records argument must have a positive step.")
+    index = 0
+    try:
+        while records is None or index < records.stop:
+            header_lines = read_header(lit)
+            if header_lines is None:
+                return
+            header, lines = header_lines
+            header["index"] = index
+            if (records is None or index in records) and (where is None or where(header)):
+                for line in reversed(lines):
+                    lit.back(line)
+                yield load_record(lit)
+            else:
+                skip_record(lit, header)
+            index += 1
+    except StopIteration:
+        return
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Measure the time needed to dump and load FCIDUMP files of increasing size.
+
+The two-electron integrals are random numbers in packed storage, of which a fraction
+(set with ``--density``) is nonzero. Files are written to a temporary directory.
+"""
+
+import argparse
+import os
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from iodata import IOData, dump_one, load_one
+from iodata.fourindex import PackedFourIndex
+
+
+def main():
+    """Run the benchmark and print a table with timings."""
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+    print(f"{'norb':>6s} {'nonzero':>12s} {'size [MB]':>10s} {'dump [s]':>9s} {'load [s]':>9s}")
+    with TemporaryDirectory() as dn:
+        for norb in args.norbs:
+            data = get_random_iodata(norb, args.density, rng)
+            fn = os.path.join(dn, f"bench{norb}.fcidump")
+            start = time.perf_counter()
+            dump_one(data, fn, fmt="fcidump")
+            time_dump = time.perf_counter() - start
+            start = time.perf_counter()
+            load_one(fn, fmt="fcidump", packed=True)
+            time_load = time.perf_counter() - start
+            nonzero = np.count_nonzero(data.two_ints["two_mo"].data)
+            size = os.path.getsize(fn) / 1e6
+            os.remove(fn)
+            print(f"{norb:6d} {nonzero:12d} {size:10.1f} {time_dump:9.2f} {time_load:9.2f}")
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(prog="benchmark_fcidump")
+    parser.add_argument(
+        "norbs", help="Numbers of orbitals", type=int, nargs="*", default=[50, 100, 150]
+    )
+    parser.add_argument(
+        "--density",
+        help="Fraction of nonzero two-electron integrals [default=%(default)s]",
+        type=float,
+        default=0.1,
+    )
+    parser.add_argument("--seed", help="Random seed [default=%(default)s]", type=int, default=1)
+    return parser.parse_args()
+
+
+def get_random_iodata(norb: int, density: float, rng: np.random.Generator) -> IOData:
+    """Create an IOData object with random integrals."""
+    one_mo = rng.uniform(-1, 1, (norb, norb))
+    two_mo = PackedFourIndex.zeros(norb)
+    mask = rng.uniform(0, 1, two_mo.data.shape) < density
+    two_mo.data[mask] = rng.uniform(-1, 1, mask.sum())
+    return IOData(
+        nelec=norb,
+        spinpol=0,
+        one_ints={"core_mo": one_mo + one_mo.T},
+        two_ints={"two_mo": two_mo},
+        core_energy=1.0,
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+# IODATA is an input and output module for quantum chemistry.
+# Copyright (C) 2011-2019 The IODATA Development Team
+#
+# This file is part of IODATA.
+#
+# IODATA is free software; you can redistribute it and/or
+# modify it under the terms of the GNU General Public License
+# as published by the Free Software Foundation; either version 3
+# of the License, or (at your option) any later version.
+#
+# IODATA is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program; if not, see <http://www.gnu.org/licenses/>
+# --
+"""Measure the write throughput of the Molden, Molekel, WFN and WFX formats.
+
+The molecule is a chain of hydrogen atoms, each with a number of uncontracted s and p
+shells, and the orbitals have random coefficients. Files are written to a temporary
+directory.
+"""
+
+import argparse
+import os
+import time
+from tempfile import TemporaryDirectory
+
+import numpy as np
+
+from iodata import IOData, dump_one
+from iodata.basis import MolecularBasis, Shell
+from iodata.orbitals import MolecularOrbitals
+
+FORMATS = ["molden", "molekel", "wfn", "wfx"]
+
+
+def main():
+    """Run the benchmark and print a table with timings."""
+    args = parse_args()
+    rng = np.random.default_rng(args.seed)
+    print(f"{'format':>8s} {'natom':>6s} {'nbasis':>7s}", end=" ")
+    print(f"{'size [MB]':>10s} {'dump [s]':>9s} {'MB/s':>7s}")
+    with TemporaryDirectory() as dn:
+        for natom in args.natoms:
+            data = get_random_iodata(natom, rng)
+            for fmt in args.formats:
+                fn = os.path.join(dn, f"bench{natom}.{fmt}")
+                start = time.perf_counter()
+                dump_one(data, fn, fmt=fmt, allow_changes=True)
+                time_dump = time.perf_counter() - start
+                size = os.path.getsize(fn) / 1e6
+                os.remove(fn)
+                print(
+                    f"{fmt:>8s} {natom:6d} {data.obasis.nbasis:7d} {size:10.1f} "
+                    f"{time_dump:9.2f} {size / time_dump:7.1f}"
+                )
+
+
+def parse_args():
+    """Parse command-line arguments."""
+    parser = argparse.ArgumentParser(prog="benchmark_writers")
+    parser.add_argument(
+        "natoms", help="Numbers of hydrogen atoms", type=int, nargs="*", default=[20, 50, 100]
+    )
+    parser.add_argument(
+        "--formats",
+        help="Formats to benchmark [default=%(default)s]",
+        nargs="+",
+        choices=FORMATS,
+        default=FORMATS,
+    )
+    parser.add_argument("--seed", help="Random seed [default=%(default)s]", type=int, default=1)
+    return parser.parse_args()
+
+
+def get_random_iodata(natom: int, rng: np.random.Generator) -> IOData:
+    """Create an IOData object with random restricted orbitals."""
+    shells = []
+    for iatom in range(natom):
+        for angmom in 0, 0, 0, 1, 1:
+            exponent = rng.uniform(0.1, 10.0)
+            shells.append(Shell(iatom, [angmom], ["c"], [exponent], [[1.0]]))
+    obasis = MolecularBasis(shells, {(0, "c"): ["1"], (1, "c"): ["x", "y", "z"]}, "L2")
+    nbasis = obasis.nbasis
+    mo = MolecularOrbitals(
+        "restricted",
+        nbasis,
+        nbasis,
+        np.where(np.arange(nbasis) < natom // 2, 2.0, 0.0),
+        rng.uniform(-1, 1, (nbasis, nbasis)),
+        np.sort(rng.uniform(-1, 1, nbasis)),
+    )
+    return IOData(
+        atnums=np.ones(natom, dtype=int),
+        atcoords=np.column_stack([np.arange(natom) * 1.4, np.zeros(natom), np.zeros(natom)]),
+        obasis=obasis,
+        mo=mo,
+    )
+
+
+if __name__ == "__main__":
+    main()